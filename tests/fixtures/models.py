@@ -128,6 +128,24 @@ class AmbiguousChoiceType:
     )
 
 
+@dataclass
+class FactoryType:
+    values: list[str] = field(
+        default_factory=lambda: ["a", "b"],
+        metadata={"type": "Element"},
+    )
+    choice: list[object] = field(
+        default_factory=list,
+        metadata={
+            "type": "Elements",
+            "choices": (
+                {"name": "c", "type": int},
+                {"name": "d", "type": list[str], "default_factory": lambda: ["e"]},
+            ),
+        },
+    )
+
+
 @dataclass
 class UnionType:
     element: Union[TypeA, TypeB, TypeC, TypeD]
@@ -1,6 +1,11 @@
+import io
+import mmap
 import sys
+from dataclasses import dataclass, field
+from unittest import mock
 from unittest.case import TestCase
 from xml import etree
+from xml.etree.ElementTree import QName
 
 import pytest
 
@@ -8,9 +13,47 @@ from tests import fixtures_dir
 from tests.fixtures.books import BookForm, Books
 from tests.fixtures.books.fixtures import books, events, events_default_ns
 from xsdata.exceptions import ParserError, XmlHandlerError
+from xsdata.formats.dataclass.parsers import FeedParser
 from xsdata.formats.dataclass.parsers.bases import RecordParser
 from xsdata.formats.dataclass.parsers.handlers import XmlEventHandler
 from xsdata.formats.dataclass.parsers.handlers.native import get_base_url
+from xsdata.formats.dataclass.parsers.nodes import SkipNode
+
+SKIPPED_XML = (
+    '<brk:books xmlns:brk="urn:books">'
+    '<unknown><a xmlns:x="urn:x"><x:b>1</x:b><a/></a><a/></unknown>'
+    "<book><author>Hightower, Kim</author>"
+    "<extra><title>Nope</title><extra/></extra>"
+    "<title>The First Book</title><genre>Fiction</genre><price>44.95</price>"
+    "<pub_date>2000-10-01</pub_date><review>Nothing.</review></book>"
+    "</brk:books>"
+)
+
+REDECLARED_XML = (
+    '<root xmlns:p="urn:good">'
+    '<unknown><x xmlns:p="urn:bad"/></unknown>'
+    "<b>p:foo</b>"
+    "</root>"
+)
+
+
+@dataclass
+class QNameRoot:
+    class Meta:
+        name = "root"
+
+    b: QName = field(metadata={"type": "Element"})
+
+
+STYLESHEET = b'<?xml-stylesheet type="text/xsl" href="books.xsl"?><!-- books -->'
+
+NAMESPACES_XML = (
+    '<brk:books xmlns:brk="urn:books">'
+    '<book xmlns:brk="urn:books"><author>Kim</author></book>'
+    '<book xmlns:x="urn:x"><author>Kim</author></book>'
+    '<book xmlns:x="urn:x"><author>Kim</author></book>'
+    "</brk:books>"
+)
 
 
 class XmlEventHandlerTests(TestCase):
@@ -29,6 +72,112 @@ class XmlEventHandlerTests(TestCase):
         self.assertEqual({None: "urn:books"}, self.parser.ns_map)
         self.assertEqual(events_default_ns, self.parser.events)
 
+    def test_parse_with_buffer(self) -> None:
+        path = fixtures_dir.joinpath("books/books.xml")
+        source = memoryview(path.read_bytes())
+        self.assertEqual(books, self.parser.from_bytes(source, Books))
+        self.assertEqual(events, self.parser.events)
+
+        with mock.patch.object(XmlEventHandler, "chunk_size", 64):
+            self.assertEqual(books, self.parser.from_bytes(source, Books))
+
+        with (
+            path.open("rb") as fp,
+            mmap.mmap(fp.fileno(), 0, access=mmap.ACCESS_READ) as mm,
+        ):
+            self.assertEqual(books, self.parser.from_bytes(mm, Books))
+            self.assertEqual(books.book, list(self.parser.iterparse(mm, Books)))
+
+    def test_iterparse(self) -> None:
+        path = fixtures_dir.joinpath("books/books.xml")
+
+        result = list(self.parser.iterparse(str(path), Books))
+        self.assertEqual(books.book, result)
+        # The root element is never bound
+        self.assertEqual(events[:-1], self.parser.events)
+
+    def test_parse_with_skipped_subtrees(self) -> None:
+        self.parser.config.fail_on_unknown_properties = False
+        result = self.parser.from_string(SKIPPED_XML, Books)
+
+        self.assertEqual(["The First Book"], [book.title for book in result.book])
+        self.assertEqual({"brk": "urn:books", "x": "urn:x"}, self.parser.ns_map)
+
+        qnames = [args[0] for event, *args in self.parser.events if event != "start-ns"]
+        skipped = ["unknown", "unknown", "extra", "extra"]
+        self.assertEqual(skipped, [qname for qname in qnames if qname in skipped])
+        self.assertNotIn("a", qnames)
+        self.assertNotIn("{urn:x}b", qnames)
+
+    def test_parse_with_prefix_redeclared_in_skipped_subtree(self) -> None:
+        self.parser.config.fail_on_unknown_properties = False
+        result = self.parser.from_string(REDECLARED_XML, QNameRoot)
+        self.assertEqual(QName("urn:good", "foo"), result.b)
+
+        source = io.BytesIO(REDECLARED_XML.encode())
+        result = list(self.parser.iterparse(source, QNameRoot, "b"))
+        self.assertEqual([QName("urn:good", "foo")], result)
+
+    def test_parse_with_shared_namespaces(self) -> None:
+        self.parser.config.projection = {"book.author"}
+        self.parser.from_string(NAMESPACES_XML, Books)
+
+        root, *ns_maps = [x[3] for x in self.parser.events if x[0] == "start"]
+        self.assertEqual({"brk": "urn:books"}, root)
+        self.assertEqual([True, True], [x is root for x in ns_maps[:2]])
+
+        merged = ns_maps[2]
+        self.assertEqual({"brk": "urn:books", "x": "urn:x"}, merged)
+        self.assertEqual([True, True, True], [x is merged for x in ns_maps[3:]])
+
+    def test_iterparse_with_skipped_subtrees(self) -> None:
+        self.parser.config.fail_on_unknown_properties = False
+        result = self.parser.iterparse(io.BytesIO(SKIPPED_XML.encode()), Books, "book")
+
+        self.assertEqual(["The First Book"], [book.title for book in result])
+        self.assertEqual({"brk": "urn:books", "x": "urn:x"}, self.parser.ns_map)
+        self.assertNotIn("a", [args[0] for event, *args in self.parser.events])
+
+    def test_feed_with_skipped_subtrees(self) -> None:
+        self.parser.config.fail_on_unknown_properties = False
+        feed = FeedParser(self.parser, Books, "book.title")
+        data = SKIPPED_XML.encode()
+
+        result = []
+        for start in range(0, len(data), 5):
+            result.extend(feed.feed(data[start : start + 5]))
+            if feed.handler.skip_depth > 1:
+                self.assertIsInstance(feed.handler.queue[-1], SkipNode)
+
+        result.extend(feed.close())
+        self.assertEqual(["The First Book"], result)
+        self.assertEqual(0, feed.handler.skip_depth)
+        self.assertNotIn("a", [args[0] for event, *args in self.parser.events])
+
+    def test_iterparse_with_root_siblings(self) -> None:
+        path = fixtures_dir.joinpath("books/books.xml")
+        data = path.read_bytes().replace(b"?>", b"?>" + STYLESHEET, 1)
+
+        result = self.parser.iterparse(io.BytesIO(data), Books, "book")
+        self.assertEqual(books.book, list(result))
+
+        feed = FeedParser(self.parser, Books, "book")
+        result = []
+        for start in range(0, len(data), 64):
+            result.extend(feed.feed(data[start : start + 64]))
+
+        result.extend(feed.close())
+        self.assertEqual(books.book, result)
+
+    def test_iterparse_with_unhandled_event(self) -> None:
+        handler = XmlEventHandler(clazz=Books, parser=self.parser)
+        handler.create_context = lambda x: [("reverse", "")]
+
+        with self.assertRaises(XmlHandlerError) as cm:
+            list(handler.iterparse("foo"))
+
+        self.assertEqual("Unhandled event: `reverse`.", str(cm.exception))
+
     def test_parse_context_with_unhandled_event(self) -> None:
         context = [("reverse", None)]
         handler = XmlEventHandler(parser=self.parser, clazz=Books)
@@ -72,6 +221,16 @@ class XmlEventHandlerTests(TestCase):
         self.assertEqual(books, self.parser.from_string(path.read_text(), Books))
         self.assertEqual(ns_map, self.parser.ns_map)
 
+    @pytest.mark.skipif(sys.platform == "win32", reason="urljoin + path sep")
+    def test_parse_with_xinclude_from_buffer(self) -> None:
+        path = fixtures_dir.joinpath("books/books-xinclude.xml")
+
+        self.parser.config.process_xinclude = True
+        self.parser.config.base_url = str(path)
+        source = memoryview(path.read_bytes())
+        self.assertEqual(books, self.parser.from_bytes(source, Books))
+        self.assertEqual({"ns0": "urn:books"}, self.parser.ns_map)
+
     def test_get_base_url(self) -> None:
         self.assertIsNone(get_base_url(None, None))
         self.assertIsNone(get_base_url(None, None))
@@ -1,8 +1,9 @@
 import copy
 from dataclasses import make_dataclass
+from typing import Any
 from unittest import mock
 
-from tests.fixtures.books import Books
+from tests.fixtures.books import BookForm, Books
 from tests.fixtures.models import (
     AttrsType,
     ExtendedListType,
@@ -23,13 +24,21 @@ from xsdata.formats.dataclass.models.generics import AnyElement, DerivedElement
 from xsdata.formats.dataclass.parsers.config import ParserConfig
 from xsdata.formats.dataclass.parsers.nodes import (
     ElementNode,
+    LazyNode,
     PrimitiveNode,
     SkipNode,
     StandardNode,
     UnionNode,
     WildcardNode,
 )
-from xsdata.formats.dataclass.parsers.utils import ParserUtils
+from xsdata.formats.dataclass.parsers.nodes.element import BindingPlan
+from xsdata.formats.dataclass.parsers.nodes.lazy import LazyValue
+from xsdata.formats.dataclass.parsers.nodes.skip import SKIP_NODE
+from xsdata.formats.dataclass.parsers.utils import (
+    ParserUtils,
+    PendingCollection,
+    Projection,
+)
 from xsdata.models.enums import DataType, Namespace, QNames
 from xsdata.utils.testing import FactoryTestCase, XmlMetaFactory, XmlVarFactory
 
@@ -64,6 +73,39 @@ class ElementNodeTests(FactoryTestCase):
         self.assertTrue(node.bind("foo", "1", "tail", objects))
         self.assertListEqual(objects, [("foo", expected), (None, "tail")])
 
+    def test_bind_with_projection(self) -> None:
+        node = ElementNode(
+            position=0,
+            meta=self.context.build(SequentialType),
+            context=self.context,
+            config=ParserConfig(),
+            attrs={"a": "b", "a0": "0", "a2": "1 2"},
+            ns_map={"ns0": "xsdata"},
+            projection=Projection.compile(frozenset(("a0", "x2"))),
+        )
+
+        objects = [("x2", 2), ("x2", 3)]
+        expected = SequentialType(a0="0", x2=[2, 3])
+
+        self.assertTrue(node.bind("foo", "1", None, objects))
+        self.assertEqual([("foo", expected)], objects)
+
+        node.meta = self.context.build(BookForm)
+        node.attrs = {}
+        node.projection = Projection.compile(frozenset(("title",)))
+        objects = [("title", "Foo")]
+        expected = BookForm(
+            author=None,
+            title="Foo",
+            genre=None,
+            price=None,
+            pub_date=None,
+            review=None,
+        )
+
+        self.assertTrue(node.bind("book", None, None, objects))
+        self.assertEqual([("book", expected)], objects)
+
     def test_bind_nil_value(self) -> None:
         self.node.xsi_nil = True
         objects = []
@@ -374,6 +416,81 @@ class ElementNodeTests(FactoryTestCase):
         self.assertEqual(ns_map, actual.ns_map)
         self.assertEqual(position, actual.position)
 
+    def test_child_with_projection(self) -> None:
+        node = ElementNode(
+            position=0,
+            meta=self.context.build(Books),
+            context=self.context,
+            config=ParserConfig(),
+            attrs={},
+            ns_map={},
+            projection=Projection.compile(frozenset(("book.title",))),
+        )
+
+        actual = node.child("book", {}, {}, 0)
+        self.assertIsInstance(actual, ElementNode)
+        self.assertEqual({"title": None}, actual.projection.fields)
+
+        self.assertIsInstance(actual.child("author", {}, {}, 0), SkipNode)
+        self.assertIsInstance(actual.child("title", {}, {}, 0), PrimitiveNode)
+
+        with self.assertRaises(ParserError):
+            actual.child("foo", {}, {}, 0)
+
+    def test_child_with_projection_and_wildcard(self) -> None:
+        meta = self.context.build(ExtendedType)
+        node = ElementNode(
+            position=0,
+            meta=meta,
+            context=self.context,
+            config=ParserConfig(),
+            attrs={},
+            ns_map={},
+            projection=Projection.compile(frozenset(("wildcard",))),
+        )
+
+        self.assertIs(SKIP_NODE, node.child("a", {}, {}, 0))
+        self.assertEqual({meta.elements["a"][0].index}, node.assigned)
+        self.assertIsInstance(node.child("foo", {}, {}, 0), WildcardNode)
+
+    def test_child_with_lazy_fields(self) -> None:
+        node = ElementNode(
+            position=0,
+            meta=self.context.build(Books),
+            context=self.context,
+            config=ParserConfig(),
+            attrs={},
+            ns_map={},
+            projection=Projection.compile(frozenset(("book.title",))),
+            lazy=Projection.compile(frozenset(("book",))),
+        )
+
+        actual = node.child("book", {}, {}, 0)
+        self.assertIsInstance(actual, LazyNode)
+        self.assertEqual({"title": None}, actual.node.projection.fields)
+
+        node.lazy = Projection.compile(frozenset(("book.pub_date",)))
+        actual = node.child("book", {}, {}, 0)
+        self.assertIsInstance(actual, ElementNode)
+        self.assertEqual({"pub_date": None}, actual.lazy.fields)
+
+    def test_lazy_class(self) -> None:
+        value = LazyValue(self.node, [])
+        self.node.meta = self.context.build(SequentialType)
+        self.node.lazy = Projection.compile(frozenset(("x0", "x1", "x2", "x3")))
+
+        params = {"x0": 1, "x1": [1, 2]}
+        self.assertIs(SequentialType, self.node.lazy_class(params))
+
+        params = {"x0": value, "x1": [1, 2], "x2": [value], "x3": (value,)}
+        clazz = self.node.lazy_class(params)
+        names = [name for name, value in vars(clazz).items() if name[0] == "x"]
+        self.assertTrue(issubclass(clazz, SequentialType))
+        self.assertEqual(["x0", "x2", "x3"], sorted(names))
+        self.assertEqual([1, 2], params["x1"])
+        self.assertIsInstance(params["x2"], PendingCollection)
+        self.assertIs(tuple, params["x3"].factory)
+
     def test_child_with_unique_element(self) -> None:
         single = XmlVarFactory.create(
             index=1, xml_type=XmlType.ELEMENT, name="cc", types=(TypeC,)
@@ -388,17 +505,19 @@ class ElementNodeTests(FactoryTestCase):
         ns_map = {"ns0": "xsdata"}
         position = 1
 
+        self.assertIsNone(self.node.assigned)
         actual = self.node.child("cc", attrs, ns_map, position)
         self.assertIsInstance(actual, ElementNode)
         self.assertIn(single.index, self.node.assigned)
+        self.assertIsNone(self.node.wrappers)
 
         actual = self.node.child("cc", attrs, ns_map, position)
         self.assertIsInstance(actual, WildcardNode)
         self.assertNotIn(wildcard.index, self.node.assigned)
 
-    @mock.patch.object(ElementNode, "build_node")
-    def test_child_when_failed_to_build_next_node(self, mock_build_node) -> None:
-        mock_build_node.return_value = None
+    @mock.patch.object(ElementNode, "build_any_node", return_value=None)
+    @mock.patch.object(ElementNode, "build_primitive_node", return_value=None)
+    def test_child_when_failed_to_build_next_node(self, *args) -> None:
         element = XmlVarFactory.create(xml_type=XmlType.ELEMENT, name="a")
         wildcard = XmlVarFactory.create(xml_type=XmlType.WILDCARD, name="a")
 
@@ -413,7 +532,50 @@ class ElementNodeTests(FactoryTestCase):
         self.node.config.fail_on_unknown_properties = False
 
         actual = self.node.child("foobar", {}, {}, 0)
-        self.assertIsInstance(actual, SkipNode)
+        self.assertIs(SKIP_NODE, actual)
+
+    def test_child_with_build_node_override(self) -> None:
+        factories = []
+
+        class CustomNode(ElementNode):
+            def build_node(
+                self,
+                qname: str,
+                var: Any,
+                attrs: dict,
+                ns_map: dict,
+                position: int,
+                factory: str | None = None,
+            ) -> PrimitiveNode:
+                factories.append(factory)
+                return PrimitiveNode(self.meta, var, ns_map, self.config)
+
+        var = XmlVarFactory.create(xml_type=XmlType.ELEMENT, name="a", types=(TypeC,))
+        self.meta.elements[var.qname] = [var]
+        node = CustomNode(
+            position=0,
+            meta=self.meta,
+            context=self.context,
+            config=ParserConfig(),
+            attrs={},
+            ns_map={},
+        )
+
+        actual = node.child("a", {}, {}, 0)
+        self.assertIsInstance(actual, PrimitiveNode)
+        self.assertEqual(var, actual.var)
+        self.assertEqual(["build_clazz_node"], factories)
+
+    def test_child_with_compiled_node_factory(self) -> None:
+        var = XmlVarFactory.create(xml_type=XmlType.ELEMENT, name="a", types=(TypeC,))
+        self.meta.elements[var.qname] = [var]
+        self.context.compile(self.meta).find_children("a")
+
+        with mock.patch.object(BindingPlan, "node_factory") as mock_node_factory:
+            actual = self.node.child("a", {}, {}, 0)
+
+        self.assertIsInstance(actual, ElementNode)
+        mock_node_factory.assert_not_called()
 
     def test_build_node_with_dataclass_union_var(self) -> None:
         var = XmlVarFactory.create(
@@ -431,7 +593,7 @@ class ElementNodeTests(FactoryTestCase):
         self.assertEqual(attrs, actual.attrs)
         self.assertEqual(ns_map, actual.ns_map)
         self.assertEqual(0, actual.level)
-        self.assertEqual(0, len(actual.events))
+        self.assertIsNone(actual.parsers)
 
     @mock.patch.object(ParserUtils, "xsi_type", return_value="foo")
     @mock.patch.object(XmlContext, "fetch")
@@ -584,6 +746,7 @@ class ElementNodeTests(FactoryTestCase):
         )
         attrs = {}
         a = make_dataclass("a", [("a", int)])
+        self.context.index_classes([a])
         actual = self.node.build_node(var.qname, var, attrs, {}, 10)
 
         self.assertIsInstance(actual, ElementNode)
@@ -615,3 +778,45 @@ class ElementNodeTests(FactoryTestCase):
         self.assertEqual(ns_map, actual.ns_map)
         self.assertEqual(self.meta, actual.meta)
         self.assertEqual(var, actual.var)
+
+
+class BindingPlanTests(FactoryTestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        self.context = XmlContext()
+
+    def test_find_children(self) -> None:
+        meta = self.context.build(SequentialType)
+        plan = BindingPlan(meta)
+
+        x1, x4 = meta.elements["x1"][0], meta.elements["x4"][0]
+        factory = "build_primitive_node"
+        self.assertEqual(((x1, 0, factory),), plan.find_children("x1"))
+        self.assertEqual(((x4, x4.index, factory),), plan.find_children("x4"))
+        self.assertEqual((), plan.find_children("unknown"))
+        self.assertEqual(["x1", "x4", "unknown"], list(plan.children))
+
+    def test_find_attribute(self) -> None:
+        meta = self.context.build(AttrsType)
+        plan = BindingPlan(meta)
+
+        index = meta.attributes["index"]
+        attrs = meta.any_attributes[0]
+        self.assertEqual((index, attrs), plan.find_attribute("index"))
+        self.assertEqual((None, attrs), plan.find_attribute("{what}ever"))
+        self.assertEqual(["index", "{what}ever"], list(plan.attributes))
+
+    def test_node_factory(self) -> None:
+        union = XmlVarFactory.create(xml_type=XmlType.ELEMENT, types=(TypeC, TypeB))
+        clazz = XmlVarFactory.create(xml_type=XmlType.ELEMENT, types=(TypeC,))
+        primitive = XmlVarFactory.create(xml_type=XmlType.ELEMENT, types=(int,))
+        any_type = XmlVarFactory.create(
+            xml_type=XmlType.ELEMENT, types=(object,), any_type=True
+        )
+        wildcard = XmlVarFactory.create(xml_type=XmlType.WILDCARD)
+
+        self.assertEqual("build_union_node", BindingPlan.node_factory(union))
+        self.assertEqual("build_clazz_node", BindingPlan.node_factory(clazz))
+        self.assertEqual("build_primitive_node", BindingPlan.node_factory(primitive))
+        self.assertEqual("build_any_node", BindingPlan.node_factory(any_type))
+        self.assertEqual("build_any_node", BindingPlan.node_factory(wildcard))
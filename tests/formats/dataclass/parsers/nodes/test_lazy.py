@@ -0,0 +1,117 @@
+import copy
+import pickle
+from unittest import TestCase
+
+from tests.fixtures.books import BookForm, Books
+from tests.fixtures.books.fixtures import books
+from xsdata.formats.dataclass.context import XmlContext
+from xsdata.formats.dataclass.parsers.config import ParserConfig
+from xsdata.formats.dataclass.parsers.nodes import ElementNode, LazyNode
+from xsdata.formats.dataclass.parsers.nodes.lazy import LazyField, LazyValue, lazy_class
+from xsdata.formats.dataclass.parsers.utils import PendingCollection
+from xsdata.models.enums import EventType
+
+
+class LazyNodeTests(TestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        self.context = XmlContext()
+        self.node = ElementNode(
+            position=3,
+            meta=self.context.build(BookForm),
+            context=self.context,
+            config=ParserConfig(),
+            attrs={"id": "bk001"},
+            ns_map={"a": "b"},
+        )
+
+    def test_child(self) -> None:
+        node = LazyNode(self.node)
+        attrs = {"x": "y"}
+
+        self.assertIs(node, node.child("author", attrs, {"c": "d"}, 1))
+        self.assertEqual({"c": "d"}, node.ns_map)
+        self.assertEqual([(EventType.START, "author", attrs, {"c": "d"})], node.events)
+        self.assertIsNot(attrs, node.events[0][2])
+
+    def test_bind(self) -> None:
+        node = LazyNode(self.node)
+        objects = []
+
+        node.child("author", {}, {}, 0)
+        self.assertFalse(node.bind("author", "Kim", "tail", objects))
+        self.assertEqual({"a": "b"}, node.ns_map)
+        self.assertEqual([], objects)
+
+        self.assertTrue(node.bind("book", None, "tail", objects))
+        self.assertEqual("book", objects[0][0])
+
+        value = objects[0][1]
+        self.assertIsInstance(value, LazyValue)
+        self.assertIs(self.node, value.node)
+        self.assertEqual(0, self.node.position)
+        self.assertEqual((EventType.END, "author", "Kim", "tail"), value.events[1])
+        self.assertEqual((EventType.END, "book", None, None), value.events[-1])
+
+
+class LazyValueTests(TestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        self.context = XmlContext()
+        node = ElementNode(
+            position=0,
+            meta=self.context.build(BookForm),
+            context=self.context,
+            config=ParserConfig(),
+            attrs={"id": "bk001"},
+            ns_map={},
+        )
+
+        events = []
+        for name in ("author", "title", "genre", "price", "pub_date", "review"):
+            value = getattr(books.book[0], name)
+            events.append((EventType.START, name, {}, {}))
+            events.append((EventType.END, name, str(value), None))
+
+        events.append((EventType.END, "book", None, None))
+        self.value = LazyValue(node, events)
+
+    def test_bind(self) -> None:
+        result = self.value.bind()
+        self.assertEqual(books.book[0], result)
+        self.assertIsNone(self.value.events)
+        self.assertIsNone(self.value.node)
+        self.assertIs(result, self.value.bind())
+
+    def test_evaluate(self) -> None:
+        self.assertEqual(books.book[0], LazyValue.evaluate(self.value))
+        self.assertEqual(1, LazyValue.evaluate(1))
+
+    def test_lazy_field(self) -> None:
+        clazz = lazy_class(Books, ("book",))
+        self.assertIsInstance(clazz.book, LazyField)
+
+        obj = clazz(book=PendingCollection([self.value, books.book[1]], list))
+        self.assertEqual(books.book, obj.book)
+        self.assertIs(obj.book, obj.book)
+
+        obj.book = [self.value]
+        self.assertEqual([self.value], obj.book)
+
+        obj.book = self.value
+        self.assertEqual(books.book[0], obj.book)
+
+    def test_lazy_class(self) -> None:
+        clazz = lazy_class(Books, ("book",))
+
+        self.assertIs(clazz, lazy_class(Books, ("book",)))
+        self.assertTrue(issubclass(clazz, Books))
+        self.assertEqual(Books.__qualname__, clazz.__qualname__)
+
+        obj = clazz(book=PendingCollection([self.value], list))
+        self.assertIs(Books, obj.__class__)
+        self.assertEqual(Books(book=[books.book[0]]), obj)
+
+        for result in (copy.deepcopy(obj), pickle.loads(pickle.dumps(obj))):
+            self.assertIs(Books, type(result))
+            self.assertEqual(obj, result)
@@ -1,6 +1,7 @@
 from unittest import TestCase
 
 from xsdata.formats.dataclass.parsers.nodes import SkipNode
+from xsdata.formats.dataclass.parsers.nodes.skip import SKIP_NODE
 
 
 class SKipNodeTests(TestCase):
@@ -13,3 +14,8 @@ class SKipNodeTests(TestCase):
     def test_bind(self) -> None:
         node = SkipNode()
         self.assertEqual(False, node.bind("foo", None, None, []))
+
+    def test_shared_instance(self) -> None:
+        self.assertIsInstance(SKIP_NODE, SkipNode)
+        self.assertIs(SKIP_NODE, SKIP_NODE.child("foo", {}, {"a": "b"}, 1))
+        self.assertEqual({}, SKIP_NODE.ns_map)
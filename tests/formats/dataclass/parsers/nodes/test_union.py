@@ -1,15 +1,15 @@
 from dataclasses import field, make_dataclass
+from typing import Any
 from unittest import TestCase
 
-from tests.fixtures.artists import Artist
 from tests.fixtures.models import UnionType
 from xsdata.exceptions import ParserError
 from xsdata.formats.dataclass.context import XmlContext
-from xsdata.formats.dataclass.models.elements import XmlType
+from xsdata.formats.dataclass.parsers import XmlParser
 from xsdata.formats.dataclass.parsers.config import ParserConfig
 from xsdata.formats.dataclass.parsers.nodes import UnionNode
+from xsdata.models.enums import QNames
 from xsdata.models.mixins import attribute
-from xsdata.utils.testing import XmlMetaFactory, XmlVarFactory
 
 
 class UnionNodeTests(TestCase):
@@ -20,10 +20,14 @@ class UnionNodeTests(TestCase):
         self.config = ParserConfig()
 
     def test_child(self) -> None:
-        attrs = {"id": "1"}
-        ns_map = {"ns0": "xsdata"}
-        meta = XmlMetaFactory.create(clazz=Artist)
-        var = XmlVarFactory.create(xml_type=XmlType.TEXT, name="foo")
+        def element() -> Any:
+            return field(default=None, metadata={"type": "Element"})
+
+        item = make_dataclass("Item", [("a", int, element()), ("b", int, element())])
+        item2 = make_dataclass("Item2", [("b", int, element())])
+        root = make_dataclass("Root", [("item", item2 | item | str)])
+        meta = self.context.build(root)
+        var = next(meta.find_children("item"))
         node = UnionNode(
             meta=meta,
             var=var,
@@ -33,15 +37,21 @@ class UnionNodeTests(TestCase):
             attrs={},
             ns_map={},
         )
-        self.assertEqual(node, node.child("foo", attrs, ns_map, 10))
+        self.assertIsNone(node.parsers)
+        self.assertEqual(node, node.child("a", {}, {}, 10))
 
         self.assertEqual(1, node.level)
-        self.assertEqual([("start", "foo", attrs, ns_map)], node.events)
-        self.assertIsNot(attrs, node.events[0][2])
+        self.assertEqual([item, str], [parser[0] for parser in node.parsers])
 
-    def test_bind_appends_end_event_when_level_not_zero(self) -> None:
-        meta = XmlMetaFactory.create(clazz=Artist)
-        var = XmlVarFactory.create(xml_type=XmlType.TEXT, name="foo")
+        self.assertFalse(node.bind("a", "1", None, []))
+        self.assertEqual(0, node.level)
+        self.assertEqual([item, str], [parser[0] for parser in node.parsers])
+
+    def test_bind_feeds_end_event_when_level_not_zero(self) -> None:
+        item = make_dataclass("Item", [("a", int, field(metadata={"type": "Element"}))])
+        root = make_dataclass("Root", [("item", item | str)])
+        meta = self.context.build(root)
+        var = next(meta.find_children("item"))
         node = UnionNode(
             meta=meta,
             var=var,
@@ -51,13 +61,14 @@ class UnionNodeTests(TestCase):
             attrs={},
             ns_map={},
         )
-        node.level = 1
+        node.child("a", {}, {}, 0)
         objects = []
 
-        self.assertFalse(node.bind("bar", "text", "tail", objects))
+        self.assertFalse(node.bind("a", "foo", "tail", objects))
         self.assertEqual(0, len(objects))
         self.assertEqual(0, node.level)
-        self.assertEqual([("end", "bar", "text", "tail")], node.events)
+        # The converter warning dropped the candidate
+        self.assertEqual([str], [parser[0] for parser in node.parsers])
 
     def test_filter_fixed_attrs(self) -> None:
         a = make_dataclass(
@@ -123,12 +134,6 @@ class UnionNodeTests(TestCase):
         self.assertEqual("1", objects[-1][1].value)
         self.assertEqual("item", objects[-1][0])
 
-        self.assertEqual(2, len(node.events))
-        self.assertEqual(("start", "item", attrs, ns_map), node.events[0])
-        self.assertEqual(("end", "item", "1", None), node.events[1])
-        self.assertIsNot(node.attrs, node.events[0][2])
-        self.assertIs(node.ns_map, node.events[0][3])
-
         node = UnionNode(
             meta=meta,
             var=var,
@@ -162,3 +167,84 @@ class UnionNodeTests(TestCase):
             node.bind("element", None, None, [])
 
         self.assertEqual("Failed to parse union node: element", str(cm.exception))
+
+    def test_bind_with_cache_unions(self) -> None:
+        a = make_dataclass("A", [("x", str, field(metadata={"type": "Element"}))])
+        b = make_dataclass("B", [("x", int, field(metadata={"type": "Element"}))])
+        root = make_dataclass("Root", [("value", a | b)])
+        meta = self.context.build(root)
+        var = next(meta.find_children("value"))
+        self.config.cache_unions = True
+
+        def parse(text: str) -> object:
+            node = UnionNode(
+                meta=meta,
+                var=var,
+                position=0,
+                config=self.config,
+                context=self.context,
+                attrs={},
+                ns_map={},
+            )
+            objects = []
+            node.child("x", {}, {}, 0)
+            node.bind("x", text, None, objects)
+            node.bind("value", None, None, objects)
+            return objects[-1][1]
+
+        self.assertEqual(b(x=1), parse("1"))
+
+        plan = self.context.compile(meta)
+        signature = (var.index, "x", None, frozenset())
+        self.assertEqual({signature: b}, plan.unions)
+
+        # The cached type fails, fall back to all the candidates
+        self.assertEqual(a(x="a"), parse("a"))
+        self.assertEqual({signature: a}, plan.unions)
+        self.assertEqual(a(x="1"), parse("1"))
+
+        plan.unions.clear()
+        UnionNode.cache_size = 0
+        try:
+            self.assertEqual(b(x=1), parse("1"))
+        finally:
+            UnionNode.cache_size = 1024
+
+        self.assertEqual({}, plan.unions)
+
+    def test_build_signature(self) -> None:
+        root = make_dataclass("Root", [("value", UnionType)])
+        meta = self.context.build(root)
+        var = next(meta.find_children("value"))
+        node = UnionNode(
+            meta=meta,
+            var=var,
+            position=0,
+            config=self.config,
+            context=self.context,
+            attrs={"a": "1", QNames.XSI_TYPE: "p:b"},
+            ns_map={"p": "urn:p"},
+        )
+
+        self.assertEqual(
+            (var.index, "x", "{urn:p}b", frozenset(node.attrs.items())),
+            node.build_signature("x"),
+        )
+
+        node.ns_map = {}
+        self.assertIsNone(node.build_signature("x")[2])
+
+    def test_parse_with_cache_unions_and_shared_signature(self) -> None:
+        a = make_dataclass("A", [("x", int, field(metadata={"type": "Element"}))])
+        b = make_dataclass("B", [("x", str, field(metadata={"type": "Element"}))])
+        a.__qualname__ = b.__qualname__ = "item"
+        root = make_dataclass(
+            "root", [("item", list[a | b], field(metadata={"type": "Element"}))]
+        )
+        xml = "<root><item><x>1</x></item><item><x>abc</x></item></root>"
+
+        config = ParserConfig(cache_unions=True)
+        result = XmlParser(config=config, context=self.context).from_string(xml, root)
+
+        self.assertEqual(root(item=[a(x=1), b(x="abc")]), result)
+        self.assertEqual(result, XmlParser().from_string(xml, root))
@@ -0,0 +1,89 @@
+import pickle
+from unittest import TestCase, mock
+
+from tests import fixtures_dir
+from tests.fixtures.books import Books
+from tests.fixtures.books.fixtures import books
+from xsdata.exceptions import ParserError
+from xsdata.formats.dataclass.parsers import JsonParser, XmlParser, batch
+from xsdata.formats.dataclass.parsers.batch import (
+    ParseResult,
+    init_worker,
+    parse_path,
+    parse_worker_path,
+)
+
+
+class BatchTests(TestCase):
+    def setUp(self) -> None:
+        self.paths = [
+            fixtures_dir.joinpath("books/books.xml"),
+            fixtures_dir.joinpath("books/missing.xml"),
+            fixtures_dir.joinpath("books/bk001.xml"),
+        ]
+
+    def test_parse_many(self) -> None:
+        parser = XmlParser()
+        parser.context.build(Books)
+
+        result = list(parser.parse_many(self.paths, Books, workers=2))
+
+        self.assertEqual([str(path) for path in self.paths], [x.path for x in result])
+        self.assertEqual(books, result[0].obj)
+        self.assertIsNone(result[0].error)
+
+        self.assertIsNone(result[1].obj)
+        self.assertIsInstance(result[1].error, ParserError)
+        self.assertIn("missing.xml", str(result[1].error))
+
+        self.assertIsNone(result[2].obj)
+        self.assertEqual(
+            "Unknown property {urn:books}books:author", str(result[2].error)
+        )
+
+    def test_parse_many_in_process(self) -> None:
+        parser = XmlParser()
+        with mock.patch.object(batch, "ProcessPoolExecutor") as mock_executor:
+            result = list(parser.parse_many(self.paths, Books, workers=1))
+
+        self.assertEqual(0, mock_executor.call_count)
+        self.assertEqual(books, result[0].obj)
+        self.assertIsNotNone(result[1].error)
+        self.assertIsNotNone(result[2].error)
+
+    def test_parse_many_with_json_parser(self) -> None:
+        paths = [fixtures_dir.joinpath("books/books.json")] * 3
+        parser = JsonParser()
+        expected = parser.from_path(paths[0], Books)
+        result = list(parser.parse_many(paths, Books, workers=2, chunksize=2))
+
+        self.assertEqual([expected] * 3, [x.obj for x in result])
+        self.assertEqual([None] * 3, [x.error for x in result])
+
+    def test_parse_path(self) -> None:
+        parser = XmlParser()
+        path = str(self.paths[0])
+        self.assertEqual(
+            ParseResult(path, books, None), parse_path(parser, path, Books)
+        )
+
+        error = ParserError("foo")
+        with mock.patch.object(XmlParser, "parse", side_effect=error):
+            self.assertEqual(
+                ParseResult(path, None, error), parse_path(parser, path, Books)
+            )
+
+        with mock.patch.object(XmlParser, "parse", side_effect=KeyError("bar")):
+            result = parse_path(parser, path, Books)
+            self.assertIsInstance(result.error, ParserError)
+            self.assertEqual("KeyError: 'bar'", str(result.error))
+
+    def test_parse_worker_path(self) -> None:
+        parser = pickle.loads(pickle.dumps(XmlParser()))
+        init_worker(parser)
+        try:
+            self.assertIs(parser, batch.worker_parser)
+            result = parse_worker_path(str(self.paths[0]), Books)
+            self.assertEqual(books, result.obj)
+        finally:
+            init_worker(None)
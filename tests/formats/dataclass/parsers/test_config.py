@@ -0,0 +1,115 @@
+import gc
+from dataclasses import dataclass, field, make_dataclass
+from unittest import TestCase
+
+from tests.fixtures.books import BookForm
+from xsdata.formats.dataclass.parsers.config import (
+    CONSTRUCTORS,
+    compile_constructor,
+    fast_class_factory,
+)
+
+
+@dataclass
+class Item:
+    name: str
+    tags: list[str] = field(default_factory=list)
+    size: int = 1
+    kind: str = field(init=False, default="item")
+    seen: list[str] = field(init=False, default_factory=list)
+
+
+@dataclass(frozen=True, slots=True)
+class FrozenItem:
+    name: str
+    size: int = 1
+
+
+@dataclass
+class PostInitItem:
+    name: str
+
+    def __post_init__(self):
+        self.name = self.name.upper()
+
+
+@dataclass
+class GeneratedItem:
+    name: str
+
+    @classmethod
+    def __xsdata_init__(cls, params):
+        self = object.__new__(cls)
+        self.name = params["name"].upper()
+        return self
+
+
+@dataclass
+class GeneratedSubItem(GeneratedItem):
+    size: int = 1
+
+
+class FastClassFactoryTests(TestCase):
+    def test_fast_class_factory(self) -> None:
+        params = {
+            "author": "Kim",
+            "title": "The First Book",
+            "genre": "Fiction",
+            "price": 44.95,
+            "pub_date": None,
+            "review": "Nothing.",
+        }
+
+        self.assertEqual(BookForm(**params), fast_class_factory(BookForm, params))
+        self.assertIsNotNone(CONSTRUCTORS[BookForm])
+
+        del params["title"]
+        with self.assertRaises(TypeError):
+            fast_class_factory(BookForm, params)
+
+        self.assertEqual("A", fast_class_factory(PostInitItem, {"name": "a"}).name)
+        self.assertIsNone(CONSTRUCTORS[PostInitItem])
+
+        self.assertEqual({"a": 1}, fast_class_factory(dict, {"a": 1}))
+        self.assertIsNone(CONSTRUCTORS[dict])
+
+    def test_fast_class_factory_releases_classes(self) -> None:
+        clazz = make_dataclass("Dynamic", [("name", str), ("size", int, 1)])
+        self.assertEqual(clazz(name="a"), fast_class_factory(clazz, {"name": "a"}))
+        self.assertIn(clazz, CONSTRUCTORS)
+
+        size = len(CONSTRUCTORS)
+        del clazz
+        gc.collect()
+        self.assertEqual(size - 1, len(CONSTRUCTORS))
+
+    def test_fast_class_factory_with_generated_constructor(self) -> None:
+        self.assertEqual("A", fast_class_factory(GeneratedItem, {"name": "a"}).name)
+
+        result = fast_class_factory(GeneratedSubItem, {"name": "a", "size": 2})
+        self.assertEqual(GeneratedSubItem(name="a", size=2), result)
+
+    def test_compile_constructor(self) -> None:
+        init = compile_constructor(Item)
+
+        result = init(Item, {"name": "a"})
+        self.assertEqual(Item(name="a"), result)
+        self.assertEqual("item", result.kind)
+        self.assertEqual([], result.seen)
+        self.assertIsNot(result.tags, init(Item, {"name": "a"}).tags)
+
+        tags = ["b"]
+        result = init(Item, {"name": "a", "tags": tags, "size": 2})
+        self.assertEqual(Item(name="a", tags=tags, size=2), result)
+        self.assertIs(tags, result.tags)
+
+        with self.assertRaises(KeyError):
+            init(Item, {})
+
+        init = compile_constructor(FrozenItem)
+        self.assertEqual(FrozenItem(name="a"), init(FrozenItem, {"name": "a"}))
+
+        init = compile_constructor(GeneratedItem)
+        self.assertIs(GeneratedItem.__xsdata_init__.__func__, init)
+        self.assertIsNone(compile_constructor(PostInitItem))
+        self.assertIsNone(compile_constructor(int))
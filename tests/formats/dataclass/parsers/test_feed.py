@@ -0,0 +1,89 @@
+from collections.abc import Iterator
+from unittest import TestCase
+
+from tests import fixtures_dir
+from tests.fixtures.books import Books
+from tests.fixtures.books.fixtures import books
+from xsdata.exceptions import ParserError
+from xsdata.formats.dataclass.parsers import FeedParser, XmlParser
+from xsdata.formats.dataclass.parsers.handlers import (
+    LxmlEventHandler,
+    XmlEventHandler,
+)
+
+
+class FeedParserTests(TestCase):
+    def setUp(self) -> None:
+        self.source = fixtures_dir.joinpath("books/books.xml").read_bytes()
+        self.handlers = [LxmlEventHandler, XmlEventHandler]
+
+    def feed(self, feed: FeedParser, size: int = 64) -> list[list]:
+        result = []
+        for start in range(0, len(self.source), size):
+            result.append(feed.feed(self.source[start : start + size]))
+
+        result.append(feed.close())
+        return result
+
+    @classmethod
+    def flatten(cls, result: list[list]) -> list:
+        return [obj for objects in result for obj in objects]
+
+    def test_feed(self) -> None:
+        for handler in self.handlers:
+            with self.subTest(handler=handler.__name__):
+                parser = XmlParser(handler=handler)
+                result = self.feed(FeedParser(parser, Books))
+
+                self.assertEqual([books], self.flatten(result))
+                self.assertEqual([books], result[-2])
+                self.assertEqual({"brk": "urn:books"}, parser.ns_map)
+
+    def test_feed_with_path(self) -> None:
+        for handler in self.handlers:
+            with self.subTest(handler=handler.__name__):
+                parser = XmlParser(handler=handler)
+                feed = FeedParser(parser, Books, path="book")
+                result = self.feed(feed)
+
+                self.assertEqual(books.book, self.flatten(result))
+                # Every record is returned by the chunk that completes it
+                self.assertEqual(2, len([x for x in result if x]))
+                self.assertEqual([], feed.handler.objects)
+                self.assertEqual([], feed.handler.queue)
+
+    def test_feed_releases_elements(self) -> None:
+        parser = XmlParser(handler=XmlEventHandler)
+        feed = FeedParser(parser, Books, path="book")
+        read_events = feed.pull.read_events
+        elements = []
+
+        def capture() -> Iterator[tuple]:
+            for event, element in read_events():
+                if event == "start":
+                    elements.append(element)
+                yield event, element
+
+        feed.pull.read_events = capture
+        self.assertEqual(books.book, self.flatten(self.feed(feed)))
+        self.assertEqual(0, len(elements[0]))
+
+    def test_feed_with_xml_syntax_error(self) -> None:
+        parser = XmlParser(handler=XmlEventHandler)
+        feed = FeedParser(parser, Books)
+
+        with self.assertRaises(ParserError):
+            feed.feed(b"<books><")
+            feed.close()
+
+    def test_feed_with_truncated_document(self) -> None:
+        source = self.source[: self.source.index(b"</book>") + 20]
+        for handler in self.handlers:
+            for path in (None, "book"):
+                with self.subTest(handler=handler.__name__, path=path):
+                    parser = XmlParser(handler=handler)
+                    feed = FeedParser(parser, Books, path=path)
+                    feed.feed(source)
+
+                    with self.assertRaises(ParserError):
+                        feed.close()
@@ -1,3 +1,5 @@
+import mmap
+
 from tests import fixtures_dir
 from tests.fixtures.books import Books
 from xsdata.formats.dataclass.parsers.json import JsonParser
@@ -24,3 +26,14 @@ class JsonParserTests(FactoryTestCase):
 
         books = self.parser.parse(str(path), Books)
         self.assertIsInstance(books, Books)
+
+        books = self.parser.from_bytes(memoryview(path.read_bytes()), Books)
+        self.assertIsInstance(books, Books)
+
+        with (
+            path.open("rb") as fp,
+            mmap.mmap(fp.fileno(), 0, access=mmap.ACCESS_READ) as mm,
+        ):
+            mm.seek(10)
+            books = self.parser.from_bytes(mm, Books)
+            self.assertIsInstance(books, Books)
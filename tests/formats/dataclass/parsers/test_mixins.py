@@ -1,3 +1,4 @@
+from unittest import mock
 from unittest.case import TestCase
 
 from tests.fixtures.books import Books
@@ -5,6 +6,7 @@ from tests.fixtures.books.fixtures import books, events
 from xsdata.exceptions import XmlHandlerError
 from xsdata.formats.dataclass.parsers.bases import RecordParser
 from xsdata.formats.dataclass.parsers.mixins import EventsHandler, XmlHandler
+from xsdata.formats.dataclass.parsers.nodes import SkipNode
 
 
 class XmlHandlerTests(TestCase):
@@ -18,6 +20,50 @@ class XmlHandlerTests(TestCase):
         with self.assertRaises(NotImplementedError):
             handler.parse(None, {})
 
+        with self.assertRaises(NotImplementedError):
+            handler.create_feed()
+
+        with self.assertRaises(NotImplementedError):
+            next(handler.iterfeed(None))
+
+    def test_read_chunks(self) -> None:
+        handler = XmlHandler(clazz=Books, parser=RecordParser())
+        source = memoryview(b"<a>text</a>")
+
+        chunks = []
+        with mock.patch.object(XmlHandler, "chunk_size", 4):
+            for chunk in handler.read_chunks(source):
+                self.assertIs(source.obj, chunk.obj)
+                chunks.append(chunk.tobytes())
+
+        self.assertEqual([b"<a>t", b"ext<", b"/a>"], chunks)
+
+        source = memoryview(b"abcd").cast("H")
+        self.assertEqual([b"abcd"], [x.tobytes() for x in handler.read_chunks(source)])
+
+    def test_merge_parent_namespaces(self) -> None:
+        handler = XmlHandler(clazz=Books, parser=RecordParser())
+        ns_map = {"a": "b"}
+
+        root_ns_map = handler.merge_parent_namespaces(ns_map)
+        self.assertEqual(ns_map, root_ns_map)
+        self.assertIsNot(ns_map, root_ns_map)
+
+        handler.queue.append(SkipNode())
+        handler.queue[-1].ns_map = root_ns_map
+        self.assertIs(root_ns_map, handler.merge_parent_namespaces({}))
+        self.assertIs(root_ns_map, handler.merge_parent_namespaces({"a": "b"}))
+
+        result = handler.merge_parent_namespaces({"a": "c", None: "d"})
+        self.assertEqual({"a": "c", None: "d"}, result)
+        self.assertIs(result, handler.merge_parent_namespaces({"a": "c", None: "d"}))
+        self.assertEqual({"a": "b"}, root_ns_map)
+
+        with mock.patch.object(XmlHandler, "ns_cache_size", 1):
+            other = handler.merge_parent_namespaces({"e": "f"})
+            self.assertEqual({"a": "b", "e": "f"}, other)
+            self.assertEqual(1, len(handler.ns_cache))
+
 
 class EventsHandlerTests(TestCase):
     def setUp(self) -> None:
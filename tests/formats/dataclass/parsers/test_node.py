@@ -1,18 +1,25 @@
+import asyncio
+import io
+from collections.abc import AsyncIterator
 from dataclasses import make_dataclass
 from typing import Any
 from unittest import mock
 from unittest.case import TestCase
 
+from tests import fixtures_dir
 from tests.fixtures.books import BookForm, Books
+from tests.fixtures.books.fixtures import books
 from tests.fixtures.models import TypeA
 from xsdata.exceptions import ParserError
 from xsdata.formats.dataclass.models.elements import XmlType
 from xsdata.formats.dataclass.models.generics import DerivedElement
 from xsdata.formats.dataclass.parsers.bases import NodeParser
-from xsdata.formats.dataclass.parsers.handlers import XmlEventHandler
+from xsdata.formats.dataclass.parsers.handlers import XmlEventHandler, default_handler
 from xsdata.formats.dataclass.parsers.mixins import XmlHandler
+from xsdata.formats.dataclass.parsers.nodes.element import ElementNode
 from xsdata.formats.dataclass.parsers.nodes.primitive import PrimitiveNode
 from xsdata.formats.dataclass.parsers.nodes.skip import SkipNode
+from xsdata.formats.dataclass.parsers.utils import PendingCollection
 from xsdata.models.enums import Namespace, QNames
 from xsdata.utils.testing import XmlVarFactory
 
@@ -51,6 +58,75 @@ class NodeParserTests(TestCase):
             str(cm.exception),
         )
 
+    def test_iterparse(self) -> None:
+        parser = NodeParser(handler=XmlEventHandler)
+        path = str(fixtures_dir.joinpath("books/books.xml"))
+
+        result = list(parser.iterparse(path, Books))
+        self.assertEqual(books.book, result)
+        self.assertEqual({"brk": "urn:books"}, parser.ns_map)
+
+        result = list(parser.iterparse(path, Books, path="book"))
+        self.assertEqual(books.book, result)
+
+        result = list(parser.iterparse(path, Books, path="book.title"))
+        self.assertEqual(["The First Book", "Becoming Somebody"], result)
+
+        result = list(parser.iterparse(path, Books, path="book.unknown"))
+        self.assertEqual([], result)
+
+    def test_iterparse_drops_records(self) -> None:
+        parser = NodeParser(handler=XmlEventHandler)
+        path = str(fixtures_dir.joinpath("books/books.xml"))
+        handler = parser.handler(clazz=Books, parser=parser)
+        parser.handler = lambda **kwargs: handler
+
+        for _ in parser.iterparse(path, Books):
+            self.assertEqual([], handler.objects)
+
+        self.assertEqual([], handler.queue)
+
+    def test_iterparse_with_xml_syntax_error(self) -> None:
+        parser = NodeParser(handler=XmlEventHandler)
+
+        with self.assertRaises(ParserError):
+            list(parser.iterparse(io.BytesIO(b"<"), Books))
+
+    def test_aiterparse(self) -> None:
+        parser = NodeParser(handler=XmlEventHandler)
+        source = fixtures_dir.joinpath("books/books.xml").read_bytes()
+
+        async def chunks() -> AsyncIterator[bytes]:
+            for start in range(0, len(source), 64):
+                await asyncio.sleep(0)
+                yield source[start : start + 64]
+
+        async def collect(**kwargs: Any) -> list:
+            return [obj async for obj in parser.aiterparse(chunks(), **kwargs)]
+
+        self.assertEqual([books], asyncio.run(collect(clazz=Books)))
+        self.assertEqual({"brk": "urn:books"}, parser.ns_map)
+
+        result = asyncio.run(collect(clazz=Books, path="book.title"))
+        self.assertEqual(["The First Book", "Becoming Somebody"], result)
+
+    def test_match_record(self) -> None:
+        meta = self.parser.context.build(Books)
+        node = ElementNode(
+            meta=meta,
+            attrs={},
+            ns_map={},
+            config=self.parser.config,
+            context=self.parser.context,
+            position=0,
+        )
+
+        self.assertTrue(self.parser.match_record(node, "book", None))
+        self.assertTrue(self.parser.match_record(node, "book", "book"))
+        self.assertFalse(self.parser.match_record(node, "book", "title"))
+        self.assertFalse(self.parser.match_record(node, "title", None))
+        self.assertFalse(self.parser.match_record(SkipNode(), "book", None))
+
     def test_start(self) -> None:
         queue = []
         objects = []
@@ -85,6 +161,63 @@ class NodeParserTests(TestCase):
         self.assertIsNone(actual.derived_factory)
         self.assertIsNone(actual.xsi_type)
 
+    def test_start_with_projection(self) -> None:
+        queue = []
+        self.assertIsNone(self.parser.compile_paths(self.parser.config.projection))
+
+        self.parser.config.projection = ["book.title", "book.price"]
+        self.parser.start(Books, queue, [], "{urn:books}books", {}, {})
+
+        projection = queue[0].projection
+        self.assertIs(
+            projection, self.parser.compile_paths(self.parser.config.projection)
+        )
+        self.assertEqual(["book"], list(projection.fields))
+
+    def test_start_with_unknown_projection_field(self) -> None:
+        self.parser.config.projection = ["book.titel"]
+        with self.assertRaises(ParserError) as cm:
+            self.parser.start(Books, [], [], "{urn:books}books", {}, {})
+
+        self.assertEqual("Unknown projection field book.titel", str(cm.exception))
+
+        self.parser.config.projection = None
+        self.parser.config.lazy_fields = ["boo"]
+        with self.assertRaises(ParserError):
+            self.parser.start(Books, [], [], "{urn:books}books", {}, {})
+
+    def test_parse_with_projection(self) -> None:
+        path = fixtures_dir.joinpath("books/books.xml")
+        self.parser.config.projection = {"book.title", "book.id"}
+
+        for handler in (XmlEventHandler, default_handler()):
+            self.parser.handler = handler
+            result = self.parser.parse(str(path), Books)
+
+            self.assertEqual(["bk001", "bk002"], [book.id for book in result.book])
+            self.assertEqual(
+                [book.title for book in books.book],
+                [book.title for book in result.book],
+            )
+            self.assertEqual([None, None], [book.author for book in result.book])
+
+    def test_parse_with_lazy_fields(self) -> None:
+        path = fixtures_dir.joinpath("books/books.xml")
+        self.parser.config.lazy_fields = {"book"}
+        self.parser.config.projection = {"book.title"}
+
+        for handler in (XmlEventHandler, default_handler()):
+            self.parser.handler = handler
+            result = self.parser.parse(str(path), Books)
+
+            self.assertIsInstance(result.__dict__["book"], PendingCollection)
+            self.assertEqual(
+                [book.title for book in books.book],
+                [book.title for book in result.book],
+            )
+            self.assertEqual([None, None], [book.author for book in result.book])
+            self.assertIsInstance(result.__dict__["book"], list)
+
     def test_start_with_undefined_class(self) -> None:
         parser = self.parser
         queue = []
@@ -139,6 +272,7 @@ class NodeParserTests(TestCase):
         b = make_dataclass("b", fields=[], bases=(a,))
 
         parser = NodeParser()
+        parser.context.index_classes([b])
         queue = []
         objects = []
 
@@ -1,12 +1,14 @@
 import warnings
 from unittest import mock
+from xml.etree.ElementTree import QName
 
+from tests.fixtures.books import BookForm, Books
 from tests.fixtures.models import TypeA
-from xsdata.exceptions import ParserError
-from xsdata.formats.converter import ConverterFactory
+from xsdata.exceptions import ConverterError, ParserError
+from xsdata.formats.converter import ConverterFactory, converter
 from xsdata.formats.dataclass.context import XmlContext
 from xsdata.formats.dataclass.parsers.config import ParserConfig
-from xsdata.formats.dataclass.parsers.utils import ParserUtils
+from xsdata.formats.dataclass.parsers.utils import ParserUtils, Projection
 from xsdata.models.enums import Namespace, ProcessType, QNames
 from xsdata.utils.testing import FactoryTestCase, XmlMetaFactory, XmlVarFactory
 
@@ -79,6 +81,61 @@ class ParserUtilsTests(FactoryTestCase):
             " 1 2 3", [str], ns_map=None, format="Nope"
         )
 
+    def test_parse_var(self) -> None:
+        meta = XmlMetaFactory.create(clazz=TypeA, qname="foo")
+        var = XmlVarFactory.create("x", types=[int], default=1)
+        config = ParserConfig()
+
+        self.assertEqual(2, ParserUtils.parse_var(meta, var, config, "2"))
+        self.assertEqual(1, ParserUtils.parse_var(meta, var, config, None))
+        self.assertIsNotNone(var.decoder)
+
+        # The overrides skip the var decoder
+        decoder = var.decoder
+        result = ParserUtils.parse_var(meta, var, config, "2", types=[str])
+        self.assertEqual("2", result)
+        self.assertIs(decoder, var.decoder)
+
+    def test_decode_value(self) -> None:
+        var = XmlVarFactory.create("x", types=[int])
+        self.assertEqual(1, ParserUtils.decode_value(var, None, 1))
+        self.assertIsNone(ParserUtils.decode_value(var, None, lambda: 1))
+        self.assertEqual(2, ParserUtils.decode_value(var, "2"))
+
+        var = XmlVarFactory.create("x", types=[int], tokens_factory=list)
+        self.assertEqual([1], ParserUtils.decode_value(var, None, lambda: [1]))
+        self.assertEqual([1, 2], ParserUtils.decode_value(var, " 1 2 "))
+        self.assertEqual([1, 2], ParserUtils.decode_value(var, ["1", "2"]))
+
+        var = XmlVarFactory.create("x", types=[float], tokens_factory=tuple)
+        self.assertEqual((1.5, -2.0), ParserUtils.decode_value(var, "1.5\n-2"))
+        with self.assertRaises(ConverterError) as cm:
+            ParserUtils.decode_value(var, "1.5 a")
+
+        self.assertEqual("`a` is not a valid `float`", str(cm.exception))
+
+        var = XmlVarFactory.create("x", types=[QName], tokens_factory=tuple)
+        ns_map = {"a": "b"}
+        result = ParserUtils.decode_value(var, "a:x a:y", ns_map=ns_map)
+        self.assertEqual((QName("{b}x"), QName("{b}y")), result)
+
+    def test_compile_decoder(self) -> None:
+        var = XmlVarFactory.create("x", types=[int])
+
+        with mock.patch.object(
+            ParserUtils, "compile_decoder", wraps=ParserUtils.compile_decoder
+        ) as mock_compile:
+            ParserUtils.decode_value(var, "1")
+            ParserUtils.decode_value(var, "2")
+            self.assertEqual(1, mock_compile.call_count)
+            self.assertEqual(converter.generation, var.decoder_generation)
+
+            # Recompile when the converters registry changes
+            converter.register_converter(bool, converter.type_converter(bool))
+            ParserUtils.decode_value(var, "3")
+            self.assertEqual(2, mock_compile.call_count)
+            self.assertEqual(converter.generation, var.decoder_generation)
+
     def test_parse_any_attributes(self) -> None:
         attrs = {QNames.XSI_TYPE: "xsd:string", "a": "b"}
         ns_map = {"xsi": Namespace.XSI.uri, "xsd": Namespace.XS.uri}
@@ -140,3 +197,51 @@ class ParserUtilsTests(FactoryTestCase):
             ParserUtils.parse_var(meta, var, config, "a", types=[int, float])
 
         self.assertEqual(expected, str(cm.exception))
+
+
+class ProjectionTests(FactoryTestCase):
+    def test_compile(self) -> None:
+        paths = frozenset(("a.b.c", "a.b.d", "a.e", "f", "g.h", "g"))
+        projection = Projection.compile(paths)
+
+        self.assertIs(projection, Projection.compile(paths))
+        self.assertEqual(["a", "f", "g"], sorted(projection.fields))
+        self.assertIsNone(projection.fields["f"])
+        self.assertIsNone(projection.fields["g"])
+
+        nested = projection.fields["a"]
+        self.assertEqual(["b", "e"], sorted(nested.fields))
+        self.assertEqual(["c", "d"], sorted(nested.fields["b"].fields))
+
+    def test_validate(self) -> None:
+        context = XmlContext()
+        meta = context.build(Books)
+        paths = ("book.title", "book.lang", "book")
+        Projection.compile(frozenset(paths)).validate(meta, context)
+
+        projection = Projection.compile(frozenset(("book.title",)))
+        projection.validate(meta, context)
+        self.assertEqual({Books}, projection.checked)
+        self.assertEqual({BookForm}, projection.fields["book"].checked)
+
+        unknown = {
+            "books": "books",
+            "book.titel": "book.titel",
+            "book.title.text": "book.title.text",
+            "book.titel.text": "book.titel",
+        }
+        for path, name in unknown.items():
+            with self.subTest(path=path):
+                projection = Projection.compile(frozenset((path,)))
+                with self.assertRaises(ParserError) as cm:
+                    projection.validate(meta, context)
+
+                self.assertEqual(f"Unknown projection field {name}", str(cm.exception))
+
+    def test_find_missing(self) -> None:
+        meta = XmlContext().build(BookForm)
+        projection = Projection.compile(frozenset(("title", "lang")))
+
+        expected = ("author", "genre", "price", "pub_date", "review", "id")
+        self.assertEqual(expected, projection.find_missing(meta))
+        self.assertEqual({BookForm: expected}, projection.missing)
@@ -27,6 +27,14 @@ class UserXmlParserTests(FactoryTestCase):
             EventType.START, "{urn:books}books", attrs=attrs
         )
 
+    @mock.patch.object(UserXmlParser, "emit_event")
+    def test_parse_with_skipped_subtrees(self, mock_emit_event) -> None:
+        self.parser.config.fail_on_unknown_properties = False
+        xml = '<brk:books xmlns:brk="urn:books"><foo><bar/></foo></brk:books>'
+
+        self.assertEqual(Books(), self.parser.from_string(xml, Books))
+        mock_emit_event.assert_any_call(EventType.START, "bar", attrs={})
+
     @mock.patch.object(UserXmlParser, "emit_event")
     def test_end(self, mock_emit_event) -> None:
         objects = []
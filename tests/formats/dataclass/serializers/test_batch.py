@@ -0,0 +1,108 @@
+from io import StringIO
+from unittest import TestCase, mock
+
+from tests.fixtures.books.fixtures import books
+from xsdata.formats.dataclass.models.generics import DerivedElement
+from xsdata.formats.dataclass.serializers import XmlSerializer, batch
+from xsdata.formats.dataclass.serializers.batch import (
+    init_worker,
+    iter_chunks,
+    root_ns_map,
+    serialize_chunk,
+    serialize_worker_chunk,
+)
+from xsdata.formats.dataclass.serializers.config import SerializerConfig
+
+
+class BatchTests(TestCase):
+    def setUp(self) -> None:
+        config = SerializerConfig(indent="  ")
+        self.serializer = XmlSerializer(config=config)
+        self.records = books.book * 5
+
+    def write_records(self, **kwargs) -> str:
+        output = StringIO()
+        self.serializer.write_records(output, self.records, **kwargs)
+        return output.getvalue()
+
+    def write_many(self, **kwargs) -> str:
+        output = StringIO()
+        self.serializer.write_many(output, self.records, **kwargs)
+        return output.getvalue()
+
+    def test_write_many(self) -> None:
+        kwargs = {"qname": "{urn:books}books", "ns_map": {"bk": "urn:books"}}
+        expected = self.write_records(**kwargs)
+        result = self.write_many(workers=2, chunksize=3, **kwargs)
+
+        self.assertEqual(expected, result)
+        self.assertEqual(1, result.count("xmlns"))
+
+    def test_write_many_in_process(self) -> None:
+        self.serializer.config.indent = None
+        self.serializer.config.schema_location = "urn:books books.xsd"
+        kwargs = {"qname": "books", "ns_map": {None: "urn:books"}}
+        expected = self.write_records(record_qname="{urn:books}book", **kwargs)
+
+        with mock.patch.object(batch, "ProcessPoolExecutor") as mock_executor:
+            result = self.write_many(
+                workers=1, chunksize=4, record_qname="{urn:books}book", **kwargs
+            )
+
+        self.assertEqual(0, mock_executor.call_count)
+        self.assertEqual(expected, result)
+
+    def test_write_many_with_derived_elements_and_record_qname(self) -> None:
+        self.records = [
+            DerivedElement("{urn:books}book", book) for book in books.book * 2
+        ]
+        self.records.append(DerivedElement("price", 1))
+        kwargs = {"qname": "{urn:books}books", "record_qname": "item"}
+        expected = self.write_records(**kwargs)
+
+        self.assertEqual(expected, self.write_many(workers=2, chunksize=2, **kwargs))
+        self.assertEqual(expected, self.write_many(workers=1, chunksize=2, **kwargs))
+        self.assertEqual(4, expected.count('xsi:type="ns0:BookForm"'))
+        self.assertNotIn("<value", expected)
+
+    def test_write_many_with_no_records(self) -> None:
+        self.records = []
+        kwargs = {"qname": "{urn:books}books"}
+
+        self.assertEqual(self.write_records(**kwargs), self.write_many(**kwargs))
+
+    def test_root_ns_map(self) -> None:
+        config = SerializerConfig()
+        self.assertEqual({"ns0": "urn:a"}, root_ns_map(config, "{urn:a}root", None))
+        self.assertEqual(
+            {"a": "urn:a"}, root_ns_map(config, "{urn:a}root", {"a": "urn:a", "": ""})
+        )
+        self.assertEqual({None: ""}, root_ns_map(config, "root", {None: "urn:a"}))
+
+        config.no_namespace_schema_location = "root.xsd"
+        self.assertEqual(
+            {"ns0": "urn:a", "xsi": "http://www.w3.org/2001/XMLSchema-instance"},
+            root_ns_map(config, "{urn:a}root", None),
+        )
+
+    def test_iter_chunks(self) -> None:
+        self.assertEqual([[0, 1], [2, 3], [4]], list(iter_chunks(range(5), 2)))
+        self.assertEqual([], list(iter_chunks([], 2)))
+
+    def test_serialize_chunk(self) -> None:
+        ns_map = {"bk": "urn:books"}
+        result = serialize_chunk(self.serializer, books.book, ns_map, "bk:book")
+
+        self.assertTrue(result.startswith('\n  <bk:book id="bk001" lang="en">'))
+        self.assertTrue(result.endswith("\n  </bk:book>"))
+        self.assertNotIn("xmlns", result)
+
+    def test_serialize_worker_chunk(self) -> None:
+        init_worker(self.serializer)
+        try:
+            result = serialize_worker_chunk(books.book[:1], {}, "book")
+        finally:
+            init_worker(None)
+
+        self.assertTrue(result.startswith('\n  <book id="bk001" lang="en">'))
+        self.assertEqual(1, result.count("<book "))
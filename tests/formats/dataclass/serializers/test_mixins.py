@@ -1,5 +1,6 @@
 from collections.abc import Generator
 from dataclasses import dataclass, field, make_dataclass
+from datetime import date
 from io import StringIO
 from unittest import TestCase
 from xml.etree.ElementTree import QName
@@ -10,16 +11,18 @@ from tests.fixtures.books import BookForm
 from tests.fixtures.datatypes import Telephone
 from tests.fixtures.models import Paragraph, SequentialType, Span, TypeA
 from xsdata.exceptions import SerializerError, XmlContextError, XmlWriterError
+from xsdata.formats.dataclass.context import XmlContext
 from xsdata.formats.dataclass.models.elements import XmlType
 from xsdata.formats.dataclass.models.generics import AnyElement, DerivedElement
 from xsdata.formats.dataclass.serializers import XmlSerializer
 from xsdata.formats.dataclass.serializers.config import SerializerConfig
 from xsdata.formats.dataclass.serializers.mixins import (
     EventGenerator,
+    NamespaceCollector,
     XmlWriter,
 )
 from xsdata.models.datatype import XmlDate
-from xsdata.models.enums import DataType, QNames
+from xsdata.models.enums import DataType, Namespace, QNames, UseType
 from xsdata.utils.testing import XmlVarFactory
 
 # Default values for BookForm required fields
@@ -562,10 +565,10 @@ class EventGeneratorTests(TestCase):
 
         expected = [
             ("start", "a"),
-            ("data", ["1", "2", "3"]),
+            ("data", "1 2 3"),
             ("end", "a"),
             ("start", "a"),
-            ("data", ["4", "5", "6"]),
+            ("data", "4 5 6"),
             ("end", "a"),
         ]
 
@@ -930,7 +933,7 @@ class EventGeneratorTests(TestCase):
             ("data", "1"),
             ("end", "a"),
             ("start", "b"),
-            ("data", ["1", "2"]),
+            ("data", "1 2"),
             ("end", "b"),
         ]
 
@@ -1075,6 +1078,107 @@ class EventGeneratorTests(TestCase):
         self.assertIsInstance(actual, Generator)
         self.assertEqual(expected, list(actual))
 
+    def test_compile_dataclass(self) -> None:
+        @dataclass
+        class Wrapped:
+            class Meta:
+                name = "wrapped"
+
+            id: int = field(metadata={"type": "Attribute"})
+            items: list[int] = field(
+                default_factory=list,
+                metadata={"name": "item", "wrapper": "items", "nillable": True},
+            )
+            span: list[Span] = field(default_factory=list)
+
+        meta = self.generator.context.build(Wrapped)
+        serializer = EventGenerator.compile_dataclass(
+            meta, self.generator.context.class_type
+        )
+        obj = Wrapped(id=1, items=[0, "1", UseType.OPTIONAL], span=[Span("a"), "b"])
+        result = serializer(self.generator, obj, "root", False, None)
+        expected = [
+            ("start", "root"),
+            ("attr", "id", "1"),
+            ("start", "items"),
+            ("start", "item"),
+            ("attr", QNames.XSI_NIL, "true"),
+            ("data", "0"),
+            ("end", "item"),
+            ("start", "item"),
+            ("data", "1"),
+            ("end", "item"),
+            ("start", "item"),
+            ("data", "optional"),
+            ("end", "item"),
+            ("end", "items"),
+            ("start", "span"),
+            ("data", "a"),
+            ("end", "span"),
+            ("start", "span"),
+            ("data", "b"),
+            ("end", "span"),
+            ("end", "root"),
+        ]
+        self.assertIsInstance(result, Generator)
+        self.assertEqual(expected, list(result))
+
+    def test_compile_dataclass_with_sequential_fields(self) -> None:
+        meta = self.generator.context.build(SequentialType)
+        serializer = EventGenerator.compile_dataclass(
+            meta, self.generator.context.class_type
+        )
+        obj = SequentialType(a0="foo", x1=[2, 3], x2=[6])
+        result = serializer(self.generator, obj, "seq", True, "{a}b")
+        expected = [
+            ("start", "seq"),
+            ("attr", "a0", "foo"),
+            ("attr", QNames.XSI_TYPE, QName("{a}b")),
+            ("attr", QNames.XSI_NIL, "true"),
+            ("start", "x1"),
+            ("data", "2"),
+            ("end", "x1"),
+            ("start", "x2"),
+            ("data", "6"),
+            ("end", "x2"),
+            ("start", "x1"),
+            ("data", "3"),
+            ("end", "x1"),
+            ("start", "x5"),
+            ("attr", QNames.XSI_NIL, "true"),
+            ("data", None),
+            ("end", "x5"),
+            ("end", "seq"),
+        ]
+        self.assertEqual(expected, list(result))
+
+    def test_element_kind(self) -> None:
+        class_type = self.generator.context.class_type
+        cases = [
+            (XmlVarFactory.create(xml_type=XmlType.TEXT, types=(int,)), "text"),
+            (XmlVarFactory.create(types=(int, str)), "primitive"),
+            (XmlVarFactory.create(types=(Span, BookForm)), "model"),
+            (XmlVarFactory.create(types=(Span, int)), "generic"),
+            (XmlVarFactory.create(types=(DerivedElement,)), "generic"),
+            (XmlVarFactory.create(types=(object,), any_type=True), "generic"),
+            (XmlVarFactory.create(types=(int,), tokens_factory=list), "generic"),
+            (XmlVarFactory.create(xml_type=XmlType.WILDCARD, mixed=True), "generic"),
+            (XmlVarFactory.create(xml_type=XmlType.ELEMENTS), "generic"),
+        ]
+        for var, expected in cases:
+            self.assertEqual(expected, EventGenerator.element_kind(var, class_type))
+
+    def test_primitive_encoder(self) -> None:
+        var = XmlVarFactory.create(types=(date, UseType, QName), format="%d/%m/%Y")
+        encode = EventGenerator.primitive_encoder(var)
+        qname = QName("{a}b")
+
+        self.assertEqual("02/01/2020", encode(date(2020, 1, 2)))
+        self.assertEqual("a", encode("a"))
+        self.assertEqual("optional", encode(UseType.OPTIONAL))
+        self.assertIs(qname, encode(qname))
+        self.assertEqual("1.5 2.5", encode([1.5, 2.5]))
+
     def test_with_mixed_content(self) -> None:
         obj = Paragraph()
         obj.content.append(AnyElement(qname="b", text="Mr."))
@@ -1115,7 +1219,87 @@ class EventGeneratorTests(TestCase):
         ]
         self.assertEqual(expected, list(result))
 
+    def test_encode_primitive_with_tokens(self) -> None:
+        var = XmlVarFactory.create(types=(float,), tokens_factory=list)
+        values = [1.5, float("nan"), float("inf"), -1e20]
+        actual = XmlSerializer.encode_primitive(values, var)
+        self.assertEqual("1.5 NaN INF -1E20", actual)
+
+        values = [UseType.OPTIONAL, UseType.REQUIRED]
+        actual = XmlSerializer.encode_primitive(values, var)
+        self.assertEqual(["optional", "required"], actual)
+
+        values = [QName("{a}b"), QName("{a}c")]
+        actual = XmlSerializer.encode_primitive(values, var)
+        self.assertEqual(values, actual)
+
     def test_encode_primitive_with_namedtuple(self) -> None:
         var = XmlVarFactory.create(types=(Telephone,))
         actual = XmlSerializer.encode_primitive(Telephone(30, 234, 56783), var)
         self.assertEqual("30-234-56783", actual)
+
+
+@dataclass
+class NamespacedItem:
+    class Meta:
+        namespace = "urn:b"
+
+    code: str | None = field(
+        default=None, metadata={"type": "Attribute", "namespace": "urn:c"}
+    )
+    name: str | None = field(
+        default=None, metadata={"type": "Element", "namespace": "urn:d"}
+    )
+    ref: QName | None = field(default=None, metadata={"type": "Element"})
+    children: list[object] = field(default_factory=list, metadata={"type": "Wildcard"})
+
+
+class NamespaceCollectorTests(TestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        self.collector = NamespaceCollector(XmlContext(), SerializerConfig())
+
+    def test_collect(self) -> None:
+        obj = NamespacedItem(
+            code="a",
+            ref=QName("urn:e", "ref"),
+            children=[
+                AnyElement(
+                    qname="{urn:f}any",
+                    attributes={"{urn:g}a": "1"},
+                    children=[DerivedElement("{urn:h}child", 1)],
+                ),
+                NamespacedItem(name="b"),
+            ],
+        )
+
+        self.assertEqual(
+            [
+                "urn:b",
+                "urn:c",
+                "urn:e",
+                "urn:f",
+                "urn:g",
+                "urn:h",
+                Namespace.XSI.uri,
+                Namespace.XS.uri,
+                "urn:d",
+            ],
+            self.collector.collect(obj),
+        )
+
+    def test_collect_derived_element(self) -> None:
+        obj = DerivedElement("{urn:a}item", NamespacedItem())
+        result = EventGenerator().collect_namespaces(obj)
+
+        self.assertEqual(["urn:a", Namespace.XSI.uri, "urn:b"], result)
+
+    def test_plan(self) -> None:
+        groups, scanned = self.collector.plan(NamespacedItem())
+
+        self.assertEqual([("urn:c", ["code"]), ("urn:d", ["name"])], groups)
+        self.assertEqual(
+            [("ref", "urn:b"), ("children", "urn:b")],
+            [(var.name, uri) for var, uri in scanned],
+        )
+        self.assertIs(scanned, self.collector.plan(NamespacedItem())[1])
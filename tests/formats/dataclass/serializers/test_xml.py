@@ -1,8 +1,18 @@
+from collections.abc import Iterator
+from io import StringIO
 from unittest import TestCase
 
+from tests.fixtures.books import BookForm
 from tests.fixtures.books.fixtures import books
+from tests.fixtures.models import TypeNS1
+from xsdata.formats.dataclass.models.generics import DerivedElement
 from xsdata.formats.dataclass.serializers import XmlSerializer
 from xsdata.formats.dataclass.serializers.config import SerializerConfig
+from xsdata.formats.dataclass.serializers.writers import (
+    LxmlEventWriter,
+    XmlEventWriter,
+    XmlStringWriter,
+)
 
 
 class XmlSerializerTests(TestCase):
@@ -36,3 +46,110 @@ class XmlSerializerTests(TestCase):
         )
 
         self.assertEqual(expected, result)
+
+    def test_render_with_declare_namespaces(self) -> None:
+        self.serializer.config.xml_declaration = False
+        self.serializer.config.indent = None
+        obj = TypeNS1(x1=1, x2=2)
+
+        self.assertEqual(
+            '<ns0:TypeNS1 xmlns:ns0="ns1"><ns1:x1 xmlns:ns1="ns2">1</ns1:x1>'
+            "<ns0:x2>2</ns0:x2></ns0:TypeNS1>",
+            self.serializer.render(obj),
+        )
+
+        self.serializer.config.declare_namespaces = True
+        self.assertEqual(
+            '<ns0:TypeNS1 xmlns:ns0="ns1" xmlns:ns1="ns2"><ns1:x1>1</ns1:x1>'
+            "<ns0:x2>2</ns0:x2></ns0:TypeNS1>",
+            self.serializer.render(obj),
+        )
+        self.assertEqual(
+            '<a:TypeNS1 xmlns:a="ns1" xmlns:ns1="ns2"><ns1:x1>1</ns1:x1>'
+            "<a:x2>2</a:x2></a:TypeNS1>",
+            self.serializer.render(obj, ns_map={"a": "ns1"}),
+        )
+
+    def test_write_records(self) -> None:
+        ns_map = {"bk": "urn:books"}
+        expected = self.serializer.render(books, ns_map=ns_map)
+        consumed = []
+
+        def records() -> Iterator[BookForm]:
+            for book in books.book:
+                consumed.append(book)
+                yield book
+
+        for writer in (LxmlEventWriter, XmlEventWriter, XmlStringWriter):
+            consumed.clear()
+            output = StringIO()
+            self.serializer.writer = writer
+            self.serializer.write_records(
+                output, records(), "{urn:books}books", ns_map, record_qname="book"
+            )
+
+            self.assertEqual(expected, output.getvalue())
+            self.assertEqual(books.book, consumed)
+
+    def test_write_records_with_derived_elements(self) -> None:
+        self.serializer.config.indent = None
+        self.serializer.config.xml_declaration = False
+        records = (DerivedElement("{urn:books}book", book) for book in books.book)
+        output = StringIO()
+
+        self.serializer.write_records(output, records, "{urn:books}books")
+        result = output.getvalue()
+
+        self.assertTrue(result.startswith('<ns0:books xmlns:ns0="urn:books">'))
+        self.assertEqual(2, result.count('xsi:type="ns0:BookForm"'))
+        self.assertTrue(result.endswith("</ns0:book></ns0:books>"))
+
+    def test_write_records_with_derived_elements_and_record_qname(self) -> None:
+        self.serializer.config.indent = None
+        self.serializer.config.xml_declaration = False
+        records = [
+            DerivedElement("{urn:books}book", books.book[0]),
+            DerivedElement("price", 1),
+        ]
+        output = StringIO()
+
+        self.serializer.write_records(
+            output, records, "{urn:books}books", record_qname="item"
+        )
+        self.assertEqual(
+            '<ns0:books xmlns:ns0="urn:books">'
+            '<item xmlns:xsi="http://www.w3.org/2001/XMLSchema-instance"'
+            ' id="bk001" lang="en" xsi:type="ns0:BookForm">'
+            "<author>Hightower, Kim</author>"
+            "<title>The First Book</title>"
+            "<genre>Fiction</genre>"
+            "<price>44.95</price>"
+            "<pub_date>2000-10-01</pub_date>"
+            "<review>An amazing story of nothing.</review>"
+            "</item>"
+            '<item xmlns:xs="http://www.w3.org/2001/XMLSchema"'
+            ' xmlns:xsi="http://www.w3.org/2001/XMLSchema-instance"'
+            ' xsi:type="xs:short">1</item>'
+            "</ns0:books>",
+            output.getvalue(),
+        )
+
+    def test_write_records_flushes_string_writer_chunks(self) -> None:
+        self.serializer.writer = XmlStringWriter
+        self.serializer.config.indent = None
+        expected = self.serializer.render(books)
+        output = StringIO()
+        writes = []
+        output.write = writes.append
+
+        XmlStringWriter.flush_size = 10
+        try:
+            self.serializer.write_records(
+                output, iter(books.book), "{urn:books}books", record_qname="book"
+            )
+        finally:
+            XmlStringWriter.flush_size = 1024
+
+        self.assertEqual(expected, "".join(writes))
+        self.assertEqual(7, len(writes))
+        self.assertEqual("</book></ns0:books>", writes[-1][-19:])
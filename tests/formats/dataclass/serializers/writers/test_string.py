@@ -0,0 +1,188 @@
+from dataclasses import make_dataclass
+from io import StringIO
+from unittest import TestCase
+from xml.etree.ElementTree import QName
+
+from tests import fixtures_dir
+from tests.fixtures.books.fixtures import books
+from xsdata.exceptions import XmlWriterError
+from xsdata.formats.dataclass.serializers import XmlSerializer
+from xsdata.formats.dataclass.serializers.config import SerializerConfig
+from xsdata.formats.dataclass.serializers.writers import (
+    XmlEventWriter,
+    XmlStringWriter,
+)
+
+
+class XmlStringWriterTests(TestCase):
+    def setUp(self) -> None:
+        config = SerializerConfig(indent="  ")
+        self.serializer = XmlSerializer(config=config, writer=XmlStringWriter)
+
+    def test_render(self) -> None:
+        actual = self.serializer.render(books)
+        expected = fixtures_dir.joinpath("books/books_auto_ns.xml").read_text()
+        self.assertEqual(expected, actual)
+
+    def test_render_with_provided_namespaces(self) -> None:
+        ns_map = {"brk": "urn:books"}
+        actual = self.serializer.render(books, ns_map)
+        expected = fixtures_dir.joinpath("books/books.xml").read_text()
+        self.assertEqual(expected, actual)
+        self.assertEqual({"brk": "urn:books"}, ns_map)
+
+    def test_render_with_default_namespace_prefix(self) -> None:
+        actual = self.serializer.render(books, {None: "urn:books"})
+        expected = fixtures_dir.joinpath("books/books_default_ns.xml").read_text()
+        self.assertEqual(expected, actual)
+
+    def test_encoding(self) -> None:
+        self.serializer.config.encoding = "ISO-8859-1"
+        x = make_dataclass("x", [("value", str)])
+        obj = x("á, é, í, ó")
+        actual = self.serializer.render(obj)
+        expected = '<?xml version="1.0" encoding="ISO-8859-1"?>\n<x>á, é, í, ó</x>\n'
+        self.assertEqual(expected, actual)
+
+    def test_no_indent(self) -> None:
+        self.serializer.config.indent = None
+        actual = self.serializer.render(books)
+        expected = XmlSerializer(writer=XmlEventWriter).render(books)
+        self.assertEqual(expected, actual)
+
+    def test_write(self) -> None:
+        config = SerializerConfig(xml_declaration=False)
+        events = [
+            ("start", "{urn:a}root"),
+            ("attr", "{http://www.w3.org/XML/1998/namespace}lang", "en"),
+            ("attr", "title", 'a "b" & <c>'),
+            ("start", "{urn:a}item"),
+            ("data", "1 < 2 & 3 > 2"),
+            ("end", "{urn:a}item"),
+            ("start", "{urn:b}item"),
+            ("attr", "type", QName("urn:c", "name")),
+            ("start", "{urn:b}item"),
+            ("end", "{urn:b}item"),
+            ("end", "{urn:b}item"),
+            ("start", "item"),
+            ("end", "item"),
+            ("data", "tail"),
+            ("end", "{urn:a}root"),
+        ]
+
+        output = StringIO()
+        XmlEventWriter(config, output, {None: "urn:a"}).write(iter(events))
+        expected = output.getvalue()
+
+        output = StringIO()
+        writer = XmlStringWriter(config, output, {None: "urn:a"})
+        writer.write(iter(events))
+
+        self.assertEqual(expected, output.getvalue())
+        self.assertEqual(
+            (
+                '<root xmlns="urn:a" xmlns:xml="http://www.w3.org/XML/1998/namespace" '
+                'xml:lang="en" title=\'a "b" &amp; &lt;c&gt;\'>'
+                "<item>1 &lt; 2 &amp; 3 &gt; 2</item>"
+                '<ns2:item xmlns:ns2="urn:b" xmlns:ns3="urn:c" type="ns3:name">'
+                "<ns2:item/>"
+                "</ns2:item>"
+                '<item xmlns=""/>'
+                "tail</root>"
+            ),
+            output.getvalue(),
+        )
+        self.assertEqual([], writer.chunks)
+        self.assertEqual([({}, {}, {})], writer.contexts)
+
+    def test_write_shares_namespace_maps(self) -> None:
+        config = SerializerConfig()
+        writer = XmlStringWriter(config, StringIO(), {})
+        ns_maps = []
+
+        start_tag = writer.start_tag
+
+        def record_ns_map(qname: str) -> None:
+            start_tag(qname)
+            writer.flush_start(False)
+            ns_maps.append(writer.ns_map)
+
+        writer.start_tag = record_ns_map
+        writer.write(
+            iter(
+                [
+                    ("start", "{urn:a}root"),
+                    ("start", "{urn:a}item"),
+                    ("end", "{urn:a}item"),
+                    ("start", "{urn:b}item"),
+                    ("end", "{urn:b}item"),
+                    ("end", "{urn:a}root"),
+                ]
+            )
+        )
+
+        self.assertIs(ns_maps[0], ns_maps[1])
+        self.assertIsNot(ns_maps[0], ns_maps[2])
+        self.assertEqual({"ns0": "urn:a"}, ns_maps[0])
+        self.assertEqual({"ns0": "urn:a", "ns1": "urn:b"}, ns_maps[2])
+
+    def test_write_with_unhandled_event_raises_exception(self) -> None:
+        writer = XmlStringWriter(SerializerConfig(), StringIO(), {})
+
+        with self.assertRaises(XmlWriterError) as cm:
+            writer.write(iter([("reverse", "p")]))
+
+        self.assertEqual("Unhandled event: `reverse`", str(cm.exception))
+
+    def test_write_fragment(self) -> None:
+        output = StringIO()
+        writer = XmlStringWriter(self.serializer.config, output, {"a": "urn:a"})
+        writer.write_fragment(
+            iter(
+                [
+                    ("start", "{urn:a}item"),
+                    ("start", "{urn:b}item"),
+                    ("attr", "{urn:a}id", "1"),
+                    ("end", "{urn:b}item"),
+                    ("end", "{urn:a}item"),
+                    ("start", "{urn:a}item"),
+                    ("data", "a"),
+                    ("end", "{urn:a}item"),
+                ]
+            )
+        )
+
+        self.assertEqual(
+            '\n  <a:item>\n    <ns1:item xmlns:ns1="urn:b" a:id="1"/>\n  </a:item>'
+            "\n  <a:item>a</a:item>",
+            output.getvalue(),
+        )
+        self.assertEqual([], writer.ns_context)
+        self.assertEqual([({}, {}, {})], writer.contexts)
+
+    def test_write_with_fragments(self) -> None:
+        self.serializer.config.xml_declaration = False
+        output = StringIO()
+        writer = XmlStringWriter(self.serializer.config, output, {"a": "urn:a"})
+        writes = []
+        output.write = writes.append
+
+        writer.write(
+            iter(
+                [
+                    ("start", "{urn:a}root"),
+                    ("fragment", "\n  <a:item/>"),
+                    ("fragment", "\n  <a:item/>"),
+                    ("end", "{urn:a}root"),
+                ]
+            )
+        )
+
+        self.assertEqual(
+            [
+                '<a:root xmlns:a="urn:a">\n  <a:item/>',
+                "\n  <a:item/>",
+                "\n</a:root>\n",
+            ],
+            writes,
+        )
@@ -0,0 +1,205 @@
+import math
+from dataclasses import dataclass, field
+from unittest import TestCase
+
+import pytest
+
+from xsdata.exceptions import ConverterError, ParserError
+from xsdata.formats.dataclass.arrays import ArrayFactory, is_ndarray
+from xsdata.formats.dataclass.context import XmlContext
+from xsdata.formats.dataclass.parsers import JsonParser, XmlParser
+from xsdata.formats.dataclass.parsers.config import ParserConfig
+from xsdata.formats.dataclass.parsers.utils import ParserUtils
+from xsdata.formats.dataclass.serializers import JsonSerializer, XmlSerializer
+from xsdata.formats.dataclass.serializers.config import SerializerConfig
+from xsdata.formats.dataclass.typing import evaluate_attribute, evaluate_element
+
+numpy = pytest.importorskip("numpy")
+NDArray = pytest.importorskip("numpy.typing").NDArray
+
+
+@dataclass
+class Coordinates:
+    class Meta:
+        name = "coordinates"
+
+    pos: NDArray[numpy.float64] = field(
+        default_factory=lambda: numpy.array([], dtype=numpy.float64),
+        metadata={"type": "Element", "tokens": True},
+    )
+    ids: NDArray[numpy.int32] = field(
+        default_factory=lambda: numpy.array([1, 2], dtype=numpy.int32),
+        metadata={"type": "Attribute", "tokens": True},
+    )
+    rows: list[NDArray[numpy.uint8]] = field(
+        default_factory=list,
+        metadata={"type": "Element", "tokens": True},
+    )
+
+
+class ArrayFactoryTests(TestCase):
+    def test_is_ndarray(self) -> None:
+        self.assertTrue(is_ndarray(numpy.ndarray))
+        self.assertFalse(is_ndarray(list))
+
+    def test_init(self) -> None:
+        factory = ArrayFactory(numpy.float32)
+        self.assertIs(numpy.float32, factory.dtype)
+        self.assertIs(float, factory.type)
+        self.assertIs(int, ArrayFactory(numpy.uint16).type)
+        self.assertEqual("ArrayFactory(int64)", repr(ArrayFactory(numpy.int64)))
+
+        for dtype in (float, numpy.bool_, numpy.complex128, numpy.str_):
+            with self.assertRaises(TypeError):
+                ArrayFactory(dtype)
+
+    def test_eq(self) -> None:
+        factory = ArrayFactory(numpy.int64)
+        self.assertEqual(ArrayFactory(numpy.int64), factory)
+        self.assertNotEqual(ArrayFactory(numpy.int32), factory)
+        self.assertNotEqual(list, factory)
+        self.assertEqual(hash(numpy.int64), hash(factory))
+
+    def test_call(self) -> None:
+        factory = ArrayFactory(numpy.int8)
+        result = factory(x for x in (1, 2))
+        self.assertEqual(numpy.int8, result.dtype)
+        self.assertEqual([1, 2], result.tolist())
+
+        array = numpy.array([1, 2], dtype=numpy.int8)
+        self.assertIs(array, factory(array))
+
+        with self.assertRaises(ConverterError):
+            factory([1000])
+
+    def test_decode(self) -> None:
+        factory = ArrayFactory(numpy.float64)
+        result = factory.decode(["1.5", "INF", "-INF", "NaN", "-2E5"])
+        self.assertEqual([1.5, math.inf, -math.inf], result[:3].tolist())
+        self.assertTrue(math.isnan(result[3]))
+        self.assertEqual(-200000.0, result[4])
+
+        with self.assertRaises(ValueError):
+            factory.decode(["a"])
+
+    def test_tolist(self) -> None:
+        array = numpy.array([1, 2])
+        self.assertEqual([1, 2], ArrayFactory.tolist(array))
+        self.assertEqual([[1, 2], [1, 2]], ArrayFactory.tolist([array, array]))
+        self.assertIsNone(ArrayFactory.tolist(None))
+
+    def test_equal(self) -> None:
+        array = numpy.array([1, 2])
+        self.assertTrue(ArrayFactory.equal(array, numpy.array([1, 2])))
+        self.assertTrue(ArrayFactory.equal(array, [1, 2]))
+        self.assertFalse(ArrayFactory.equal(array, numpy.array([1, 2, 3])))
+        self.assertFalse(ArrayFactory.equal(array, None))
+
+
+class ArrayFieldTests(TestCase):
+    def setUp(self) -> None:
+        self.context = XmlContext()
+        self.xml = (
+            '<coordinates ids="3 4">'
+            "<pos>1.5 INF -2E5</pos>"
+            "<rows>1 2</rows>"
+            "<rows>3 4 5</rows>"
+            "</coordinates>"
+        )
+
+    def test_evaluate(self) -> None:
+        result = evaluate_attribute(NDArray[numpy.int32], tokens=True)
+        self.assertEqual((int,), result.types)
+        self.assertEqual(ArrayFactory(numpy.int32), result.tokens_factory)
+
+        result = evaluate_element(NDArray[numpy.float64] | None, tokens=True)
+        self.assertEqual((float,), result.types)
+        self.assertIsNone(result.factory)
+        self.assertEqual(ArrayFactory(numpy.float64), result.tokens_factory)
+        self.assertTrue(result.optional)
+
+        result = evaluate_element(list[NDArray[numpy.float64]], tokens=True)
+        self.assertIs(list, result.factory)
+        self.assertEqual(ArrayFactory(numpy.float64), result.tokens_factory)
+
+        with self.assertRaises(TypeError):
+            evaluate_element(NDArray[numpy.float64], tokens=False)
+
+        with self.assertRaises(TypeError):
+            evaluate_element(numpy.ndarray, tokens=True)
+
+        with self.assertRaises(TypeError):
+            evaluate_attribute(NDArray[numpy.str_], tokens=True)
+
+    def test_parse(self) -> None:
+        parser = XmlParser(context=self.context)
+        obj = parser.from_string(self.xml, Coordinates)
+
+        self.assertEqual(numpy.float64, obj.pos.dtype)
+        self.assertEqual([1.5, math.inf, -200000.0], obj.pos.tolist())
+        self.assertEqual(numpy.int32, obj.ids.dtype)
+        self.assertEqual([3, 4], obj.ids.tolist())
+        self.assertEqual([numpy.uint8, numpy.uint8], [x.dtype for x in obj.rows])
+        self.assertEqual([[1, 2], [3, 4, 5]], ArrayFactory.tolist(obj.rows))
+
+        obj = parser.from_string("<coordinates/>", Coordinates)
+        self.assertEqual([], obj.pos.tolist())
+        self.assertEqual([1, 2], obj.ids.tolist())
+
+    def test_parse_with_invalid_tokens(self) -> None:
+        config = ParserConfig(fail_on_converter_warnings=True)
+        parser = XmlParser(config=config, context=self.context)
+
+        with self.assertRaises(ParserError) as cm:
+            parser.from_string('<coordinates ids="1 a"/>', Coordinates)
+
+        self.assertIn("`a` is not a valid `int`", str(cm.exception))
+
+        with self.assertRaises(ParserError) as cm:
+            parser.from_string(
+                "<coordinates><rows>1 256</rows></coordinates>", Coordinates
+            )
+
+        self.assertIn("256 out of bounds for uint8", str(cm.exception))
+
+    def test_parse_value(self) -> None:
+        factory = ArrayFactory(numpy.float32)
+        result = ParserUtils.parse_value("1.5 2", [float], tokens_factory=factory)
+        self.assertEqual(numpy.float32, result.dtype)
+        self.assertEqual([1.5, 2.0], result.tolist())
+
+        with self.assertRaises(ConverterError):
+            ParserUtils.parse_value("1.5 a", [float], tokens_factory=factory)
+
+    def test_serialize(self) -> None:
+        obj = XmlParser(context=self.context).from_string(self.xml, Coordinates)
+        serializer = XmlSerializer(context=self.context)
+        serializer.config.xml_declaration = False
+
+        self.assertEqual(
+            '<coordinates ids="3 4">'
+            "<pos>1.5 INF -200000.0</pos>"
+            "<rows>1 2</rows>"
+            "<rows>3 4 5</rows>"
+            "</coordinates>",
+            serializer.render(obj),
+        )
+
+        config = SerializerConfig(xml_declaration=False, ignore_default_attributes=True)
+        serializer = XmlSerializer(config=config, context=self.context)
+        self.assertEqual("<coordinates/>", serializer.render(Coordinates()))
+
+    def test_json(self) -> None:
+        obj = XmlParser(context=self.context).from_string(self.xml, Coordinates)
+        output = JsonSerializer(context=self.context).render(obj)
+        self.assertEqual(
+            '{"pos": [1.5, Infinity, -200000.0], "ids": [3, 4], "rows": [[1, 2], [3, 4, 5]]}',
+            output,
+        )
+
+        result = JsonParser(context=self.context).from_string(output, Coordinates)
+        self.assertEqual(numpy.float64, result.pos.dtype)
+        self.assertEqual(obj.pos.tolist(), result.pos.tolist())
+        self.assertEqual(
+            ArrayFactory.tolist(obj.rows), ArrayFactory.tolist(result.rows)
+        )
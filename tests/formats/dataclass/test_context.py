@@ -1,13 +1,21 @@
 import copy
+import hashlib
+import pickle
+import sys
+import tempfile
 from dataclasses import make_dataclass
+from decimal import Decimal
 from pathlib import Path
+from types import ModuleType
 from unittest import mock
 
+from tests.fixtures import models
 from tests.fixtures.artists import Artist, BeginArea
 from tests.fixtures.books import BookForm, BooksForm
-from tests.fixtures.models import BaseType, ChoiceType, UnionType
+from tests.fixtures.models import BaseType, ChoiceType, FactoryType, Parent, UnionType
 from xsdata.formats.dataclass.context import XmlContext
 from xsdata.models.enums import DataType
+from xsdata.utils import text
 from xsdata.utils.testing import FactoryTestCase, XmlMetaFactory
 
 
@@ -67,6 +75,38 @@ class XmlContextTests(FactoryTestCase):
         self.ctx.xsi_cache["{urn:books}BookForm"].append(BooksForm)
         self.assertEqual(BooksForm, self.ctx.find_type("{urn:books}BookForm"))
 
+    @mock.patch.object(XmlContext, "get_subclasses")
+    @mock.patch.object(XmlContext, "import_class")
+    def test_find_with_registry(self, mock_import_class, mock_get_subclasses) -> None:
+        mock_import_class.side_effect = [BookForm, BooksForm]
+        self.ctx.registry = {
+            "{urn:books}BookForm": ["foo.BookForm"],
+            "{urn:books}BooksForm": ["foo.BooksForm"],
+        }
+        self.ctx.build_xsi_cache()
+        self.ctx.xsi_cache.clear()
+
+        self.assertEqual(BookForm, self.ctx.find_type("{urn:books}BookForm"))
+        self.assertEqual(BookForm, self.ctx.find_type("{urn:books}BookForm"))
+        self.assertEqual(BooksForm, self.ctx.find_type("{urn:books}BooksForm"))
+        self.assertIsNone(self.ctx.find_type("{urn:books}Unknown"))
+
+        mock_import_class.assert_has_calls(
+            [mock.call("foo.BookForm"), mock.call("foo.BooksForm")]
+        )
+        mock_get_subclasses.assert_not_called()
+
+    def test_import_class(self) -> None:
+        self.assertEqual(
+            BookForm, self.ctx.import_class("tests.fixtures.books.BookForm")
+        )
+
+        with self.assertRaises(ModuleNotFoundError):
+            self.ctx.import_class("foo.Bar")
+
+        with self.assertRaises(AttributeError):
+            self.ctx.import_class("tests.fixtures.books.Bar")
+
     def test_find_type_by_fields(self) -> None:
         field_names = {"id", "name", "sort-name"}
         self.assertEqual(BeginArea, self.ctx.find_type_by_fields(field_names))
@@ -95,7 +135,8 @@ class XmlContextTests(FactoryTestCase):
         a = make_dataclass("A", fields=[])
         b = make_dataclass("B", fields=[], bases=(a,))
         c = make_dataclass("C", fields=[], bases=(a,))
-        make_dataclass("Other", fields=[])  # Included in the locals
+        other = make_dataclass("Other", fields=[])
+        self.ctx.index_classes([a, b, c, other])
 
         self.assertEqual(b, self.ctx.find_subclass(a, "B"))
         self.assertEqual(b, self.ctx.find_subclass(c, "B"))
@@ -104,6 +145,83 @@ class XmlContextTests(FactoryTestCase):
         self.assertIsNone(self.ctx.find_subclass(c, "Unknown"))
         self.assertIsNone(self.ctx.find_subclass(c, "Other"))
 
+    def test_build_xsi_cache(self) -> None:
+        self.ctx.build_xsi_cache()
+        self.assertEqual(len(sys.modules), self.ctx.sys_modules)
+        self.assertEqual(set(sys.modules), self.ctx.xsi_modules)
+        self.assertEqual([FactoryType], self.ctx.xsi_cache["{xsdata}FactoryType"])
+
+        module = ModuleType("foo.bar")
+        module.A = make_dataclass("A", fields=[], namespace={"__module__": "foo.bar"})
+        module.B = make_dataclass("B", fields=[])  # Not defined in the module
+
+        with mock.patch.dict(sys.modules, {module.__name__: module}):
+            self.ctx.xsi_cache.clear()
+            self.ctx.build_xsi_cache()
+
+        self.assertEqual({"A": [module.A]}, self.ctx.xsi_cache)
+        self.assertIn(module.__name__, self.ctx.xsi_modules)
+
+    def test_index_classes(self) -> None:
+        a = make_dataclass("A", fields=[])
+        b = make_dataclass("B", fields=[], bases=(a,))
+        self.ctx.index_classes([a, b, a, int])
+
+        self.assertEqual({"A": [a], "B": [b]}, self.ctx.xsi_cache)
+        self.assertEqual(set(), self.ctx.xsi_modules)
+
+    def test_scan_xsi_cache(self) -> None:
+        a = make_dataclass("ScanA", fields=[])
+        self.ctx.build_xsi_cache()
+        self.assertNotIn("ScanA", self.ctx.xsi_cache)
+
+        self.ctx.scan_xsi_cache()
+        self.assertEqual([a], self.ctx.xsi_cache["ScanA"])
+
+        b = make_dataclass("ScanB", fields=[])
+        self.assertIsNone(self.ctx.find_type("ScanB"))
+
+        self.ctx.scan_xsi_cache()
+        self.assertEqual([b], self.ctx.xsi_cache["ScanB"])
+
+        self.ctx.reset()
+        self.assertEqual(set(), self.ctx.xsi_modules)
+
+    @mock.patch.object(XmlContext, "get_subclasses")
+    def test_find_after_new_import(self, mock_get_subclasses) -> None:
+        self.ctx.build_xsi_cache()
+
+        module = ModuleType("foo.bar")
+        module.A = make_dataclass("A", fields=[], namespace={"__module__": "foo.bar"})
+        with mock.patch.dict(sys.modules, {module.__name__: module}):
+            self.assertIsNone(self.ctx.find_type("{urn:books}Unknown"))
+            self.assertIsNone(self.ctx.find_type_by_fields({"unknown"}))
+            self.assertEqual(module.A, self.ctx.find_type("A"))
+
+        self.assertIn(module.__name__, self.ctx.xsi_modules)
+        mock_get_subclasses.assert_not_called()
+
+    def test_get_module_classes(self) -> None:
+        actual = list(self.ctx.get_module_classes(models))
+        self.assertIn(FactoryType, actual)
+        self.assertNotIn(Decimal, actual)
+
+        actual = list(self.ctx.get_module_classes(Parent))
+        self.assertEqual([], actual)
+
+        module = ModuleType("foo")
+        module.Parent = make_dataclass(
+            "Parent", fields=[], namespace={"__module__": "foo"}
+        )
+        module.Parent.Inner = make_dataclass(
+            "Inner", fields=[], namespace={"__module__": "foo"}
+        )
+        module.Alias = module.Parent
+        actual = list(self.ctx.get_module_classes(module))
+        self.assertEqual([module.Parent, module.Parent.Inner], actual)
+
+        self.assertEqual([], list(self.ctx.get_module_classes(1)))
+
     def is_binding_model(self) -> None:
         self.assertTrue(self.ctx.is_binding_model(ChoiceType))
 
@@ -133,3 +251,109 @@ class XmlContextTests(FactoryTestCase):
 
         self.ctx.build_recursive(UnionType)
         self.assertEqual(8, len(self.ctx.cache))
+
+    def test_compile(self) -> None:
+        meta = self.ctx.build(BookForm)
+        plan = self.ctx.compile(meta)
+
+        self.assertIs(meta, plan.meta)
+        self.assertIs(plan, self.ctx.compile(meta))
+
+        meta = copy.deepcopy(meta)
+        self.assertIsNot(plan, self.ctx.compile(meta))
+        self.assertIs(meta, self.ctx.compile(meta).meta)
+
+        self.ctx.reset()
+        self.assertEqual({}, self.ctx.plans)
+
+    def test_compile_serializer(self) -> None:
+        meta = self.ctx.build(BookForm)
+        serializer = self.ctx.compile_serializer(meta)
+
+        self.assertIs(serializer, self.ctx.compile_serializer(meta))
+        self.assertEqual((meta, serializer), self.ctx.serializers[BookForm])
+
+        meta = copy.deepcopy(meta)
+        self.assertIsNot(serializer, self.ctx.compile_serializer(meta))
+        self.assertIs(meta, self.ctx.serializers[BookForm][0])
+
+        self.ctx.reset()
+        self.assertEqual({}, self.ctx.serializers)
+
+    def test_dump_and_load(self) -> None:
+        local = make_dataclass("Local", [("x", int)])
+        self.ctx.build_recursive(ChoiceType)
+        self.ctx.build(FactoryType)
+        self.ctx.build(local)
+
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp).joinpath("context.cache")
+            self.ctx.dump(path)
+
+            ctx = XmlContext()
+            self.assertTrue(ctx.load(path))
+
+        self.assertNotIn(local, ctx.cache)
+        self.assertEqual(len(self.ctx.cache) - 1, len(ctx.cache))
+        for clazz, meta in ctx.cache.items():
+            self.assertEqual(self.ctx.cache[clazz], meta)
+
+        meta = ctx.cache[FactoryType]
+        self.assertEqual(["a", "b"], meta.elements["values"][0].default())
+        self.assertEqual(["e"], meta.choices[0].elements["d"].default())
+        self.assertEqual(FactoryType, ctx.find_type("{xsdata}FactoryType"))
+        self.assertNotIn("{xsdata}Local", ctx.xsi_cache)
+        self.assertIn(models.__name__, ctx.xsi_modules)
+
+    def test_load_with_changed_modules(self) -> None:
+        self.ctx.build(FactoryType)
+
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp).joinpath("context.cache")
+            self.ctx.dump(path)
+
+            ctx = XmlContext()
+            with mock.patch.object(XmlContext, "module_digest", return_value="foo"):
+                self.assertTrue(ctx.load(path))
+
+        self.assertEqual({}, ctx.cache)
+        self.assertEqual({}, ctx.xsi_cache)
+        self.assertEqual(0, ctx.sys_modules)
+
+    def test_load_with_invalid_file(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp).joinpath("context.cache")
+            self.assertFalse(self.ctx.load(path))
+
+            path.write_bytes(b"foo")
+            self.assertFalse(self.ctx.load(path))
+
+            self.ctx.dump(path)
+            ctx = XmlContext(element_name_generator=text.camel_case)
+            self.assertFalse(ctx.load(path))
+
+            with mock.patch("xsdata.formats.dataclass.context.__version__", "1.0"):
+                self.assertFalse(self.ctx.load(path))
+
+    def test_module_digest(self) -> None:
+        path = Path(models.__file__)
+        expected = hashlib.sha256(path.read_bytes()).hexdigest()
+
+        self.assertEqual(expected, self.ctx.module_digest(models.__name__))
+        self.assertIsNone(self.ctx.module_digest("builtins"))
+        self.assertIsNone(self.ctx.module_digest("foo.bar"))
+
+    def test_pickle(self) -> None:
+        ctx = XmlContext(
+            element_name_generator=text.camel_case,
+            models_package="tests",
+            registry={"a": ["b.C"]},
+        )
+        ctx.build(BookForm)
+
+        actual = pickle.loads(pickle.dumps(ctx))
+        self.assertEqual(ctx.get_settings(), actual.get_settings())
+        self.assertIs(ctx.class_type, actual.class_type)
+        self.assertEqual(ctx.registry, actual.registry)
+        self.assertEqual({}, actual.cache)
+        self.assertIsNot(ctx.lock, actual.lock)
@@ -1,3 +1,4 @@
+import pickle
 from dataclasses import make_dataclass
 from decimal import Decimal
 from unittest import mock
@@ -143,6 +144,22 @@ class XmlValTests(TestCase):
         var.namespace_matches["{tns}cached"] = True
         self.assertTrue(var.match_namespace("{tns}cached"))
 
+        var = XmlVarFactory.create(xml_type=XmlType.ELEMENT, name="foo")
+        self.assertIsNone(var.namespace_matches)
+        self.assertTrue(var.match_namespace("a"))
+        self.assertIsNone(var.namespace_matches)
+
+    def test_pickle(self) -> None:
+        var = XmlVarFactory.create(name="a", types=[int])
+        var.decoder = lambda value, ns_map: int(value)
+        var.decoder_generation = 1
+
+        actual = pickle.loads(pickle.dumps(var))
+        self.assertIsNone(actual.decoder)
+        self.assertEqual(-1, actual.decoder_generation)
+        self.assertEqual(var.qname, actual.qname)
+        self.assertEqual(var.types, actual.types)
+
 
 class XmlMetaTests(TestCase):
     def setUp(self) -> None:
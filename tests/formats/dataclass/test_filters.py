@@ -178,6 +178,49 @@ class FiltersTests(FactoryTestCase):
         expected = self.filters.class_annotations(target, "FooBar")
         self.assertEqual(["@c", "@b", "@d"], expected)
 
+    def test_class_constructor(self) -> None:
+        obj = ClassFactory.create(
+            attrs=[
+                AttrFactory.create(name="a", restrictions=Restrictions(min_occurs=1)),
+                AttrFactory.create(name="b", restrictions=Restrictions(min_occurs=0)),
+                AttrFactory.create(name="c", restrictions=Restrictions(max_occurs=2)),
+                AttrFactory.create(name="d", default="en", fixed=True),
+                AttrFactory.create(name="e", restrictions=Restrictions(max_occurs=0)),
+                AttrFactory.create(
+                    name="f",
+                    types=[type_int],
+                    default="1 2",
+                    restrictions=Restrictions(tokens=True),
+                ),
+            ]
+        )
+        self.assertIsNone(self.filters.class_constructor(obj))
+
+        self.filters.constructors = True
+        expected = (
+            "@classmethod\n"
+            "def __xsdata_init__(cls, params):\n"
+            "    self = object.__new__(cls)\n"
+            '    self.a = params["a"]\n'
+            '    self.b = params.get("b", None)\n'
+            '    self.c = params["c"] if "c" in params else list()\n'
+            "    self.d = 'en'\n"
+            "    self.e = None\n"
+            '    self.f = params["f"] if "f" in params else (lambda: [\n'
+            "            1,\n"
+            "            2,\n"
+            "        ])()\n"
+            "    return self"
+        )
+        self.assertEqual(expected, self.filters.class_constructor(obj))
+
+        self.filters.format.frozen = True
+        actual = self.filters.class_constructor(obj)
+        self.assertIn('    object.__setattr__(self, "a", params["a"])\n', actual)
+
+        obj.extensions.append(ExtensionFactory.create())
+        self.assertIsNone(self.filters.class_constructor(obj))
+
     def test_field_name(self) -> None:
         self.filters.substitutions[ObjectType.FIELD]["abc"] = "cba"
 
@@ -366,6 +409,23 @@ class FiltersTests(FactoryTestCase):
         )"""
         self.assertEqual(expected, self.filters.field_default_value(attr))
 
+    def test_field_default_value_with_numpy_arrays(self) -> None:
+        attr = AttrFactory.create(types=[type_float], default="1.5 2")
+        attr.restrictions.tokens = True
+        self.filters.numpy_arrays = True
+        expected = """lambda: numpy.array([
+            1.5,
+            2.0,
+        ], dtype=numpy.float64)"""
+        self.assertEqual(expected, self.filters.field_default_value(attr))
+
+        attr.default = None
+        expected = "lambda: numpy.array([], dtype=numpy.float64)"
+        self.assertEqual(expected, self.filters.field_default_value(attr))
+
+        attr.restrictions.max_occurs = 2
+        self.assertEqual("list", self.filters.field_default_value(attr))
+
     def test_field_default_value_with_type_float(self) -> None:
         attr = AttrFactory.create(types=[type_float], default="1.5")
         self.assertEqual("1.5", self.filters.field_default_value(attr))
@@ -668,6 +728,31 @@ class FiltersTests(FactoryTestCase):
             "tuple[tuple[FooBar, ...], ...]", self.filters.field_type(self.obj, attr)
         )
 
+    def test_field_type_with_numpy_arrays(self) -> None:
+        attr = AttrFactory.create(
+            types=[AttrTypeFactory.native(DataType.INT)],
+            restrictions=Restrictions(tokens=True),
+        )
+        self.assertEqual("list[int]", self.filters.field_type(self.obj, attr))
+
+        self.filters.numpy_arrays = True
+        self.assertEqual(
+            "NDArray[numpy.int32]", self.filters.field_type(self.obj, attr)
+        )
+
+        attr.restrictions.max_occurs = 2
+        self.assertEqual(
+            "list[NDArray[numpy.int32]]", self.filters.field_type(self.obj, attr)
+        )
+
+        attr.types.append(AttrTypeFactory.native(DataType.DOUBLE))
+        self.assertEqual(
+            "list[list[int | float]]", self.filters.field_type(self.obj, attr)
+        )
+
+        attr.types = [AttrTypeFactory.native(DataType.INTEGER)]
+        self.assertEqual("list[list[int]]", self.filters.field_type(self.obj, attr))
+
     def test_field_type_with_alias(self) -> None:
         attr = AttrFactory.create(
             types=AttrTypeFactory.list(1, qname="b", forward=True, alias="Boss:Life")
@@ -814,6 +899,11 @@ class FiltersTests(FactoryTestCase):
         self.assertIn(expected, self.filters.default_imports(" = QName("))
         self.assertNotIn(expected, self.filters.default_imports("class fooQName"))
 
+    def test_default_imports_with_numpy(self) -> None:
+        output = ": NDArray[numpy.float64] = field("
+        expected = "import numpy\nfrom numpy.typing import NDArray"
+        self.assertIn(expected, self.filters.default_imports(output))
+
     def test_default_imports_with_enum(self) -> None:
         output = " (Enum) "
 
@@ -3,8 +3,10 @@ import tempfile
 from pathlib import Path
 from unittest import mock
 
+from tests.fixtures.books import BookForm, Books
 from xsdata.codegen.exceptions import CodegenError
 from xsdata.codegen.resolver import DependenciesResolver
+from xsdata.formats.dataclass.context import XmlContext
 from xsdata.formats.dataclass.generator import DataclassGenerator
 from xsdata.models.config import GeneratorConfig
 from xsdata.utils.testing import ClassFactory, FactoryTestCase
@@ -63,6 +65,94 @@ class DataclassGeneratorTests(FactoryTestCase):
         mock_render_module.assert_has_calls([mock.call(mock.ANY, [x]) for x in classes])
         mock_validate_imports.assert_called_once()
 
+    @mock.patch.object(DataclassGenerator, "ruff_code")
+    @mock.patch.object(DataclassGenerator, "validate_imports")
+    @mock.patch.object(DataclassGenerator, "render_registry")
+    @mock.patch.object(DataclassGenerator, "render_package")
+    @mock.patch.object(DataclassGenerator, "render_module")
+    def test_render_with_registry(
+        self,
+        mock_render_module,
+        mock_render_package,
+        mock_render_registry,
+        mock_validate_imports,
+        mock_ruff_code,
+    ) -> None:
+        classes = [ClassFactory.create(package="foo.bar", module="tests")]
+        mock_render_module.return_value = "module"
+        mock_render_package.return_value = "package"
+        mock_render_registry.return_value = "registry"
+        self.generator.config.output.registry = True
+
+        iterator = self.generator.render(classes)
+
+        cwd = Path.cwd()
+        actual = [(out.path, out.title, out.source) for out in iterator]
+        expected = [
+            (cwd.joinpath("foo/bar/__init__.py"), "init", "package"),
+            (cwd.joinpath("foo/bar/_registry.py"), "registry", "registry"),
+            (cwd.joinpath("foo/__init__.py"), "init", "# nothing here\n"),
+            (cwd.joinpath("foo/bar/tests.py"), "foo.bar.tests", "module"),
+        ]
+        self.assertEqual(expected, actual)
+        mock_render_registry.assert_called_once_with(classes)
+
+    def test_render_registry(self) -> None:
+        classes = [
+            ClassFactory.create(qname="{a}b", package="foo", module="tests"),
+            ClassFactory.create(qname="{a}b_1", meta_name="b", module="bar"),
+            ClassFactory.create(qname="c", package="foo", module="tests"),
+            ClassFactory.create(qname="{a}d", local_type=True, module="tests"),
+            ClassFactory.enumeration(2, qname="{a}e", module="tests"),
+            ClassFactory.service(2, qname="{a}f", module="tests"),
+        ]
+
+        actual = self.generator.render_registry(classes)
+        expected = (
+            "__REGISTRY__ = {\n"
+            '    "c": [\n'
+            '        "foo.tests.C",\n'
+            "    ],\n"
+            '    "{a}b": [\n'
+            '        "foo.tests.B",\n'
+            '        "bar.B1",\n'
+            "    ],\n"
+            "}"
+        )
+        self.assertEqual(expected, actual)
+
+    @mock.patch.object(XmlContext, "get_subclasses")
+    def test_render_registry_with_context(self, mock_get_subclasses) -> None:
+        classes = [
+            ClassFactory.create(
+                qname="{urn:books}BookForm",
+                package="tests.fixtures.books",
+                module="books",
+            ),
+            ClassFactory.create(
+                qname="{urn:books}Books",
+                meta_name="books",
+                package="tests.fixtures.books",
+                module="books",
+            ),
+        ]
+        namespace = {}
+        exec(self.generator.render_registry(classes), namespace)
+
+        context = XmlContext(registry=namespace["__REGISTRY__"])
+        context.build_xsi_cache()
+        context.xsi_cache.clear()
+
+        with mock.patch.object(
+            XmlContext, "import_class", wraps=context.import_class
+        ) as mock_import_class:
+            self.assertEqual(BookForm, context.find_type("{urn:books}BookForm"))
+            self.assertEqual(Books, context.find_type("{urn:books}books"))
+            self.assertIsNone(context.find_type("{urn:books}Unknown"))
+
+        self.assertEqual(2, mock_import_class.call_count)
+        mock_get_subclasses.assert_not_called()
+
     def test_render_package(self) -> None:
         classes = [
             ClassFactory.create(qname="a", package="foo", module="tests"),
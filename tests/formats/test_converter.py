@@ -1,16 +1,23 @@
+import math
 import sys
 import unittest
 from datetime import date, datetime, time
 from decimal import Decimal
 from enum import Enum
 from typing import Any
+from unittest import mock
 from xml.etree.ElementTree import QName
 
 import pytest
 
 from tests.fixtures.datatypes import Telephone
 from xsdata.exceptions import ConverterError
-from xsdata.formats.converter import Converter, ProxyConverter, converter
+from xsdata.formats.converter import (
+    Converter,
+    ConverterFactory,
+    ProxyConverter,
+    converter,
+)
 from xsdata.models.datatype import XmlDuration, XmlPeriod
 from xsdata.models.enums import UseType
 
@@ -25,10 +32,65 @@ class ConverterFactoryTests(unittest.TestCase):
         self.assertFalse(converter.deserialize("false", [int, bool]))
         self.assertEqual(1, converter.deserialize("1", [int, bool]))
 
+    def test_decoder(self) -> None:
+        decoder = converter.decoder([int])
+        self.assertEqual(1, decoder("1", None))
+        with self.assertRaises(ConverterError) as cm:
+            decoder("a", None)
+
+        self.assertEqual("`a` is not a valid `int`", str(cm.exception))
+
+        decoder = converter.decoder([int, bool])
+        self.assertFalse(decoder("false", None))
+        with self.assertRaises(ConverterError) as cm:
+            decoder("a", None)
+
+        self.assertEqual("`a` is not a valid `int | bool`", str(cm.exception))
+
+        decoder = converter.decoder([QName])
+        self.assertEqual(QName("{a}b"), decoder("x:b", {"x": "a"}))
+
+        decoder = converter.decoder([bytes], format="base16")
+        self.assertEqual(b"\xfa", decoder("FA", None))
+
+        decoder = converter.decoder([UseType])
+        self.assertEqual(UseType.OPTIONAL, decoder("optional", None))
+        with self.assertRaises(ConverterError) as cm:
+            decoder("a", None)
+
+        self.assertEqual("`a` is not a valid `UseType`", str(cm.exception))
+
+        class A:
+            pass
+
+        decoder = converter.decoder([A])
+        with self.assertRaises(ConverterError) as cm:
+            decoder("a", None)
+
+        self.assertEqual("`a` is not a valid `A`", str(cm.exception))
+
+    def test_tokens_decoder(self) -> None:
+        decoder = converter.tokens_decoder([int])
+        self.assertEqual([1, 2], decoder(["1", "2"], None))
+        with self.assertRaises(ConverterError) as cm:
+            decoder(["1", "a"], None)
+
+        self.assertEqual("`a` is not a valid `int`", str(cm.exception))
+
+        decoder = converter.tokens_decoder([int, bool])
+        self.assertEqual([1, False], list(decoder(["1", "false"], None)))
+
+        decoder = converter.tokens_decoder([QName])
+        result = decoder(["x:b", "x:c"], {"x": "a"})
+        self.assertEqual([QName("{a}b"), QName("{a}c")], list(result))
+
     def test_serialize(self) -> None:
         self.assertEqual(None, converter.serialize(None))
         self.assertEqual("1", converter.serialize(1))
         self.assertEqual("1 2 3", converter.serialize([1, "2", 3]))
+        self.assertEqual("1 2 3", converter.serialize([1, 2, 3]))
+        self.assertEqual("1 2 3 4", converter.serialize([[1, 2], [3, 4]]))
+        self.assertEqual("1.5 INF", converter.serialize([1.5, float("inf")]))
         self.assertEqual(None, converter.serialize(None))
         self.assertEqual("1", converter.serialize(1))
         self.assertEqual("1.5", converter.serialize(1.5))
@@ -37,6 +99,13 @@ class ConverterFactoryTests(unittest.TestCase):
         self.assertEqual("0.0000000877683", converter.serialize(Decimal("8.77683E-8")))
         self.assertEqual("8.77683E-08", converter.serialize(float("8.77683E-8")))
 
+    def test_tokens_converter(self) -> None:
+        self.assertIsNone(converter.tokens_converter([]))
+        self.assertIsNone(converter.tokens_converter({1, 2}))
+        self.assertIsNone(converter.tokens_converter([1, "2"]))
+        self.assertIsNone(converter.tokens_converter([[1], [2]]))
+        self.assertIs(converter.type_converter(int), converter.tokens_converter((1, 2)))
+
     def test_test(self) -> None:
         self.assertTrue(converter.test("1", [int]))
         self.assertTrue(converter.test("1", [float]))
@@ -105,6 +174,40 @@ class ConverterFactoryTests(unittest.TestCase):
         self.assertEqual(2, converter.deserialize("3", [MinusOneInt]))
         converter.unregister_converter(MinusOneInt)
 
+    def test_type_converter(self) -> None:
+        class MinusOneInt(int):
+            pass
+
+        int_converter = converter.type_converter(int)
+        self.assertIs(int_converter, converter.type_converter(MinusOneInt))
+        self.assertIs(int_converter, converter.cache[MinusOneInt])
+        self.assertIs(int_converter, converter.value_converter(MinusOneInt(1)))
+
+        with mock.patch.object(ConverterFactory, "resolve_converter") as mock_resolve:
+            converter.type_converter(MinusOneInt)
+            converter.value_converter(MinusOneInt(1))
+            self.assertEqual(0, mock_resolve.call_count)
+
+        # The registry changes clear the cache
+        converter.register_converter(MinusOneInt, lambda x: int(x) - 1)
+        self.assertNotIn(MinusOneInt, converter.cache)
+        self.assertIsInstance(converter.type_converter(MinusOneInt), ProxyConverter)
+
+        converter.unregister_converter(MinusOneInt)
+        self.assertNotIn(MinusOneInt, converter.cache)
+        self.assertIs(int_converter, converter.type_converter(MinusOneInt))
+
+    def test_register_converter_increments_generation(self) -> None:
+        class MinusOneInt(int):
+            pass
+
+        generation = converter.generation
+        converter.register_converter(MinusOneInt, lambda x: int(x) - 1)
+        self.assertEqual(generation + 1, converter.generation)
+
+        converter.unregister_converter(MinusOneInt)
+        self.assertEqual(generation + 2, converter.generation)
+
 
 class StrConverterTests(unittest.TestCase):
     def setUp(self) -> None:
@@ -133,6 +236,12 @@ class StringConverterTests(unittest.TestCase):
         self.assertIs(string, self.converter.serialize(string))
         self.assertEqual("1", self.converter.serialize(1))
 
+    def test_decoder(self) -> None:
+        decoder = self.converter.decoder(str)
+        string = "foo"
+        self.assertIs(string, decoder(string, None))
+        self.assertEqual("1", decoder(1, None))
+
 
 class BoolConverterTests(unittest.TestCase):
     def setUp(self) -> None:
@@ -170,6 +279,28 @@ class IntConverterTests(unittest.TestCase):
     def test_serialize(self) -> None:
         self.assertEqual("2", self.converter.serialize(2))
 
+    def test_decoder(self) -> None:
+        decoder = self.converter.decoder(int)
+        self.assertEqual(1, decoder("1", None))
+
+        for value in ("a", None):
+            with self.assertRaises(ConverterError) as cm:
+                decoder(value, None)
+
+            self.assertEqual(f"`{value}` is not a valid `int`", str(cm.exception))
+
+    def test_tokens_decoder(self) -> None:
+        decoder = self.converter.tokens_decoder(int)
+        self.assertEqual([1, -2], decoder(["1", "-2"], None))
+
+        with self.assertRaises(ConverterError) as cm:
+            decoder(["1", None], None)
+
+        self.assertEqual("`None` is not a valid `int`", str(cm.exception))
+
+    def test_serialize_tokens(self) -> None:
+        self.assertEqual("1 -2 3", self.converter.serialize_tokens([1, -2, 3]))
+
 
 class FloatConverterTests(unittest.TestCase):
     def setUp(self) -> None:
@@ -190,6 +321,32 @@ class FloatConverterTests(unittest.TestCase):
         self.assertEqual("NaN", self.converter.serialize(float("nan")))
         self.assertEqual("8.77683E-08", self.converter.serialize(float("8.77683E-8")))
 
+    def test_decoder(self) -> None:
+        decoder = self.converter.decoder(float)
+        self.assertEqual(1.5, decoder("1.5", None))
+
+        with self.assertRaises(ConverterError) as cm:
+            decoder("a", None)
+
+        self.assertEqual("`a` is not a valid `float`", str(cm.exception))
+
+    def test_tokens_decoder(self) -> None:
+        decoder = self.converter.tokens_decoder(float)
+        result = decoder(["1.5", "INF", "-1E20", "NaN"], None)
+        self.assertEqual([1.5, float("inf"), -1e20], result[:3])
+        self.assertTrue(math.isnan(result[3]))
+
+        with self.assertRaises(ConverterError) as cm:
+            decoder(["1.5", "a"], None)
+
+        self.assertEqual("`a` is not a valid `float`", str(cm.exception))
+
+    def test_serialize_tokens(self) -> None:
+        values = [2.1, float("inf"), float("-inf"), float("nan"), 8.77683e-8, 1e22]
+        expected = " ".join(self.converter.serialize(value) for value in values)
+        self.assertEqual(expected, self.converter.serialize_tokens(values))
+        self.assertEqual("2.1 INF -INF NaN 8.77683E-08 1E22", expected)
+
 
 class BytesConverterTests(unittest.TestCase):
     def setUp(self) -> None:
@@ -341,6 +498,17 @@ class QNameConverterTests(unittest.TestCase):
         self.assertEqual(QName("a"), convert("a", ns_map={}))
         self.assertEqual(QName("aa", "b"), convert("a:b", ns_map={"a": "aa"}))
 
+    def test_split(self) -> None:
+        split = self.converter.split
+
+        self.assertEqual(("a", None, "b"), split(" a:b "))
+        self.assertEqual((None, "a", "b"), split("{a}b"))
+        self.assertEqual((None, None, "b"), split("b"))
+        self.assertIs(split("a:b"), split("a:b"))
+
+        with self.assertRaises(ConverterError):
+            split("a:1b")
+
     def test_serialize(self) -> None:
         ns_map = {"c_prefix": "c"}
         convert = self.converter.serialize
@@ -412,6 +580,15 @@ class ProxyConverterTests(unittest.TestCase):
     def test_serialize(self) -> None:
         self.assertEqual("1", self.converter.serialize(1))
 
+    def test_decoder(self) -> None:
+        decoder = self.converter.decoder(int)
+        self.assertEqual(1, decoder("1", None))
+
+        with self.assertRaises(ConverterError) as cm:
+            decoder("a", None)
+
+        self.assertEqual("`a` is not a valid `int`", str(cm.exception))
+
 
 class XmlDurationConverterTests(unittest.TestCase):
     def setUp(self) -> None:
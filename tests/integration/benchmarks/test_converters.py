@@ -1,6 +1,14 @@
+from decimal import Decimal
+from typing import Any
+
 import pytest
 
+from xsdata.formats.converter import converter
+from xsdata.formats.dataclass.parsers.utils import ParserUtils
+from xsdata.formats.dataclass.serializers import XmlSerializer
 from xsdata.models.datatype import XmlDate, XmlDateTime, XmlDuration, XmlTime
+from xsdata.models.enums import UseType
+from xsdata.utils.testing import XmlVarFactory
 
 
 @pytest.mark.benchmark(disable_gc=True, group="converters", min_rounds=100000)
@@ -21,3 +29,36 @@ def test_xml_date(benchmark) -> None:
 @pytest.mark.benchmark(disable_gc=True, group="converters", min_rounds=100000)
 def test_xml_duration(benchmark) -> None:
     benchmark(XmlDuration, "P2Y6M5DT12H35M30.5S")
+
+
+@pytest.mark.benchmark(disable_gc=True, group="dispatch", min_rounds=100000)
+@pytest.mark.parametrize("value", [1, 1.5, Decimal("1.5"), True, UseType.OPTIONAL])
+def test_value_converter(benchmark, value: Any) -> None:
+    benchmark(converter.value_converter, value)
+
+
+@pytest.mark.benchmark(disable_gc=True, group="dispatch", min_rounds=100000)
+@pytest.mark.parametrize("value", [1, 1.5, Decimal("1.5"), True, UseType.OPTIONAL])
+def test_serialize(benchmark, value: Any) -> None:
+    benchmark(converter.serialize, value)
+
+
+@pytest.mark.benchmark(disable_gc=True, group="dispatch", min_rounds=100000)
+def test_serialize_tokens(benchmark) -> None:
+    benchmark(converter.serialize, list(range(100)))
+
+
+@pytest.mark.benchmark(disable_gc=True, group="tokens", min_rounds=100)
+@pytest.mark.parametrize("data_type", [int, float])
+def test_decode_tokens(benchmark, data_type: type) -> None:
+    var = XmlVarFactory.create("x", types=[data_type], tokens_factory=list)
+    value = " ".join(str(data_type(i)) for i in range(10000))
+    benchmark(ParserUtils.decode_value, var, value)
+
+
+@pytest.mark.benchmark(disable_gc=True, group="tokens", min_rounds=100)
+@pytest.mark.parametrize("data_type", [int, float])
+def test_encode_tokens(benchmark, data_type: type) -> None:
+    var = XmlVarFactory.create("x", types=[data_type], tokens_factory=list)
+    value = [data_type(i) for i in range(10000)]
+    benchmark(XmlSerializer.encode_primitive, value, var)
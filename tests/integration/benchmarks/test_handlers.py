@@ -3,10 +3,22 @@ import random
 import pytest
 
 from tests import xsdata_temp_dir
-from tests.integration.benchmarks.utils import make_books, parse, write
+from tests.fixtures.books import Books
+from tests.integration.benchmarks.utils import (
+    make_books,
+    parse,
+    parse_allocations,
+    write,
+)
 from xsdata.formats.dataclass.context import XmlContext
+from xsdata.formats.dataclass.parsers import XmlParser
+from xsdata.formats.dataclass.parsers.config import ParserConfig
 from xsdata.formats.dataclass.parsers.handlers import LxmlEventHandler, XmlEventHandler
-from xsdata.formats.dataclass.serializers.writers import LxmlEventWriter, XmlEventWriter
+from xsdata.formats.dataclass.serializers.writers import (
+    LxmlEventWriter,
+    XmlEventWriter,
+    XmlStringWriter,
+)
 
 context = XmlContext()
 readers_list = [
@@ -16,6 +28,7 @@ readers_list = [
 writers_list = [
     XmlEventWriter,
     LxmlEventWriter,
+    XmlStringWriter,
 ]
 
 random.shuffle(readers_list)
@@ -39,3 +52,24 @@ def test_serialize(benchmark, writer, number) -> None:
 def test_parse(benchmark, handler, number) -> None:
     src = xsdata_temp_dir.joinpath(f"benchmark_{number}.xml").read_bytes()
     benchmark(parse, src, handler)
+
+
+@pytest.mark.benchmark(disable_gc=True, group="Parse allocations")
+@pytest.mark.parametrize("number", numbers)
+@pytest.mark.parametrize("handler", readers_list)
+def test_parse_allocations(benchmark, handler, number) -> None:
+    src = xsdata_temp_dir.joinpath(f"benchmark_{number}.xml").read_bytes()
+    benchmark.extra_info.update(parse_allocations(src, handler))
+    benchmark(parse, src, handler)
+
+
+@pytest.mark.benchmark(disable_gc=True, group="Parse skipped")
+@pytest.mark.parametrize("number", numbers)
+@pytest.mark.parametrize("handler", readers_list)
+def test_parse_skipped(benchmark, handler, number) -> None:
+    src = xsdata_temp_dir.joinpath(f"benchmark_{number}.xml").read_bytes()
+    src = src.replace(b"<book ", b"<archive><book ")
+    src = src.replace(b"</book>", b"</book></archive>")
+    config = ParserConfig(fail_on_unknown_properties=False)
+    parser = XmlParser(config=config, context=context, handler=handler)
+    benchmark(parser.from_bytes, src, Books)
@@ -1,3 +1,6 @@
+import sys
+import tracemalloc
+
 from tests.fixtures.books import BookForm, Books
 from tests.integration.benchmarks.conftest import context, xsdata_temp_dir
 from xsdata.formats.dataclass.parsers import JsonParser, XmlParser
@@ -34,6 +37,27 @@ def parse(source, handler) -> None:
     parser.from_bytes(source, Books)
 
 
+def parse_allocations(source, handler) -> dict:
+    elements = source.count(b"<") - source.count(b"</") - source.count(b"<?")
+    parser = XmlParser(context=context, handler=handler)
+    parser.from_bytes(source, Books)
+
+    tracemalloc.start()
+    try:
+        blocks = sys.getallocatedblocks()
+        result = parser.from_bytes(source, Books)
+        blocks = sys.getallocatedblocks() - blocks
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+    assert result.book
+    return {
+        "blocks_per_element": round(blocks / elements, 2),
+        "peak_bytes_per_element": round(peak / elements, 2),
+    }
+
+
 def parse_json(source) -> None:
     parser = JsonParser(context=context)
     parser.from_bytes(source, Books)
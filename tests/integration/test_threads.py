@@ -0,0 +1,80 @@
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from unittest import mock
+
+from tests import fixtures_dir
+from tests.fixtures.artists import Metadata
+from tests.fixtures.books import Books
+from tests.fixtures.compound.models import Root
+from tests.fixtures.primer.order import PurchaseOrder
+from xsdata.formats.dataclass.context import XmlContext
+from xsdata.formats.dataclass.models.builders import XmlMetaBuilder
+from xsdata.formats.dataclass.parsers import XmlParser
+from xsdata.formats.dataclass.serializers import XmlSerializer
+
+documents = [
+    (fixtures_dir.joinpath("books/books.xml"), Books),
+    (fixtures_dir.joinpath("compound/sample.xml"), Root),
+    (fixtures_dir.joinpath("artists/art001.xml"), Metadata),
+    (fixtures_dir.joinpath("primer/sample.xml"), None),  # Locate root class
+]
+
+
+def test_shared_context_from_many_threads() -> None:
+    workers = 16
+    rounds = 10
+    sources = [(path.read_text(), clazz) for path, clazz in documents]
+    expected = [XmlParser().from_string(*source) for source in sources]
+    assert isinstance(expected[-1], PurchaseOrder)
+
+    context = XmlContext()
+    barrier = threading.Barrier(workers)
+
+    def work(index: int) -> list:
+        parser = XmlParser(context=context)
+        serializer = XmlSerializer(context=context)
+        barrier.wait()
+
+        results = []
+        for i in range(rounds):
+            # Reverse the order on every other round to mix the first builds
+            positions = list(range(len(sources)))
+            if (index + i) % 2:
+                positions.reverse()
+
+            parsed = [None] * len(sources)
+            for pos in positions:
+                obj = parser.from_string(*sources[pos])
+                output = serializer.render(obj)
+                parsed[pos] = parser.from_string(output, type(obj))
+
+            results.extend(parsed)
+
+        return results
+
+    interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+    build = XmlMetaBuilder.build
+    try:
+        with (
+            mock.patch.object(XmlMetaBuilder, "build", autospec=True) as mock_build,
+            ThreadPoolExecutor(max_workers=workers) as executor,
+        ):
+            mock_build.side_effect = build
+            futures = [executor.submit(work, index) for index in range(workers)]
+            results = [future.result() for future in futures]
+    finally:
+        sys.setswitchinterval(interval)
+
+    for result in results:
+        assert result == expected * rounds
+
+    # The metadata was built and published once per class
+    assert mock_build.call_count == len(context.cache)
+    for clazz, meta in context.cache.items():
+        assert context.build(clazz) is meta
+        assert context.compile(meta).meta is meta
+
+    for types in context.xsi_cache.values():
+        assert len(types) == len(set(types))
@@ -39,6 +39,9 @@ class GeneratorConfigTests(TestCase):
             "    <UnnestClasses>false</UnnestClasses>\n"
             "    <IgnorePatterns>false</IgnorePatterns>\n"
             "    <IncludeHeader>false</IncludeHeader>\n"
+            "    <Registry>false</Registry>\n"
+            "    <NumpyArrays>false</NumpyArrays>\n"
+            "    <Constructors>false</Constructors>\n"
             "  </Output>\n"
             "  <Conventions>\n"
             '    <ClassName case="pascalCase" safePrefix="type"/>\n'
@@ -100,6 +103,9 @@ class GeneratorConfigTests(TestCase):
             "    <UnnestClasses>false</UnnestClasses>\n"
             "    <IgnorePatterns>false</IgnorePatterns>\n"
             "    <IncludeHeader>false</IncludeHeader>\n"
+            "    <Registry>false</Registry>\n"
+            "    <NumpyArrays>false</NumpyArrays>\n"
+            "    <Constructors>false</Constructors>\n"
             "  </Output>\n"
             "  <Conventions>\n"
             '    <ClassName case="pascalCase" safePrefix="type"/>\n'
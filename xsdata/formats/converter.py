@@ -1,9 +1,10 @@
 import abc
 import base64
 import binascii
+import functools
 import math
 import re
-from collections.abc import Callable, Sequence
+from collections.abc import Callable, Iterable, Sequence
 from contextlib import suppress
 from datetime import date, datetime, time
 from decimal import Decimal, InvalidOperation
@@ -26,6 +27,14 @@ from xsdata.models.datatype import (
 )
 from xsdata.utils import collections, namespaces, text
 
+Decoder = Callable[[Any, dict | None], Any]
+
+
+def invalid_value_message(*types: type) -> str:
+    """Return the conversion error message template for the given types."""
+    type_names = " | ".join(tp.__name__ for tp in types)
+    return f"`{{}}` is not a valid `{type_names}`"
+
 
 class Converter(abc.ABC):
     """Abstract converter class."""
@@ -57,6 +66,68 @@ class Converter(abc.ABC):
             The converted string value.
         """
 
+    def decoder(self, data_type: type, format: str | None = None) -> Decoder:
+        """Return a callable that converts values to the given data type.
+
+        The decoder is resolved once per data type and format, the
+        converters can override it with a specialized callable to
+        avoid the generic keyword arguments overhead.
+
+        Args:
+            data_type: The target data type
+            format: The format argument for base64/hex values or dates
+
+        Returns:
+            A callable with the value and the namespace prefix-URI map
+            arguments, that raises a ConverterError on failures.
+        """
+        deserialize = self.deserialize
+        message = invalid_value_message(data_type)
+
+        def decode(value: Any, ns_map: dict | None) -> Any:
+            try:
+                return deserialize(
+                    value, data_type=data_type, ns_map=ns_map, format=format
+                )
+            except ConverterError:
+                raise ConverterError(message.format(value)) from None
+
+        return decode
+
+    def tokens_decoder(self, data_type: type, format: str | None = None) -> Decoder:
+        """Return a callable that converts a list of tokens to the given data type.
+
+        The default callable decodes the tokens one by one, the
+        converters can override it to decode the whole list in bulk.
+
+        Args:
+            data_type: The target data type
+            format: The format argument for base64/hex values or dates
+
+        Returns:
+            A callable with the tokens and the namespace prefix-URI map
+            arguments, that returns an iterable of the converted tokens
+            and raises a ConverterError on failures.
+        """
+        decode = self.decoder(data_type, format)
+
+        def decode_tokens(values: Sequence, ns_map: dict | None) -> Iterable:
+            return (decode(value, ns_map) for value in values)
+
+        return decode_tokens
+
+    def serialize_tokens(self, values: Sequence, **kwargs: Any) -> str:
+        """Convert a list of token values to string.
+
+        Args:
+            values: The input values
+            **kwargs: Additional keyword arguments needed per converter
+
+        Returns:
+            The space separated converted values.
+        """
+        return " ".join(self.serialize(value, **kwargs) for value in values)
+
     @classmethod
     def validate_input_type(cls, value: Any, tp: type):
         """Validate the input value type matches the required type."""
@@ -71,13 +142,17 @@ class ConverterFactory:
 
     Attributes:
         registry: The registered converters
+        cache: The resolved converters per data type
+        generation: The registry changes counter
     """
 
-    __slots__ = "registry"
+    __slots__ = ("cache", "generation", "registry")
 
     def __init__(self):
         """Initialize the registry."""
         self.registry: dict[type, Converter] = {}
+        self.cache: dict[type, Converter] = {}
+        self.generation = 0
 
     def deserialize(self, value: Any, types: Sequence[type], **kwargs: Any) -> Any:
         """Attempt to convert any value to one of the given types.
@@ -98,13 +173,70 @@ class ConverterFactory:
                 instance = self.type_converter(data_type)
                 return instance.deserialize(value, data_type=data_type, **kwargs)
 
-        type_names = " | ".join(tp.__name__ for tp in types)
-        raise ConverterError(f"`{value}` is not a valid `{type_names}`")
+        raise ConverterError(invalid_value_message(*types).format(value))
+
+    def decoder(self, types: Sequence[type], format: str | None = None) -> Decoder:
+        """Return a callable that converts values to one of the given types.
+
+        For a single type, the decoder of its converter is returned,
+        otherwise the callable attempts all the types in order, like
+        the deserialize method. The decoders are bound to the current
+        registry, compare the factory generation to detect changes.
+
+        Args:
+            types: The target candidate types
+            format: The format argument for base64/hex values or dates
+
+        Returns:
+            A callable with the value and the namespace prefix-URI map
+            arguments, that raises a ConverterError on failures.
+        """
+        if len(types) == 1:
+            with suppress(ConverterError):
+                data_type = types[0]
+                return self.type_converter(data_type).decoder(data_type, format)
+
+        deserialize = self.deserialize
+
+        def decode(value: Any, ns_map: dict | None) -> Any:
+            return deserialize(value, types, ns_map=ns_map, format=format)
+
+        return decode
+
+    def tokens_decoder(
+        self, types: Sequence[type], format: str | None = None
+    ) -> Decoder:
+        """Return a callable that converts a list of tokens to one of the given types.
+
+        For a single type, the tokens decoder of its converter is
+        returned, otherwise the tokens are decoded one by one.
+
+        Args:
+            types: The target candidate types
+            format: The format argument for base64/hex values or dates
+
+        Returns:
+            A callable with the tokens and the namespace prefix-URI map
+            arguments, that returns an iterable of the converted tokens
+            and raises a ConverterError on failures.
+        """
+        if len(types) == 1:
+            with suppress(ConverterError):
+                data_type = types[0]
+                return self.type_converter(data_type).tokens_decoder(data_type, format)
+
+        decode = self.decoder(types, format)
+
+        def decode_tokens(values: Sequence, ns_map: dict | None) -> Iterable:
+            return (decode(value, ns_map) for value in values)
+
+        return decode_tokens
 
     def serialize(self, value: Any, **kwargs: Any) -> Any:
         """Convert the given value to string.
 
-        If the value is a list assume the value is a list of tokens.
+        If the value is a list assume the value is a list of tokens,
+        homogeneous lists are converted in bulk by their converter.
 
         Args:
             value: The input value
@@ -118,11 +250,34 @@ class ConverterFactory:
             return None
 
         if isinstance(value, list):
+            instance = self.tokens_converter(value)
+            if instance:
+                return instance.serialize_tokens(value, **kwargs)
+
             return " ".join(self.serialize(val, **kwargs) for val in value)
 
         instance = self.value_converter(value)
         return instance.serialize(value, **kwargs)
 
+    def tokens_converter(self, values: Any) -> Converter | None:
+        """Return the converter of a homogeneous list of tokens.
+
+        Args:
+            values: The input values
+
+        Returns:
+            The converter instance or None if the values are empty,
+            nested lists or of mixed types.
+        """
+        if not values or not isinstance(values, (list, tuple)):
+            return None
+
+        types = set(map(type, values))
+        if len(types) != 1 or collections.is_array(values[0]):
+            return None
+
+        return self.value_converter(values[0])
+
     def test(
         self,
         value: str | None,
@@ -163,6 +318,9 @@ class ConverterFactory:
     def register_converter(self, data_type: type, func: Callable | Converter) -> None:
         """Register a callable or converter for the given data type.
 
+        The resolved converters cache and the compiled
+        decoders are invalidated.
+
         Args:
             data_type: The data type
             func: The callable or converter instance
@@ -172,9 +330,15 @@ class ConverterFactory:
         else:
             self.registry[data_type] = ProxyConverter(func)
 
+        self.cache.clear()
+        self.generation += 1
+
     def unregister_converter(self, data_type: type) -> None:
         """Unregister the converter for the given data type.
 
+        The resolved converters cache and the compiled
+        decoders are invalidated.
+
         Args:
             data_type: The data type
 
@@ -182,10 +346,34 @@ class ConverterFactory:
             KeyError: if the data type is not registered.
         """
         self.registry.pop(data_type)
+        self.cache.clear()
+        self.generation += 1
 
     def type_converter(self, data_type: type) -> Converter:
         """Find a suitable converter for given data type.
 
+        The resolved converters are cached per data type, until
+        the next registry change.
+
+        Args:
+            data_type: The data type
+
+        Raises:
+            ConverterError: if the data type is not registered.
+
+        Returns:
+            A converter instance
+        """
+        try:
+            return self.cache[data_type]
+        except KeyError:
+            instance = self.resolve_converter(data_type)
+            self.cache[data_type] = instance
+            return instance
+
+    def resolve_converter(self, data_type: type) -> Converter:
+        """Resolve the converter for given data type from the registry.
+
         Iterate over all but last mro items and check for registered
         converters.
 
@@ -211,7 +399,10 @@ class ConverterFactory:
 
     def value_converter(self, value: Any) -> Converter:
         """Get a suitable converter for the given value."""
-        return self.type_converter(value.__class__)
+        try:
+            return self.cache[value.__class__]
+        except KeyError:
+            return self.type_converter(value.__class__)
 
     @classmethod
     def sort_types(cls, types: Sequence[type]) -> list[type]:
@@ -268,6 +459,14 @@ class StringConverter(Converter):
         """Convert a value to string."""
         return value if isinstance(value, str) else str(value)
 
+    def decoder(self, data_type: type, format: str | None = None) -> Decoder:
+        """Return a callable that converts values to string."""
+
+        def decode(value: Any, ns_map: dict | None) -> str:
+            return value if isinstance(value, str) else str(value)
+
+        return decode
+
 
 class BoolConverter(Converter):
     """A bool converter."""
@@ -336,6 +535,34 @@ class IntConverter(Converter):
         except (ValueError, TypeError) as e:
             raise ConverterError(e)
 
+    def decoder(self, data_type: type, format: str | None = None) -> Decoder:
+        """Return a callable that converts values to int."""
+        message = invalid_value_message(data_type)
+
+        def decode(value: Any, ns_map: dict | None) -> int:
+            try:
+                return int(value)
+            except (ValueError, TypeError):
+                raise ConverterError(message.format(value)) from None
+
+        return decode
+
+    def tokens_decoder(self, data_type: type, format: str | None = None) -> Decoder:
+        """Return a callable that converts a list of tokens to int in bulk.
+
+        On failures the tokens are decoded one by one to
+        report the invalid token.
+        """
+        decode = self.decoder(data_type, format)
+
+        def decode_tokens(values: Sequence, ns_map: dict | None) -> list[int]:
+            try:
+                return list(map(int, values))
+            except (ValueError, TypeError):
+                return [decode(value, ns_map) for value in values]
+
+        return decode_tokens
+
     def serialize(self, value: int, **kwargs: Any) -> str:
         """Convert an int value sto string.
 
@@ -348,6 +575,18 @@ class IntConverter(Converter):
         """
         return str(value)
 
+    def serialize_tokens(self, values: Sequence, **kwargs: Any) -> str:
+        """Convert a list of int values to string in bulk.
+
+        Args:
+            values: The input int values
+            **kwargs: Unused keyword arguments
+
+        Returns:
+            The space separated converted values.
+        """
+        return " ".join(map(int.__repr__, values))
+
 
 class FloatConverter(Converter):
     """A float converter."""
@@ -372,6 +611,34 @@ class FloatConverter(Converter):
         except ValueError as e:
             raise ConverterError(e)
 
+    def decoder(self, data_type: type, format: str | None = None) -> Decoder:
+        """Return a callable that converts values to float."""
+        message = invalid_value_message(data_type)
+
+        def decode(value: Any, ns_map: dict | None) -> float:
+            try:
+                return float(value)
+            except ValueError:
+                raise ConverterError(message.format(value)) from None
+
+        return decode
+
+    def tokens_decoder(self, data_type: type, format: str | None = None) -> Decoder:
+        """Return a callable that converts a list of tokens to float in bulk.
+
+        On failures the tokens are decoded one by one to
+        report the invalid token.
+        """
+        decode = self.decoder(data_type, format)
+
+        def decode_tokens(values: Sequence, ns_map: dict | None) -> list[float]:
+            try:
+                return list(map(float, values))
+            except ValueError:
+                return [decode(value, ns_map) for value in values]
+
+        return decode_tokens
+
     def serialize(self, value: float, **kwargs: Any) -> str:
         """Convert a float value sto string.
 
@@ -393,6 +660,22 @@ class FloatConverter(Converter):
 
         return repr(value).upper().replace("E+", "E")
 
+    def serialize_tokens(self, values: Sequence, **kwargs: Any) -> str:
+        """Convert a list of float values to string in bulk.
+
+        The values are joined first and the special values
+        and the exponents are converted in one pass.
+
+        Args:
+            values: The input float values
+            **kwargs: Unused keyword arguments
+
+        Returns:
+            The space separated converted values.
+        """
+        result = " ".join(map(float.__repr__, values)).upper()
+        return result.replace("E+", "E").replace("NAN", "NaN")
+
 
 class BytesConverter(Converter):
     """A bytes converter for base16 and base64 formats."""
@@ -577,11 +860,39 @@ class QNameConverter(Converter):
                 if the prefix can't be resolved to a URI,
                 if the name is not a valid NCName
         """
+        prefix, uri, name = QNameConverter.split(value)
+
+        if uri is None:
+            uri = ns_map.get(prefix) if ns_map else None
+            if prefix and not uri:
+                raise ConverterError(f"Unknown namespace prefix: `{prefix}`")
+
+        return uri, name
+
+    @staticmethod
+    @functools.lru_cache(maxsize=256)
+    def split(value: str) -> tuple[str | None, str | None, str]:
+        """Split and validate a qname or ns prefixed string value.
+
+        The result doesn't depend on the namespace map,
+        the repeated values are validated only once.
+
+        Args:
+            value: the input value to split
+
+        Returns:
+            A tuple of the prefix, the uri and the name strings.
+
+        Raises:
+            ConverterError: if the uri is not valid,
+                if the name is not a valid NCName
+        """
         value = value.strip()
 
         if not value:
             raise ConverterError
 
+        prefix = uri = None
         if value[0] == "{":
             uri, name = text.split(value[1:], "}")
 
@@ -589,14 +900,11 @@ class QNameConverter(Converter):
                 raise ConverterError
         else:
             prefix, name = text.split(value, ":")
-            uri = ns_map.get(prefix) if ns_map else None
-            if prefix and not uri:
-                raise ConverterError(f"Unknown namespace prefix: `{prefix}`")
 
         if " " in name or not namespaces.is_ncname(name):
             raise ConverterError
 
-        return uri, name
+        return prefix, uri, name
 
 
 class EnumConverter(Converter):
@@ -846,6 +1154,19 @@ class ProxyConverter(Converter):
         except ValueError as e:
             raise ConverterError(e)
 
+    def decoder(self, data_type: type, format: str | None = None) -> Decoder:
+        """Return a callable that converts values with the factory."""
+        factory = self.factory
+        message = invalid_value_message(data_type)
+
+        def decode(value: Any, ns_map: dict | None) -> Any:
+            try:
+                return factory(value)
+            except ValueError:
+                raise ConverterError(message.format(value)) from None
+
+        return decode
+
     def serialize(self, value: Any, **kwargs: Any) -> str:
         """Cast value to str."""
         return str(value)
@@ -0,0 +1,134 @@
+import sys
+from collections.abc import Iterable, Sequence
+from typing import Any
+
+from xsdata.exceptions import ConverterError
+from xsdata.utils import collections
+
+# The numpy dtype kinds and the python types of their items
+DTYPE_KINDS = {"f": float, "i": int, "u": int}
+
+
+def is_ndarray(tp: Any) -> bool:
+    """Return whether the given type is the numpy array type.
+
+    NumPy is an optional dependency, if it's not imported yet
+    there can't be any array annotations to analyze.
+    """
+    numpy = sys.modules.get("numpy")
+    return numpy is not None and tp is numpy.ndarray
+
+
+class ArrayFactory:
+    """The tokens factory of numpy array fields.
+
+    The tokens are decoded and encoded in bulk by numpy
+    instead of one python object per token.
+
+    Args:
+        dtype: The numpy scalar type of the array items
+
+    Attributes:
+        type: The python type of the array items
+
+    Raises:
+        TypeError: If the dtype is not an int or float type.
+    """
+
+    __slots__ = ("dtype", "type")
+
+    def __init__(self, dtype: Any):
+        """Resolve the python type of the array items."""
+        import numpy
+
+        if not isinstance(dtype, type) or not issubclass(dtype, numpy.generic):
+            raise TypeError
+
+        tp = DTYPE_KINDS.get(numpy.dtype(dtype).kind)
+        if tp is None:
+            raise TypeError
+
+        self.dtype = dtype
+        self.type = tp
+
+    def __call__(self, values: Iterable) -> Any:
+        """Create an array from the converted token values.
+
+        Args:
+            values: The converted token values
+
+        Returns:
+            The numpy array instance.
+
+        Raises:
+            ConverterError: If a value is out of the dtype bounds.
+        """
+        import numpy
+
+        try:
+            if isinstance(values, numpy.ndarray):
+                return values.astype(self.dtype, copy=False)
+
+            return numpy.fromiter(values, self.dtype)
+        except OverflowError as e:
+            raise ConverterError(e)
+
+    def __eq__(self, other: object) -> bool:
+        """Compare the array factories by their dtype."""
+        return isinstance(other, ArrayFactory) and other.dtype is self.dtype
+
+    def __hash__(self) -> int:
+        """Return the hash of the dtype."""
+        return hash(self.dtype)
+
+    def __repr__(self) -> str:
+        """Return the string representation of the factory."""
+        return f"ArrayFactory({self.dtype.__name__})"
+
+    def decode(self, values: Sequence) -> Any:
+        """Convert the raw token values in bulk.
+
+        Args:
+            values: The raw token values
+
+        Returns:
+            The numpy array instance.
+
+        Raises:
+            ValueError: If a value is invalid.
+            OverflowError: If a value is out of the dtype bounds.
+        """
+        import numpy
+
+        return numpy.array(values, dtype=self.dtype)
+
+    @classmethod
+    def tolist(cls, value: Any) -> Any:
+        """Convert the array or the list of arrays to python lists.
+
+        Args:
+            value: The numpy array, or a list of arrays
+
+        Returns:
+            The python list of the array items.
+        """
+        if hasattr(value, "tolist"):
+            return value.tolist()
+
+        if collections.is_array(value):
+            return [cls.tolist(val) for val in value]
+
+        return value
+
+    @classmethod
+    def equal(cls, value: Any, other: Any) -> bool:
+        """Compare the array items of the given values.
+
+        Args:
+            value: The first array or list of arrays
+            other: The second array or list of arrays
+
+        Returns:
+            The bool result.
+        """
+        return cls.tolist(value) == cls.tolist(other)
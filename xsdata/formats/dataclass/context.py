@@ -1,9 +1,18 @@
+import hashlib
+import importlib
+import io
+import pickle
 import sys
-from collections import defaultdict
-from collections.abc import Callable, Iterator
+import threading
+from collections import defaultdict, deque
+from collections.abc import Callable, Iterable, Iterator, Mapping, Sequence
 from contextlib import suppress
+from importlib.util import find_spec
+from pathlib import Path
+from types import FunctionType
 from typing import Any
 
+from xsdata import __version__
 from xsdata.exceptions import XmlContextError
 from xsdata.formats.dataclass.compat import class_types
 from xsdata.formats.dataclass.models.builders import XmlMetaBuilder
@@ -19,15 +28,24 @@ class XmlContext:
     The context is responsible to provide binding metadata
     for models and their fields.
 
+    The context is safe to share between threads. The metadata and
+    the xsi:type index are built under the context lock and published
+    when complete, lookups of already built metadata never lock.
+
     Args:
         element_name_generator: Default element name generator
         attribute_name_generator: Default attribute name generator
         class_type: Default class type `dataclasses`
         models_package: Restrict auto locate to a specific package
+        registry: A generated type registry, qualified names to class locations
 
     Attributes:
         cache: Internal cache for binding metadata instances
+        lock: The reentrant lock that guards the caches mutations
+        plans: Internal cache for the compiled binding plans
+        serializers: Internal cache for the compiled serializer functions
         xsi_cache: Internal cache for xsi types to class locations
+        xsi_modules: The names of the modules already indexed in the xsi cache
         sys_modules: The number of loaded sys modules
     """
 
@@ -36,9 +54,14 @@ class XmlContext:
         "cache",
         "class_type",
         "element_name_generator",
+        "lock",
         "models_package",
+        "plans",
+        "registry",
+        "serializers",
         "sys_modules",
         "xsi_cache",
+        "xsi_modules",
     )
 
     def __init__(
@@ -47,22 +70,50 @@ class XmlContext:
         attribute_name_generator: Callable = return_input,
         class_type: str = "dataclasses",
         models_package: str | None = None,
+        registry: Mapping[str, Sequence[str]] | None = None,
     ):
         """Initialize the context."""
         self.element_name_generator = element_name_generator
         self.attribute_name_generator = attribute_name_generator
         self.class_type = class_types.get_type(class_type)
 
+        self.lock = threading.RLock()
         self.cache: dict[type, XmlMeta] = {}
+        self.plans: dict[type, Any] = {}
+        self.serializers: dict[type, tuple[XmlMeta, Callable]] = {}
         self.xsi_cache: dict[str, list[type]] = defaultdict(list)
+        self.xsi_modules: set[str] = set()
         self.models_package = models_package
+        self.registry = registry or {}
         self.sys_modules = 0
 
+    def __reduce__(self) -> tuple:
+        """Pickle the context settings without the caches.
+
+        The caches include unpicklable values, e.g. lambda default
+        factories, every process has to warm its own context.
+        """
+        class_type = next(
+            name for name, tp in class_types.types.items() if tp is self.class_type
+        )
+        args = (
+            self.element_name_generator,
+            self.attribute_name_generator,
+            class_type,
+            self.models_package,
+            self.registry,
+        )
+        return self.__class__, args
+
     def reset(self) -> None:
         """Reset all internal caches."""
-        self.cache.clear()
-        self.xsi_cache.clear()
-        self.sys_modules = 0
+        with self.lock:
+            self.cache.clear()
+            self.plans.clear()
+            self.serializers.clear()
+            self.xsi_cache.clear()
+            self.xsi_modules.clear()
+            self.sys_modules = 0
 
     def get_builder(
         self,
@@ -102,20 +153,55 @@ class XmlContext:
         return self.build(subclass, parent_ns) if subclass else meta
 
     def build_xsi_cache(self) -> None:
-        """Index all imported data classes by their xsi:type qualified name."""
+        """Index the data classes of the new imported modules by their xsi:type.
+
+        The index is incremental, only the modules that were imported
+        since the last run are inspected.
+        """
         if len(sys.modules) == self.sys_modules:
             return
 
-        self.xsi_cache.clear()
-        builder = self.get_builder()
-        for clazz in self.get_subclasses(object):
-            if self.is_binding_model(clazz):
-                meta = builder.build_class_meta(clazz)
+        with self.lock:
+            modules = list(sys.modules.items())
+            if len(modules) == self.sys_modules:
+                return
+
+            for name, module in modules:
+                if name in self.xsi_modules:
+                    continue
+
+                self.xsi_modules.add(name)
+                if not self.models_package or name.startswith(self.models_package):
+                    self.index_classes(self.get_module_classes(module))
+
+            self.sys_modules = len(modules)
 
-                if meta.target_qname:
-                    self.xsi_cache[meta.target_qname].append(clazz)
+    def scan_xsi_cache(self) -> None:
+        """Index all the loaded data classes by their xsi:type qualified name.
 
-        self.sys_modules = len(sys.modules)
+        The scan is expensive and never runs on lookups, it's meant
+        to be called explicitly to discover the classes that are not
+        attributes of their modules, e.g. created dynamically.
+        """
+        self.build_xsi_cache()
+        self.index_classes(self.get_subclasses(object))
+
+    def index_classes(self, classes: Iterable[type]) -> None:
+        """Index the given data classes by their xsi:type qualified name.
+
+        Args:
+            classes: The class types to index
+        """
+        builder = self.get_builder()
+        with self.lock:
+            for clazz in classes:
+                if self.is_binding_model(clazz):
+                    meta = builder.build_class_meta(clazz)
+                    qname = meta.target_qname
+
+                    if qname and clazz not in self.xsi_cache.get(qname, ()):
+                        # Publish a new list, readers may iterate the current one
+                        self.xsi_cache[qname] = [*self.xsi_cache.get(qname, ()), clazz]
 
     def is_binding_model(self, clazz: type[T]) -> bool:
         """Return whether the clazz is a binding model.
@@ -149,7 +235,8 @@ class XmlContext:
         """Find all classes that match the given xsi:type qname.
 
         - Ignores native schema types, xs:string, xs:float, xs:int, ...
-        - Rebuild cache if new modules were imported since last run
+        - Index the new modules imported since last run
+        - Import the classes from the registry if there are no matches
 
         Args:
             qname: A namespace qualified name
@@ -159,6 +246,12 @@ class XmlContext:
         """
         if not DataType.from_qname(qname):
             self.build_xsi_cache()
+            if not self.xsi_cache.get(qname) and qname in self.registry:
+                with self.lock:
+                    if not self.xsi_cache.get(qname):
+                        classes = map(self.import_class, self.registry[qname])
+                        self.index_classes(classes)
+
             if qname in self.xsi_cache:
                 return self.xsi_cache[qname]
 
@@ -248,10 +341,65 @@ class XmlContext:
         Returns:
             The class binding metadata instance.
         """
-        if clazz not in self.cache:
-            builder = self.get_builder(globalns)
-            self.cache[clazz] = builder.build(clazz, parent_ns)
-        return self.cache[clazz]
+        meta = self.cache.get(clazz)
+        if meta is None:
+            with self.lock:
+                meta = self.cache.get(clazz)
+                if meta is None:
+                    builder = self.get_builder(globalns)
+                    meta = builder.build(clazz, parent_ns)
+                    self.cache[clazz] = meta
+
+        return meta
+
+    def compile(self, meta: XmlMeta) -> Any:
+        """Fetch or compile the parser binding plan for the given metadata.
+
+        The plan is compiled once per class and is shared
+        by all the element nodes of the class.
+
+        Args:
+            meta: The class binding metadata instance
+
+        Returns:
+            The class binding plan instance.
+        """
+        plan = self.plans.get(meta.clazz)
+        if plan is None or plan.meta is not meta:
+            from xsdata.formats.dataclass.parsers.nodes.element import BindingPlan
+
+            with self.lock:
+                plan = self.plans.get(meta.clazz)
+                if plan is None or plan.meta is not meta:
+                    plan = BindingPlan(meta)
+                    self.plans[meta.clazz] = plan
+
+        return plan
+
+    def compile_serializer(self, meta: XmlMeta) -> Callable:
+        """Fetch or compile the serializer function for the given metadata.
+
+        The function is compiled once per class and is shared
+        by all the serializers of the context.
+
+        Args:
+            meta: The class binding metadata instance
+
+        Returns:
+            The class serializer function.
+        """
+        entry = self.serializers.get(meta.clazz)
+        if entry is None or entry[0] is not meta:
+            from xsdata.formats.dataclass.serializers.mixins import EventGenerator
+
+            with self.lock:
+                entry = self.serializers.get(meta.clazz)
+                if entry is None or entry[0] is not meta:
+                    serializer = EventGenerator.compile_dataclass(meta, self.class_type)
+                    entry = (meta, serializer)
+                    self.serializers[meta.clazz] = entry
+
+        return entry[1]
 
     def build_recursive(self, clazz: type, parent_ns: str | None = None) -> None:
         """Build the binding metadata for the given class and all of its dependencies.
@@ -293,10 +441,226 @@ class XmlContext:
             builder = self.get_builder()
             target_qname = builder.build_class_meta(clazz).target_qname
             if target_qname and target_qname in self.xsi_cache:
-                self.xsi_cache[target_qname].remove(clazz)
+                with self.lock:
+                    self.xsi_cache[target_qname] = [
+                        tp for tp in self.xsi_cache[target_qname] if tp is not clazz
+                    ]
 
             return False
 
+    def dump(self, path: str | Path) -> None:
+        """Write the binding metadata and the xsi:type index to a cache file.
+
+        The cache file is keyed by the xsdata version, the context settings
+        and the source digest of every module the metadata depends on. Models
+        that can't be pickled, e.g. local classes, are silently skipped.
+
+        Args:
+            path: The cache file path
+        """
+        self.build_xsi_cache()
+
+        modules: dict[str, str | None] = {}
+
+        def locate(clazz: type) -> list[str] | None:
+            names = self.get_class_modules(clazz)
+            for name in names:
+                if name not in modules:
+                    modules[name] = self.module_digest(name)
+                if modules[name] is None:
+                    return None
+            return names
+
+        metas = []
+        for clazz, meta in list(self.cache.items()):
+            dependencies = locate(clazz)
+            if dependencies is not None:
+                with suppress(pickle.PicklingError, AttributeError, TypeError):
+                    metas.append((dependencies, self.dump_meta(meta)))
+
+        xsi_cache = {}
+        complete = True
+        for qname, types in self.xsi_cache.items():
+            picklable = [
+                tp for tp in types if locate(tp) is not None and self.is_picklable(tp)
+            ]
+            complete = complete and len(picklable) == len(types)
+            if picklable:
+                xsi_cache[qname] = picklable
+
+        data = {
+            "version": __version__,
+            "settings": self.get_settings(),
+            "modules": {k: v for k, v in modules.items() if v is not None},
+            "xsi_modules": sorted(self.xsi_modules) if complete else None,
+            "metas": metas,
+            "xsi_cache": pickle.dumps(xsi_cache),
+        }
+        Path(path).write_bytes(pickle.dumps(data))
+
+    def load(self, path: str | Path) -> bool:
+        """Load the binding metadata and the xsi:type index from a cache file.
+
+        The cache file is ignored if it was written by another xsdata
+        version or with different context settings. The metadata of
+        classes, whose modules have changed since the cache file was
+        written, are skipped and will be rebuilt on demand.
+
+        Warning:
+            The cache file is unpickled, never load untrusted files!
+
+        Args:
+            path: The cache file path
+
+        Returns:
+            Whether the cache file was valid and loaded.
+        """
+        try:
+            data = pickle.loads(Path(path).read_bytes())
+        except (OSError, EOFError, pickle.UnpicklingError):
+            return False
+
+        if (
+            not isinstance(data, dict)
+            or data.get("version") != __version__
+            or data.get("settings") != self.get_settings()
+        ):
+            return False
+
+        valid = {
+            name
+            for name, digest in data["modules"].items()
+            if self.module_digest(name) == digest
+        }
+
+        for dependencies, value in data["metas"]:
+            if valid.issuperset(dependencies):
+                with suppress(Exception):
+                    meta = self.load_meta(value)
+                    self.cache.setdefault(meta.clazz, meta)
+
+        if len(valid) == len(data["modules"]):
+            with suppress(Exception):
+                xsi_cache = pickle.loads(data["xsi_cache"])
+                with self.lock:
+                    for qname, types in xsi_cache.items():
+                        existing = self.xsi_cache.get(qname, [])
+                        self.xsi_cache[qname] = [
+                            *existing,
+                            *(tp for tp in types if tp not in existing),
+                        ]
+
+                    # Only the modules imported after the cache was
+                    # written will be inspected on the next xsi cache build.
+                    if data["xsi_modules"]:
+                        self.xsi_modules.update(data["xsi_modules"])
+
+        return True
+
+    def dump_meta(self, meta: XmlMeta) -> bytes:
+        """Pickle the given binding metadata instance.
+
+        The field default factories are usually lambdas, which can't be
+        pickled, they are stored as references to the class fields instead.
+
+        Args:
+            meta: The binding metadata instance
+
+        Returns:
+            The pickled bytes.
+        """
+        references = {}
+        for field in self.class_type.get_fields(meta.clazz):
+            default = self.class_type.default_value(field)
+            if isinstance(default, FunctionType):
+                references[id(default)] = (meta.clazz, field.name, None)
+
+            for index, choice in enumerate(field.metadata.get("choices", ())):
+                default = self.class_type.default_choice_value(choice)
+                if isinstance(default, FunctionType):
+                    references[id(default)] = (meta.clazz, field.name, index)
+
+        output = io.BytesIO()
+        pickler = pickle.Pickler(output)
+        pickler.persistent_id = lambda obj: references.get(id(obj))  # type: ignore
+        pickler.dump(meta)
+        return output.getvalue()
+
+    def load_meta(self, value: bytes) -> XmlMeta:
+        """Unpickle a binding metadata instance.
+
+        Args:
+            value: The pickled bytes
+
+        Returns:
+            The binding metadata instance.
+        """
+
+        def persistent_load(reference: tuple) -> Any:
+            clazz, name, index = reference
+            for field in self.class_type.get_fields(clazz):
+                if field.name != name:
+                    continue
+
+                if index is None:
+                    return self.class_type.default_value(field)
+
+                choice = field.metadata["choices"][index]
+                return self.class_type.default_choice_value(choice)
+
+            raise pickle.UnpicklingError(f"Unknown field reference {reference}")
+
+        unpickler = pickle.Unpickler(io.BytesIO(value))
+        unpickler.persistent_load = persistent_load  # type: ignore
+        return unpickler.load()
+
+    def get_settings(self) -> tuple[str | None, ...]:
+        """Return the context settings that affect the binding metadata."""
+        settings = (
+            self.element_name_generator,
+            self.attribute_name_generator,
+            type(self.class_type),
+        )
+        return (
+            *(f"{x.__module__}.{getattr(x, '__qualname__', x)}" for x in settings),
+            self.models_package,
+        )
+
+    @classmethod
+    def is_picklable(cls, clazz: type) -> bool:
+        """Return whether the given class can be pickled by reference."""
+        try:
+            pickle.dumps(clazz)
+            return True
+        except (pickle.PicklingError, AttributeError, TypeError):
+            return False
+
+    @classmethod
+    def get_class_modules(cls, clazz: type) -> list[str]:
+        """Return the names of the modules the given class and its bases live in."""
+        names = {tp.__module__ for tp in clazz.__mro__}
+        names.discard("builtins")
+        return sorted(names)
+
+    @classmethod
+    def module_digest(cls, name: str) -> str | None:
+        """Return the source digest of the given module name.
+
+        Args:
+            name: The module name
+
+        Returns:
+            The hex digest or None if the module source can't be located.
+        """
+        try:
+            spec = find_spec(name)
+            if spec and spec.origin and spec.has_location:
+                return hashlib.sha256(Path(spec.origin).read_bytes()).hexdigest()
+        except (ImportError, ValueError, OSError):
+            pass
+
+        return None
+
     @classmethod
     def is_derived(cls, obj: Any, clazz: type) -> bool:
         """Return whether the obj is a subclass or a parent of the given class type."""
@@ -308,6 +672,33 @@ class XmlContext:
 
         return any(x is not object and isinstance(obj, x) for x in clazz.__bases__)
 
+    @classmethod
+    def import_class(cls, path: str) -> type:
+        """Import and return the class from the given dotted path."""
+        module, _, name = path.rpartition(".")
+        return getattr(importlib.import_module(module), name)
+
+    @classmethod
+    def get_module_classes(cls, module: Any) -> Iterator[type]:
+        """Return an iterator of the classes and inner classes defined in a module."""
+        name = getattr(module, "__name__", None)
+        try:
+            values = deque(vars(module).values())
+        except TypeError:
+            return
+
+        seen = set()
+        while values:
+            value = values.popleft()
+            if (
+                isinstance(value, type)
+                and value.__module__ == name
+                and id(value) not in seen
+            ):
+                seen.add(id(value))
+                yield value
+                values.extend(vars(value).values())
+
     @classmethod
     def get_subclasses(cls, clazz: type) -> Iterator[type]:
         """Return an iterator of the given class subclasses."""
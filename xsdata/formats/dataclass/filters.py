@@ -18,7 +18,7 @@ from xsdata.models.config import (
     ObjectType,
     OutputFormat,
 )
-from xsdata.models.enums import Tag
+from xsdata.models.enums import DataType, Tag
 from xsdata.utils import collections, namespaces, text
 from xsdata.utils.objects import literal_value
 
@@ -28,12 +28,25 @@ class Filters:
 
     DEFAULT_KEY = "default"
     FACTORY_KEY = "default_factory"
+    NUMPY_DTYPES = {
+        DataType.DOUBLE: "float64",
+        DataType.FLOAT: "float64",
+        DataType.LONG: "int64",
+        DataType.INT: "int32",
+        DataType.SHORT: "int16",
+        DataType.BYTE: "int8",
+        DataType.UNSIGNED_LONG: "uint64",
+        DataType.UNSIGNED_INT: "uint32",
+        DataType.UNSIGNED_SHORT: "uint16",
+        DataType.UNSIGNED_BYTE: "uint8",
+    }
 
     __slots__ = (
         "class_case",
         "class_safe_prefix",
         "constant_case",
         "constant_safe_prefix",
+        "constructors",
         "default_class_annotation",
         "docstring_style",
         "extensions",
@@ -45,6 +58,7 @@ class Filters:
         "max_line_length",
         "module_case",
         "module_safe_prefix",
+        "numpy_arrays",
         "package_case",
         "package_safe_prefix",
         "relative_imports",
@@ -93,6 +107,8 @@ class Filters:
         self.docstring_style: DocstringStyle = config.output.docstring_style
         self.max_line_length: int = config.output.max_line_length
         self.generic_collections: bool = config.output.generic_collections
+        self.numpy_arrays: bool = config.output.numpy_arrays
+        self.constructors: bool = config.output.constructors
         self.relative_imports: bool = config.output.relative_imports
         self.format = config.output.format
 
@@ -120,6 +136,7 @@ class Filters:
                 "class_name": self.class_name,
                 "class_bases": self.class_bases,
                 "class_annotations": self.class_annotations,
+                "class_constructor": self.class_constructor,
                 "class_params": self.class_params,
                 "format_string": self.format_string,
                 "format_docstring": self.format_docstring,
@@ -413,6 +430,56 @@ class Filters:
 
         return self.class_name(name)
 
+    def class_constructor(self, obj: Class) -> str | None:
+        """Return the constructor of the fast class factory, if enabled.
+
+        The constructor assigns the fields from the params dictionary
+        or from their default values, without calling `__init__`.
+        The subclasses are skipped, the inherited fields are only
+        known at runtime, their constructors are compiled by the
+        fast class factory.
+
+        Args:
+            obj: The class instance
+
+        Returns:
+            The classmethod source code or None.
+        """
+        if not self.constructors or obj.extensions:
+            return None
+
+        lines = [
+            "@classmethod",
+            "def __xsdata_init__(cls, params):",
+            "    self = object.__new__(cls)",
+        ]
+        for attr in obj.attrs:
+            name = self.field_name(attr.name, obj.name)
+            default = self.field_default_value(attr, obj.ns_map)
+            if attr.is_factory and str(default).startswith("lambda"):
+                default = f"({default})"
+
+            if attr.is_prohibited:
+                value = "None"
+            elif attr.fixed:
+                if default is False:
+                    continue
+                value = f"{default}()" if attr.is_factory else f"{default}"
+            elif default is False:
+                value = f'params["{name}"]'
+            elif attr.is_factory:
+                value = f'params["{name}"] if "{name}" in params else {default}()'
+            else:
+                value = f'params.get("{name}", {default})'
+
+            if self.format.frozen:
+                lines.append(f'    object.__setattr__(self, "{name}", {value})')
+            else:
+                lines.append(f"    self.{name} = {value}")
+
+        lines.append("    return self")
+        return "\n".join(lines)
+
     def post_meta_hook(self, obj: Class) -> str | None:
         """Plugin hook to render additional information after the xsdata meta class."""
         return None
@@ -737,6 +804,9 @@ class Filters:
 
     def field_default_value(self, attr: Attr, ns_map: dict | None = None) -> Any:
         """Generate the field default value/factory for the given attribute."""
+        dtype = self.field_array_dtype(attr)
+        if dtype and not attr.is_list:
+            return self.field_default_array(attr, dtype)
         if attr.is_list or (attr.is_tokens and not attr.default):
             return "tuple" if self.format.frozen else "list"
         if attr.is_dict:
@@ -795,6 +865,31 @@ class Filters:
 
         return f"lambda: {self.format_metadata(tokens, indent=8)}"
 
+    def field_default_array(self, attr: Attr, dtype: str) -> str:
+        """Generate the default value for numpy array fields."""
+        types = converter.sort_types(attr.native_types)
+        tokens = [
+            converter.deserialize(val, types) for val in (attr.default or "").split()
+        ]
+        values = self.format_metadata(tokens, indent=8) if tokens else "[]"
+        return f"lambda: numpy.array({values}, dtype=numpy.{dtype})"
+
+    def field_array_dtype(self, attr: Attr) -> str | None:
+        """Return the numpy dtype name of the given tokens attr.
+
+        Args:
+            attr: The attr instance
+
+        Returns:
+            The dtype name or None if numpy arrays are disabled,
+            or the attr is not a list of a single numeric type.
+        """
+        if not self.numpy_arrays or not attr.is_tokens:
+            return None
+
+        dtypes = {self.NUMPY_DTYPES.get(tp.datatype) for tp in attr.types}  # type: ignore
+        return dtypes.pop() if len(dtypes) == 1 else None
+
     def field_type(self, obj: Class, attr: Attr) -> str:
         """Generate type hints for the given attr."""
         if attr.is_prohibited:
@@ -806,7 +901,10 @@ class Filters:
         result = self._field_type_names(obj, attr, choice=False)
 
         iterable_fmt = self._get_iterable_format()
-        if attr.is_tokens:
+        dtype = self.field_array_dtype(attr)
+        if dtype:
+            result = f"NDArray[numpy.{dtype}]"
+        elif attr.is_tokens:
             result = iterable_fmt.format(result)
 
         if attr.is_list:
@@ -956,6 +1054,8 @@ class Filters:
             "dataclasses": {"dataclass": ["@dataclass"], "field": [" = field("]},
             "decimal": {"Decimal": type_patterns("Decimal")},
             "enum": {"Enum": ["(Enum)"]},
+            "numpy": {"__module__": ["[numpy.", "=numpy."]},
+            "numpy.typing": {"NDArray": [": NDArray[", "[NDArray["]},
             "typing": {
                 "ForwardRef": [": ForwardRef("],
                 "Any": type_patterns("Any"),
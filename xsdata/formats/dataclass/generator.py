@@ -2,6 +2,7 @@ import importlib
 import pkgutil
 import subprocess
 import sys
+from collections import defaultdict
 from collections.abc import Iterator
 from pathlib import Path
 
@@ -14,6 +15,7 @@ from xsdata.formats.dataclass.filters import Filters
 from xsdata.formats.mixins import AbstractGenerator, GeneratorResult
 from xsdata.logger import logger
 from xsdata.models.config import GeneratorConfig
+from xsdata.utils import namespaces
 
 
 class DataclassGenerator(AbstractGenerator):
@@ -30,6 +32,7 @@ class DataclassGenerator(AbstractGenerator):
     __slots__ = ("env", "filters")
 
     package_template = "package.jinja2"
+    registry_template = "registry.jinja2"
     module_template = "module.jinja2"
     enum_template = "enum.jinja2"
     service_template = "service.jinja2"
@@ -73,6 +76,14 @@ class DataclassGenerator(AbstractGenerator):
                 title="init",
                 source=src_code,
             )
+
+            if self.config.output.registry:
+                yield GeneratorResult(
+                    path=path.joinpath("_registry.py"),
+                    title="registry",
+                    source=self.render_registry(cluster),
+                )
+
             yield from self.ensure_packages(path.parent)
 
         # Generate modules
@@ -131,6 +142,34 @@ class DataclassGenerator(AbstractGenerator):
             module=module,
         )
 
+    def render_registry(self, classes: list[Class]) -> str:
+        """Render the type registry module for the given classes.
+
+        The registry maps the qualified names of the global types
+        to their class locations, it's meant to be used by the
+        XmlContext to lazily import the binding models.
+
+        Args:
+            classes: A list of class instances
+
+        Returns:
+            The rendered registry output.
+        """
+        registry = defaultdict(list)
+        for obj in sorted(classes, key=lambda x: x.name):
+            if obj.is_enumeration or obj.is_service or obj.local_type:
+                continue
+
+            qname = namespaces.build_qname(
+                obj.target_namespace, obj.meta_name or obj.name
+            )
+            class_name = self.filters.class_name(obj.name)
+            registry[qname].append(f"{obj.target_module}.{class_name}")
+
+        return self.env.get_template(self.registry_template).render(
+            registry=dict(sorted(registry.items())),
+        )
+
     def render_module(
         self,
         resolver: DependenciesResolver,
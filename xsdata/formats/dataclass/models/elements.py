@@ -6,7 +6,8 @@ import sys
 from collections.abc import Callable, Iterator, Mapping, Sequence
 from typing import Any
 
-from xsdata.formats.converter import converter
+from xsdata.formats.converter import Decoder, converter
+from xsdata.formats.dataclass.arrays import ArrayFactory
 from xsdata.models.enums import NamespaceType
 from xsdata.utils import collections
 from xsdata.utils.namespaces import build_qname, target_uri
@@ -103,11 +104,15 @@ class XmlVar(MetaMixin):
         is_wildcard: Indicates if the field represents a wildcard
         is_attribute: Indicates if the field represents an XML attribute
         is_attributes: Indicates if the field represents a sequence of XML attributes
+        decoder: The compiled value decoder of the field
+        decoder_generation: The converters generation of the compiled decoder
     """
 
     __slots__ = (
         "any_type",
         "clazz",
+        "decoder",
+        "decoder_generation",
         "default",
         "elements",
         "factory",
@@ -191,7 +196,6 @@ class XmlVar(MetaMixin):
         self.factory = factory
         self.tokens_factory = tokens_factory
 
-        self.namespace_matches: dict[str, bool] | None = None
         self.is_clazz_union = self.clazz and len(types) > 1
 
         namespace = default_namespace(namespaces)
@@ -221,6 +225,22 @@ class XmlVar(MetaMixin):
         else:
             self.is_text = True
 
+        # Created eagerly, vars are shared between threads
+        self.namespace_matches: dict[str, bool] | None = None
+        if self.is_wildcard or self.is_attributes:
+            self.namespace_matches = {}
+
+        # Compiled by the parser on demand, for the converters generation
+        self.decoder: Decoder | None = None
+        self.decoder_generation = -1
+
+    def __getstate__(self) -> tuple[None, dict[str, Any]]:
+        """Return the pickle state, without the compiled decoder."""
+        state = {name: getattr(self, name) for name in self.__slots__}
+        state["decoder"] = None
+        state["decoder_generation"] = -1
+        return None, state
+
     @property
     def element_types(self) -> set[type]:
         """Return the unique element types."""
@@ -341,9 +361,11 @@ class XmlVar(MetaMixin):
         if self.required:
             return False
 
-        if callable(self.default):
-            return self.default() == value
-        return self.default == value
+        default = self.default() if callable(self.default) else self.default
+        if isinstance(self.tokens_factory, ArrayFactory):
+            return ArrayFactory.equal(default, value)
+
+        return default == value
 
     def match_namespace(self, qname: str) -> bool:
         """Match the given qname to the wildcard allowed namespaces.
@@ -354,13 +376,14 @@ class XmlVar(MetaMixin):
         Returns:
             The bool result.
         """
-        if self.namespace_matches is None:
-            self.namespace_matches = {}
+        namespace_matches = self.namespace_matches
+        if namespace_matches is None:
+            return self._match_namespace(qname)
 
-        matches = self.namespace_matches.get(qname)
+        matches = namespace_matches.get(qname)
         if matches is None:
             matches = self._match_namespace(qname)
-            self.namespace_matches[qname] = matches
+            namespace_matches[qname] = matches
 
         return matches
 
@@ -1,10 +1,12 @@
 from xsdata.formats.dataclass.parsers.dict import DictDecoder
+from xsdata.formats.dataclass.parsers.feed import FeedParser
 from xsdata.formats.dataclass.parsers.json import JsonParser
 from xsdata.formats.dataclass.parsers.tree import TreeParser
 from xsdata.formats.dataclass.parsers.xml import UserXmlParser, XmlParser
 
 __all__ = [
     "DictDecoder",
+    "FeedParser",
     "JsonParser",
     "TreeParser",
     "UserXmlParser",
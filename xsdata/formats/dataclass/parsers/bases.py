@@ -1,4 +1,11 @@
 import copy
+from collections.abc import (
+    AsyncIterable,
+    AsyncIterator,
+    Collection,
+    Iterable,
+    Iterator,
+)
 from dataclasses import dataclass, field
 from typing import Any, cast
 
@@ -10,7 +17,7 @@ from xsdata.formats.dataclass.parsers.mixins import (
     XmlHandler,
     XmlNode,
 )
-from xsdata.formats.dataclass.parsers.utils import ParserUtils
+from xsdata.formats.dataclass.parsers.utils import ParserUtils, Projection
 from xsdata.formats.types import T
 from xsdata.models.enums import EventType
 
@@ -65,6 +72,97 @@ class NodeParser(PushParser):
         target_class = clazz.__name__ if clazz else ""
         raise ParserError(f"Failed to create target class `{target_class}`")
 
+    def iterparse(
+        self,
+        source: Any,
+        clazz: type | None = None,
+        path: str | None = None,
+        ns_map: dict[str | None, str] | None = None,
+    ) -> Iterator[Any]:
+        """Parse the input file or stream and yield the records as they complete.
+
+        The records are the elements under the given dotted field
+        path, relative to the root class, e.g. `book` or `items.item`.
+        If no path is provided, the root element children are yielded.
+
+        Every record is dropped from the intermediate objects as soon
+        as it's bound, elements outside the path are skipped and the
+        record ancestors are never bound, which keeps memory usage
+        constant, no matter the document size.
+
+        Args:
+            source: The source file or stream object to parse
+            clazz: The root class type, auto locate if omitted
+            path: The dotted field path of the records
+            ns_map: A namespace prefix-URI map to record prefixes during parsing
+
+        Yields:
+            The parsed records in document order.
+        """
+        handler = self.handler(clazz=clazz, parser=self)
+        ns_map = self.ns_map if ns_map is None else ns_map
+        names = path.split(".") if path else [None]
+        binder = RecordBinder(self, handler, names, ns_map)
+
+        try:
+            yield from binder.bind(handler.iterparse(source))
+        except SyntaxError as e:
+            raise ParserError(e)
+
+    async def aiterparse(
+        self,
+        chunks: AsyncIterable[bytes],
+        clazz: type | None = None,
+        path: str | None = None,
+        ns_map: dict[str | None, str] | None = None,
+    ) -> AsyncIterator[Any]:
+        """Parse the input chunks and yield the objects as they complete.
+
+        The chunks are fed to the handler pull parser as they
+        arrive, e.g. from a network stream, so parsing overlaps
+        with the I/O. The objects are the records under the
+        given dotted field path, relative to the root class,
+        if no path is provided the root object is yielded when
+        the document ends.
+
+        Args:
+            chunks: The async iterable of the source chunks
+            clazz: The root class type, auto locate if omitted
+            path: The dotted field path of the records
+            ns_map: A namespace prefix-URI map to record prefixes during parsing
+
+        Yields:
+            The parsed objects in document order.
+        """
+        from xsdata.formats.dataclass.parsers.feed import FeedParser
+
+        feed = FeedParser(self, clazz, path, ns_map)
+        async for chunk in chunks:
+            for obj in feed.feed(chunk):
+                yield obj
+
+        for obj in feed.close():
+            yield obj
+
+    @classmethod
+    def match_record(cls, parent: XmlNode, qname: str, name: str | None) -> bool:
+        """Return whether the child element matches the record path field name.
+
+        Args:
+            parent: The parent xml node
+            qname: The child element qualified name
+            name: The path field name, None matches all the class fields
+
+        Returns:
+            The bool result.
+        """
+        meta = getattr(parent, "meta", None)
+        if meta is None:
+            return False
+
+        vars = meta.find_children(qname)
+        return any(name is None or var.name == name for var in vars)
+
     def start(
         self,
         clazz: type | None,
@@ -113,6 +211,11 @@ class NodeParser(PushParser):
                 derived_factory = self.context.class_type.derived_element
 
             xsi_nil = ParserUtils.xsi_nil(attrs)
+            projection = self.compile_paths(self.config.projection)
+            lazy = self.compile_paths(self.config.lazy_fields)
+            for paths in (projection, lazy):
+                if paths is not None:
+                    paths.validate(meta, self.context)
 
             child = ElementNode(
                 position=0,
@@ -124,10 +227,27 @@ class NodeParser(PushParser):
                 derived_factory=derived_factory,
                 xsi_type=xsi_type if derived_factory else None,
                 xsi_nil=xsi_nil,
+                projection=projection,
+                lazy=lazy,
             )
 
         queue.append(child)
 
+    @classmethod
+    def compile_paths(cls, paths: Collection[str] | None) -> Projection | None:
+        """Compile the dotted field paths of a config option, if any.
+
+        Args:
+            paths: The dotted field paths, e.g. the config projection
+
+        Returns:
+            The projection instance or None if the option is not set.
+        """
+        if paths is None:
+            return None
+
+        return Projection.compile(frozenset(paths))
+
     def end(
         self,
         queue: list[XmlNode],
@@ -181,6 +301,90 @@ class NodeParser(PushParser):
         return clazz
 
 
+class RecordBinder:
+    """Bind the records of a dotted field path as their elements end.
+
+    The binder keeps the parsing state between calls, the
+    events can be pushed at once or in batches, as they are
+    read from an incremental parser.
+
+    Args:
+        parser: The node parser instance
+        handler: The xml handler instance
+        names: The field names of the record path, an empty
+            list binds the root object as the only record
+        ns_map: A namespace prefix-URI map to record prefixes during parsing
+
+    Attributes:
+        position: The intermediate objects length at the last record start
+    """
+
+    __slots__ = ("handler", "names", "ns_map", "parser", "position")
+
+    def __init__(
+        self,
+        parser: NodeParser,
+        handler: XmlHandler,
+        names: list[str | None],
+        ns_map: dict[str | None, str],
+    ):
+        """Initialize the binder."""
+        self.parser = parser
+        self.handler = handler
+        self.names = names
+        self.ns_map = ns_map
+        self.position = 0
+
+    def bind(self, events: Iterable[tuple]) -> Iterator[Any]:
+        """Push the events to the parser and yield the completed records.
+
+        Every record is dropped from the intermediate objects as soon
+        as it's bound, elements outside the path are skipped and the
+        record ancestors are never bound.
+
+        Args:
+            events: The start, end and start-ns event tuples
+
+        Yields:
+            The parsed records in document order.
+        """
+        from xsdata.formats.dataclass.parsers.nodes.skip import SKIP_NODE
+
+        parser = self.parser
+        clazz = self.handler.clazz
+        queue = self.handler.queue
+        objects = self.handler.objects
+        names = self.names
+        depth = len(names)
+
+        for event, *args in events:
+            if event == EventType.START:
+                qname, attrs, element_ns_map = args
+                level = len(queue)
+                if 0 < level <= depth:
+                    if not parser.match_record(queue[-1], qname, names[level - 1]):
+                        queue.append(SKIP_NODE)
+                        continue
+
+                    if level == depth:
+                        self.position = len(objects)
+
+                parser.start(clazz, queue, objects, qname, attrs, element_ns_map)
+            elif event == EventType.END:
+                qname, text, tail = args
+                level = len(queue) - 1
+                if level < depth:
+                    queue.pop()
+                elif parser.end(queue, objects, qname, text, tail) and level == depth:
+                    position = self.position
+                    records = objects[position:]
+                    del objects[position:]
+                    yield from (obj for name, obj in records if name is not None)
+            elif event == EventType.START_NS:
+                prefix, uri = args
+                parser.register_namespace(self.ns_map, prefix or None, uri)
+
+
 @dataclass
 class RecordParser(NodeParser):
     """Bind xml nodes to dataclasses and store the intermediate events.
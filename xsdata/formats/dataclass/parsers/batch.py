@@ -0,0 +1,100 @@
+import pathlib
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, NamedTuple
+
+from xsdata.exceptions import ParserError
+
+# The parser instance of the current worker process
+worker_parser: Any = None
+
+
+class ParseResult(NamedTuple):
+    """Batch parsing result transfer object.
+
+    Attributes:
+        path: The input file path
+        obj: The parsed object or None if parsing failed
+        error: The parsing error or None if parsing succeeded
+    """
+
+    path: str
+    obj: Any
+    error: ParserError | None
+
+
+def parse_many(
+    parser: Any,
+    paths: Iterable[str | pathlib.Path],
+    clazz: type | None = None,
+    workers: int | None = None,
+    chunksize: int = 1,
+) -> Iterator[ParseResult]:
+    """Parse the given files in a process pool.
+
+    The parser is sent once to every worker process, along with its
+    context settings, but not the context caches. Each worker warms
+    its own context and reuses it for all the files it parses.
+
+    Args:
+        parser: The parser instance
+        paths: The input file paths
+        clazz: The target class type, auto locate if omitted
+        workers: The number of worker processes, defaults to the
+            number of processors, if one parse in the current process
+        chunksize: The number of files sent to a worker per task
+
+    Yields:
+        The parse results in the same order as the input paths.
+    """
+    paths = [str(path) for path in paths]
+    if workers == 1:
+        for path in paths:
+            yield parse_path(parser, path, clazz)
+        return
+
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        initializer=init_worker,
+        initargs=(parser,),
+    ) as executor:
+        yield from executor.map(
+            parse_worker_path,
+            paths,
+            [clazz] * len(paths),
+            chunksize=chunksize,
+        )
+
+
+def init_worker(parser: Any) -> None:
+    """Store the parser instance of the new worker process."""
+    global worker_parser
+    worker_parser = parser
+
+
+def parse_worker_path(path: str, clazz: type | None) -> ParseResult:
+    """Parse the file with the parser of the current worker process."""
+    return parse_path(worker_parser, path, clazz)
+
+
+def parse_path(parser: Any, path: str, clazz: type | None) -> ParseResult:
+    """Parse the file and capture any error.
+
+    The errors are sent back from the worker processes, the
+    unexpected ones are converted to parser errors to make
+    sure they can be pickled.
+
+    Args:
+        parser: The parser instance
+        path: The input file path
+        clazz: The target class type, auto locate if omitted
+
+    Returns:
+        The parse result instance.
+    """
+    try:
+        return ParseResult(path, parser.parse(path, clazz), None)
+    except ParserError as e:
+        return ParseResult(path, None, e)
+    except Exception as e:
+        return ParseResult(path, None, ParserError(f"{type(e).__name__}: {e}"))
@@ -1,9 +1,15 @@
-from collections.abc import Callable
+import dataclasses
+from collections.abc import Callable, Collection
 from dataclasses import dataclass, field
 from typing import Any
+from weakref import WeakKeyDictionary
 
 from xsdata.formats.types import T
 
+# The compiled constructors of the fast class factory by class type,
+# the entries are dropped along with their classes
+CONSTRUCTORS: WeakKeyDictionary[type, Callable | None] = WeakKeyDictionary()
+
 
 def default_class_factory(cls: type[T], params: dict[str, Any]) -> T:
     """The default class factory.
@@ -20,6 +26,94 @@ def default_class_factory(cls: type[T], params: dict[str, Any]) -> T:
     return cls(**params)  # type: ignore
 
 
+def fast_class_factory(cls: type[T], params: dict[str, Any]) -> T:
+    """The fast class factory for trusted input.
+
+    The dataclasses are instantiated by a constructor, compiled once
+    per class, that assigns the params and the field defaults
+    directly, without going through the dataclass `__init__`.
+    Generated classes with a `__xsdata_init__` constructor use
+    that instead. The other classes, and the params with missing
+    required fields, fall back to the default class factory.
+
+    Args:
+        cls: The target class type to instantiate
+        params: The class keyword arguments
+
+    Returns:
+        A new class instance with the given params.
+    """
+    try:
+        init = CONSTRUCTORS[cls]
+    except KeyError:
+        init = CONSTRUCTORS[cls] = compile_constructor(cls)
+
+    if init is not None:
+        try:
+            return init(cls, params)
+        except KeyError:
+            pass
+
+    return cls(**params)  # type: ignore
+
+
+def compile_constructor(cls: type) -> Any:
+    """Compile the constructor of the fast class factory.
+
+    The constructor creates the instance without calling
+    `__init__`, and assigns every field from the params, or
+    from the field default value or factory.
+
+    Args:
+        cls: The dataclass type
+
+    Returns:
+        The constructor function, or None if the class is not a
+        dataclass, or it has a custom `__init__` or `__post_init__`.
+    """
+    init = cls.__dict__.get("__xsdata_init__")
+    if isinstance(init, classmethod):
+        return init.__func__
+
+    if (
+        not dataclasses.is_dataclass(cls)
+        or not cls.__dataclass_params__.init  # type: ignore
+        or hasattr(cls, "__post_init__")
+    ):
+        return None
+
+    frozen = cls.__dataclass_params__.frozen  # type: ignore
+    namespace: dict[str, Any] = {"new": object.__new__, "setattr": object.__setattr__}
+    lines = ["def __xsdata_init__(cls, params):", "    self = new(cls)"]
+    for index, var in enumerate(dataclasses.fields(cls)):
+        name = var.name
+        if var.default is not dataclasses.MISSING:
+            namespace[f"d{index}"] = var.default
+            if var.init:
+                value = f"params.get({name!r}, d{index})"
+            else:
+                value = f"d{index}"
+        elif var.default_factory is not dataclasses.MISSING:
+            namespace[f"f{index}"] = var.default_factory
+            if var.init:
+                value = f"params[{name!r}] if {name!r} in params else f{index}()"
+            else:
+                value = f"f{index}()"
+        elif var.init:
+            value = f"params[{name!r}]"
+        else:
+            continue
+
+        if frozen:
+            lines.append(f"    setattr(self, {name!r}, {value})")
+        else:
+            lines.append(f"    self.{name} = {value}")
+
+    lines.append("    return self")
+    exec("\n".join(lines), namespace)  # nosec
+    return namespace["__xsdata_init__"]
+
+
 @dataclass
 class ParserConfig:
     """Parsing configuration options.
@@ -35,6 +129,15 @@ class ParserConfig:
         fail_on_unknown_properties: Skip unknown properties or fail with exception
         fail_on_unknown_attributes: Skip unknown XML attributes or fail with exception
         fail_on_converter_warnings: Turn converter warnings to exceptions
+        cache_unions: Try first the resolved type of union elements with the
+            same var, first child, xsi:type and attributes, and fall back to
+            all the candidate types only if it fails
+        projection: The dotted field paths to bind, relative to the root
+            class, e.g. `book.title`, the other fields are left to their
+            defaults and their elements are skipped (xml only)
+        lazy_fields: The dotted field paths to bind on demand, relative
+            to the root class, the elements are recorded and bound the
+            first time the field is accessed (xml only)
     """
 
     base_url: str | None = None
@@ -46,3 +149,6 @@ class ParserConfig:
     fail_on_unknown_properties: bool = True
     fail_on_unknown_attributes: bool = False
     fail_on_converter_warnings: bool = False
+    cache_unions: bool = False
+    projection: Collection[str] | None = None
+    lazy_fields: Collection[str] | None = None
@@ -0,0 +1,91 @@
+from typing import Any
+
+from xsdata.exceptions import ParserError
+from xsdata.formats.dataclass.parsers.bases import NodeParser, RecordBinder
+
+
+class FeedParser:
+    """Incremental parser, fed with the chunks of a XML document.
+
+    The chunks are pushed to the pull parser of the parser handler,
+    lxml or expat, and the completed objects are bound as soon as
+    their elements end, without buffering the whole document.
+
+    Args:
+        parser: The node parser instance
+        clazz: The root class type, auto locate if omitted
+        path: The dotted field path of the records, relative to
+            the root class, if omitted the root object is the
+            only record, returned when the document is closed.
+        ns_map: A namespace prefix-URI map to record prefixes during parsing
+
+    Attributes:
+        handler: The xml handler instance
+        pull: The handler pull parser instance
+        events: The raw events generator of the pull parser
+        binder: The records binder instance
+    """
+
+    __slots__ = ("binder", "events", "handler", "pull")
+
+    def __init__(
+        self,
+        parser: NodeParser,
+        clazz: type | None = None,
+        path: str | None = None,
+        ns_map: dict[str | None, str] | None = None,
+    ):
+        """Initialize the handler pull parser and the records binder."""
+        self.handler = parser.handler(clazz=clazz, parser=parser)
+        self.pull = self.handler.create_feed()
+        self.events = self.handler.iterfeed(self.pull)
+
+        ns_map = parser.ns_map if ns_map is None else ns_map
+        names = path.split(".") if path else []
+        self.binder = RecordBinder(parser, self.handler, names, ns_map)
+
+    def feed(self, data: bytes) -> list[Any]:
+        """Feed the next chunk of the document.
+
+        Args:
+            data: The document chunk
+
+        Returns:
+            The records completed with this chunk, in document order.
+        """
+        try:
+            self.pull.feed(data)
+            return self.read()
+        except SyntaxError as e:
+            raise ParserError(e)
+
+    def close(self) -> list[Any]:
+        """Signal the end of the document.
+
+        The open elements are checked before the pull parser is
+        closed, the lxml parser recovers and closes them silently.
+
+        Returns:
+            The remaining records, in document order.
+
+        Raises:
+            ParserError: If the document is incomplete or malformed.
+        """
+        incomplete = bool(self.handler.queue)
+        try:
+            self.pull.close()
+            if incomplete:
+                raise ParserError("Incomplete document, unclosed elements")
+
+            return self.read()
+        except SyntaxError as e:
+            raise ParserError(e)
+
+    def read(self) -> list[Any]:
+        """Bind the events read so far and return the completed records.
+
+        Returns:
+            The list of completed records.
+        """
+        events = iter(self.events.__next__, None)
+        return list(self.binder.bind(events))
@@ -1,10 +1,11 @@
-from collections.abc import Iterable
+from collections.abc import Iterable, Iterator
 from typing import Any
 
 from lxml import etree
 
 from xsdata.exceptions import XmlHandlerError
-from xsdata.formats.dataclass.parsers.mixins import XmlHandler
+from xsdata.formats.dataclass.parsers.mixins import BUFFER_TYPES, XmlHandler
+from xsdata.formats.dataclass.parsers.nodes.skip import SkipNode
 from xsdata.models.enums import EventType
 
 EVENTS = (EventType.START, EventType.END, EventType.START_NS)
@@ -18,28 +19,189 @@ class LxmlEventHandler(XmlHandler):
 
         Args:
             source: The xml source, can be a file resource or an input stream,
-                or a lxml tree/element.
+                a memoryview or mmap, or a lxml tree/element.
             ns_map: A namespace prefix-URI recorder map
 
         Returns:
             An instance of the class type representing the parsed content.
         """
+        return self.process_context(self.create_context(source), ns_map)
+
+    def iterparse(self, source: Any) -> Iterator[tuple]:
+        """Parse the source XML document and yield the raw events.
+
+        The finished elements and their preceding siblings are
+        released from the tree as soon as the consumer resumes,
+        so memory usage doesn't grow with the document size.
+
+        Args:
+            source: The xml source, can be a file resource or an input stream,
+                a memoryview or mmap, or a lxml tree/element.
+
+        Yields:
+            The start, end and start-ns event tuples.
+        """
+        yield from self.iterevents(self.create_context(source))
+
+    def iterfeed(self, feed: etree.XMLPullParser) -> Iterator[tuple | None]:
+        """Yield the raw events of the pull parser as the chunks are fed.
+
+        The generator never ends, it yields None every time the
+        events read so far are exhausted and resumes with the
+        events of the next chunks.
+
+        Args:
+            feed: The lxml pull parser instance
+
+        Yields:
+            The start, end and start-ns event tuples, or None.
+        """
+        while True:
+            yield from self.iterevents(feed.read_events())
+            yield None
+
+    def iterevents(self, context: Iterable[tuple[str, Any]]) -> Iterator[tuple]:
+        """Convert the lxml events context to raw events.
+
+        When the consumer queues a skip node for a starting element,
+        the subtree events are consumed here, only the end event of
+        the skipped element and the namespace events are yielded.
+
+        Args:
+            context: The iterable lxml context
+
+        Yields:
+            The start, end and start-ns event tuples.
+        """
+        queue = self.queue
+        skip = self.parser.skip_subtrees
+        depth = self.skip_depth
+        element_ns_map: dict = {}
+        for event, element in context:
+            if depth:
+                if event == EventType.START:
+                    depth += 1
+                    continue
+
+                if event == EventType.END:
+                    depth -= 1
+                    if depth:
+                        element.clear()
+                        continue
+                elif event == EventType.START_NS:
+                    prefix, uri = element
+                    yield event, prefix, uri
+                    continue
+
+            if event == EventType.START:
+                yield (
+                    event,
+                    element.tag,
+                    element.attrib,
+                    self.element_ns_map(element, element_ns_map),
+                )
+                element_ns_map = {}
+                if skip and queue and isinstance(queue[-1], SkipNode):
+                    depth = 1
+            elif event == EventType.END:
+                yield event, element.tag, element.text, element.tail
+                element.clear()
+                parent = element.getparent()
+                if parent is not None:
+                    while element.getprevious() is not None:
+                        del parent[0]
+            elif event == EventType.START_NS:
+                prefix, uri = element
+                element_ns_map[prefix or None] = uri
+                yield event, prefix, uri
+            else:
+                raise XmlHandlerError(f"Unhandled event: `{event}`.")
+
+        self.skip_depth = depth
+
+    def create_context(self, source: Any) -> Iterable[tuple[str, Any]]:
+        """Create the lxml events context for the source.
+
+        Args:
+            source: The xml source, can be a file resource or an input stream,
+                a memoryview or mmap, or a lxml tree/element.
+
+        Returns:
+            The iterable lxml context.
+        """
         if isinstance(source, (etree._ElementTree, etree._Element)):
-            ctx = etree.iterwalk(source, EVENTS)
-        elif self.parser.config.process_xinclude:
-            tree = etree.parse(source, base_url=self.parser.config.base_url)  # nosec
+            return etree.iterwalk(source, EVENTS)
+
+        if self.parser.config.process_xinclude:
+            if isinstance(source, BUFFER_TYPES):
+                tree = self.feed_tree(source)
+            else:
+                tree = etree.parse(source, base_url=self.parser.config.base_url)  # nosec
             tree.xinclude()
-            ctx = etree.iterwalk(tree, EVENTS)
-        else:
-            ctx = etree.iterparse(
-                source,
-                EVENTS,
-                recover=True,
-                remove_comments=True,
-                load_dtd=self.parser.config.load_dtd,
-            )
-
-        return self.process_context(ctx, ns_map)
+            return etree.iterwalk(tree, EVENTS)
+
+        if isinstance(source, BUFFER_TYPES):
+            return self.feed_context(source)
+
+        return etree.iterparse(
+            source,
+            EVENTS,
+            recover=True,
+            remove_comments=True,
+            load_dtd=self.parser.config.load_dtd,
+        )
+
+    def create_feed(self) -> etree.XMLPullParser:
+        """Create the lxml pull parser to feed the XML document in chunks.
+
+        Returns:
+            The lxml pull parser instance.
+        """
+        return etree.XMLPullParser(
+            EVENTS,
+            recover=True,
+            remove_comments=True,
+            load_dtd=self.parser.config.load_dtd,
+        )
+
+    def feed_context(self, source: Any) -> Iterator[tuple[str, Any]]:
+        """Feed the in-memory source in chunks and yield the lxml events.
+
+        The lxml feed parser only accepts bytes, every chunk
+        is copied on its own, never the whole document.
+
+        Args:
+            source: The memoryview or mmap source
+
+        Yields:
+            The event and element tuples, like the iterparse context.
+        """
+        parser = self.create_feed()
+        for chunk in self.read_chunks(source):
+            parser.feed(chunk.tobytes())
+            yield from parser.read_events()
+
+        parser.close()
+        yield from parser.read_events()
+
+    def feed_tree(self, source: Any) -> etree._ElementTree:
+        """Feed the in-memory source in chunks and return the parsed tree.
+
+        Args:
+            source: The memoryview or mmap source
+
+        Returns:
+            The parsed lxml tree, with the config base url.
+        """
+        parser = etree.XMLParser()
+        for chunk in self.read_chunks(source):
+            parser.feed(chunk.tobytes())
+
+        tree = parser.close().getroottree()
+        if self.parser.config.base_url:
+            tree.docinfo.URL = self.parser.config.base_url
+
+        return tree
 
     def process_context(
         self,
@@ -48,6 +210,10 @@ class LxmlEventHandler(XmlHandler):
     ) -> Any:
         """Iterate context and push events to main parser.
 
+        The subtree of an element queued as a skip node is
+        consumed here without calling the parser, until the
+        end of the skipped element.
+
         Args:
             context: The iterable lxml context
             ns_map: A namespace prefix-URI recorder map
@@ -55,19 +221,41 @@ class LxmlEventHandler(XmlHandler):
         Returns:
             An instance of the class type representing the parsed content.
         """
+        queue = self.queue
+        skip = self.parser.skip_subtrees
+        depth = 0
+        element_ns_map: dict = {}
         for event, element in context:
+            if depth:
+                if event == EventType.START:
+                    depth += 1
+                    continue
+
+                if event == EventType.END:
+                    depth -= 1
+                    if depth:
+                        element.clear()
+                        continue
+                elif event == EventType.START_NS:
+                    prefix, uri = element
+                    self.parser.register_namespace(ns_map, prefix or None, uri)
+                    continue
+
             if event == EventType.START:
                 self.parser.start(
                     self.clazz,
-                    self.queue,
+                    queue,
                     self.objects,
                     element.tag,
                     element.attrib,
-                    element.nsmap,
+                    self.element_ns_map(element, element_ns_map),
                 )
+                element_ns_map = {}
+                if skip and isinstance(queue[-1], SkipNode):
+                    depth = 1
             elif event == EventType.END:
                 self.parser.end(
-                    self.queue,
+                    queue,
                     self.objects,
                     element.tag,
                     element.text,
@@ -76,8 +264,31 @@ class LxmlEventHandler(XmlHandler):
                 element.clear()
             elif event == EventType.START_NS:
                 prefix, uri = element
-                self.parser.register_namespace(ns_map, prefix or None, uri)
+                prefix = prefix or None
+                element_ns_map[prefix] = uri
+                self.parser.register_namespace(ns_map, prefix, uri)
             else:
                 raise XmlHandlerError(f"Unhandled event: `{event}`.")
 
         return self.objects[-1][1] if self.objects else None
+
+    def element_ns_map(
+        self, element: etree._Element, ns_map: dict[str | None, str]
+    ) -> dict:
+        """Return the namespace prefix-URI map of the starting element.
+
+        The first element reads the lxml map, which includes the
+        declarations of the ancestors of walked subtrees, the rest
+        merge their own declarations with the parent node map.
+
+        Args:
+            element: The starting lxml element
+            ns_map: The element namespace declarations
+
+        Returns:
+            The element namespace prefix-URI map.
+        """
+        if not self.queue:
+            return element.nsmap
+
+        return self.merge_parent_namespaces(ns_map)
@@ -6,7 +6,8 @@ from xml.etree import ElementInclude as xinclude
 from xml.etree import ElementTree as etree
 
 from xsdata.exceptions import XmlHandlerError
-from xsdata.formats.dataclass.parsers.mixins import XmlHandler
+from xsdata.formats.dataclass.parsers.mixins import BUFFER_TYPES, XmlHandler
+from xsdata.formats.dataclass.parsers.nodes.skip import SkipNode
 from xsdata.models.enums import EventType
 from xsdata.utils import namespaces
 
@@ -21,34 +22,210 @@ class XmlEventHandler(XmlHandler):
 
         Args:
             source: The xml source, can be a file resource or an input stream,
-                or a xml tree/element.
+                a memoryview or mmap, or a xml tree/element.
             ns_map: A namespace prefix-URI recorder map
 
         Returns:
             An instance of the class type representing the parsed content.
         """
+        return self.process_context(self.create_context(source), ns_map)
+
+    def iterparse(self, source: Any) -> Iterator[tuple]:
+        """Parse the source XML document and yield the raw events.
+
+        When the source is parsed incrementally, the finished elements
+        are released from the tree as soon as the consumer resumes,
+        so memory usage doesn't grow with the document size.
+
+        Args:
+            source: The xml source, can be a file resource or an input stream,
+                a memoryview or mmap, or a xml tree/element.
+
+        Yields:
+            The start, end and start-ns event tuples.
+        """
+        release = not (
+            isinstance(source, (etree.Element, etree.ElementTree))
+            or self.parser.config.process_xinclude
+        )
+        elements = [] if release else None
+        yield from self.iterevents(self.create_context(source), elements)
+
+    def iterfeed(self, feed: etree.XMLPullParser) -> Iterator[tuple | None]:
+        """Yield the raw events of the pull parser as the chunks are fed.
+
+        The generator never ends, it yields None every time the
+        events read so far are exhausted and resumes with the
+        events of the next chunks.
+
+        Args:
+            feed: The xml pull parser instance
+
+        Yields:
+            The start, end and start-ns event tuples, or None.
+        """
+        elements: list = []
+        while True:
+            yield from self.iterevents(feed.read_events(), elements)
+            yield None
+
+    def iterevents(
+        self,
+        context: Iterable[tuple[str, Any]],
+        elements: list | None,
+    ) -> Iterator[tuple]:
+        """Convert the xml events context to raw events.
+
+        The open elements stack is used to release the finished
+        elements from their parents, it's kept by the caller to
+        resume with the events of the next chunks. Expat reports
+        the namespace declarations of an element along with its
+        start tag, they never span two contexts.
+
+        When the consumer queues a skip node for a starting element,
+        the subtree events are consumed here, only the end event of
+        the skipped element and the namespace events are yielded.
+
+        Args:
+            context: The iterable xml context
+            elements: The open elements stack, None to keep the tree intact
+
+        Yields:
+            The start, end and start-ns event tuples.
+        """
+        queue = self.queue
+        skip = self.parser.skip_subtrees
+        depth = self.skip_depth
+        element_ns_map: dict = {}
+        for event, element in context:
+            if depth:
+                if event == EventType.START:
+                    depth += 1
+                    continue
+
+                if event == EventType.END:
+                    depth -= 1
+                    if depth:
+                        element.clear()
+                        continue
+                elif event == EventType.START_NS:
+                    prefix, uri = element
+                    yield event, prefix or None, uri
+                    continue
+
+            if event == EventType.START:
+                yield (
+                    event,
+                    element.tag,
+                    element.attrib,
+                    self.merge_parent_namespaces(element_ns_map),
+                )
+                element_ns_map = {}
+                if elements is not None:
+                    elements.append(element)
+                if skip and queue and isinstance(queue[-1], SkipNode):
+                    depth = 1
+            elif event == EventType.END:
+                yield event, element.tag, element.text, element.tail
+                element.clear()
+                if elements:
+                    elements.pop()
+                    if elements:
+                        elements[-1].remove(element)
+            elif event == EventType.START_NS:
+                prefix, uri = element
+                prefix = prefix or None
+                element_ns_map[prefix] = uri
+                yield event, prefix, uri
+            else:
+                raise XmlHandlerError(f"Unhandled event: `{event}`.")
+
+        self.skip_depth = depth
+
+    def create_context(self, source: Any) -> Iterable[tuple[str, Any]]:
+        """Create the xml events context for the source.
+
+        The memoryview and mmap sources are fed to the expat
+        parser in chunks, directly from the source buffer.
+
+        Args:
+            source: The xml source, can be a file resource or an input stream,
+                a memoryview or mmap, or a xml tree/element.
+
+        Returns:
+            The iterable xml context.
+        """
         if isinstance(source, etree.ElementTree):
             source = source.getroot()
 
         if isinstance(source, etree.Element):
-            ctx = iterwalk(source, {})
-        elif self.parser.config.process_xinclude:
-            root = etree.parse(source).getroot()  # nosec
+            return iterwalk(source, {})
+
+        if self.parser.config.process_xinclude:
+            if isinstance(source, BUFFER_TYPES):
+                root = self.feed_tree(source)
+            else:
+                root = etree.parse(source).getroot()  # nosec
             base_url = get_base_url(self.parser.config.base_url, source)
             loader = functools.partial(xinclude_loader, base_url=base_url)
 
             xinclude.include(root, loader=loader)
-            ctx = iterwalk(root, {})
-        else:
-            ctx = etree.iterparse(source, EVENTS)  # nosec
+            return iterwalk(root, {})
+
+        if isinstance(source, BUFFER_TYPES):
+            return self.feed_context(source)
+
+        return etree.iterparse(source, EVENTS)  # nosec
+
+    def create_feed(self) -> etree.XMLPullParser:
+        """Create the xml pull parser to feed the XML document in chunks.
+
+        Returns:
+            The xml pull parser instance.
+        """
+        return etree.XMLPullParser(EVENTS)  # nosec
+
+    def feed_context(self, source: Any) -> Iterator[tuple[str, Any]]:
+        """Feed the in-memory source in chunks and yield the xml events.
+
+        Args:
+            source: The memoryview or mmap source
+
+        Yields:
+            The event and element tuples, like the iterparse context.
+        """
+        parser = self.create_feed()
+        for chunk in self.read_chunks(source):
+            parser.feed(chunk)
+            yield from parser.read_events()
+
+        parser.close()
+        yield from parser.read_events()
 
-        return self.process_context(ctx, ns_map)
+    def feed_tree(self, source: Any) -> etree.Element:
+        """Feed the in-memory source in chunks and return the root element.
+
+        Args:
+            source: The memoryview or mmap source
+
+        Returns:
+            The root element of the parsed tree.
+        """
+        parser = etree.XMLParser()  # nosec
+        for chunk in self.read_chunks(source):
+            parser.feed(chunk)
+
+        return parser.close()
 
     def process_context(
         self, context: Iterable[tuple[str, Any]], ns_map: dict[str | None, str]
     ) -> Any:
         """Iterate context and push events to main parser.
 
+        The subtree of an element queued as a skip node is
+        consumed here without calling the parser, until the
+        end of the skipped element.
+
         Args:
             context: The iterable xml context
             ns_map: A namespace prefix-URI recorder map
@@ -56,21 +233,41 @@ class XmlEventHandler(XmlHandler):
         Returns:
             An instance of the class type representing the parsed content.
         """
+        queue = self.queue
+        skip = self.parser.skip_subtrees
+        depth = 0
         element_ns_map: dict = {}
         for event, element in context:
+            if depth:
+                if event == EventType.START:
+                    depth += 1
+                    continue
+
+                if event == EventType.END:
+                    depth -= 1
+                    if depth:
+                        element.clear()
+                        continue
+                elif event == EventType.START_NS:
+                    prefix, uri = element
+                    self.parser.register_namespace(ns_map, prefix or None, uri)
+                    continue
+
             if event == EventType.START:
                 self.parser.start(
                     self.clazz,
-                    self.queue,
+                    queue,
                     self.objects,
                     element.tag,
                     element.attrib,
                     self.merge_parent_namespaces(element_ns_map),
                 )
                 element_ns_map = {}
+                if skip and isinstance(queue[-1], SkipNode):
+                    depth = 1
             elif event == EventType.END:
                 self.parser.end(
-                    self.queue,
+                    queue,
                     self.objects,
                     element.tag,
                     element.text,
@@ -88,32 +285,6 @@ class XmlEventHandler(XmlHandler):
 
         return self.objects[-1][1] if self.objects else None
 
-    def merge_parent_namespaces(self, ns_map: dict[str | None, str]) -> dict:
-        """Merge the given prefix-URI map with the parent node map.
-
-        This method also registers new prefixes with the parser.
-
-        Args:
-            ns_map: The current element namespace prefix-URI map
-
-        Returns:
-            The new merged namespace prefix-URI map.
-        """
-        if self.queue:
-            parent_ns_map = self.queue[-1].ns_map
-
-            if not ns_map:
-                return parent_ns_map
-
-            result = parent_ns_map.copy() if parent_ns_map else {}
-        else:
-            result = {}
-
-        for prefix, uri in ns_map.items():
-            result[prefix] = uri
-
-        return result
-
 
 def iterwalk(element: etree.Element, ns_map: dict) -> Iterator[tuple[str, Any]]:
     """Walk over the element tree and emit events.
@@ -1,11 +1,14 @@
 import io
 import json
+import mmap
 import pathlib
-from collections.abc import Callable
+from collections.abc import Callable, Iterable, Iterator
 from dataclasses import dataclass, field
 from typing import Any
 
 from xsdata.formats.dataclass.parsers import DictDecoder
+from xsdata.formats.dataclass.parsers.batch import ParseResult, parse_many
+from xsdata.formats.dataclass.parsers.mixins import BUFFER_TYPES
 from xsdata.formats.types import T
 
 
@@ -51,21 +54,54 @@ class JsonParser(DictDecoder):
         """
         return self.from_bytes(source.encode(), clazz)
 
-    def from_bytes(self, source: bytes, clazz: type[T] | None = None) -> T:
+    def from_bytes(
+        self,
+        source: bytes | memoryview | mmap.mmap,
+        clazz: type[T] | None = None,
+    ) -> T:
         """Parse the input source bytes object into the target class type.
 
         If no clazz is provided, the binding context will try
         to locate it from imported dataclasses.
 
         Args:
-            source: The source bytes object to parse
+            source: The source bytes object, memoryview or mmap to parse
             clazz: The target class type to parse the source bytes object
 
         Returns:
             An instance of the specified class representing the parsed content.
         """
+        if isinstance(source, BUFFER_TYPES):
+            return self.parse(source, clazz)
+
         return self.parse(io.BytesIO(source), clazz)
 
+    def parse_many(
+        self,
+        paths: Iterable[str | pathlib.Path],
+        clazz: type[T] | None = None,
+        workers: int | None = None,
+        chunksize: int = 1,
+    ) -> Iterator[ParseResult]:
+        """Parse the input files in parallel with a process pool.
+
+        Every worker process receives a copy of the parser with
+        an empty context, which is warmed once and reused for all
+        the files of the worker. The errors are reported per file
+        and don't abort the batch.
+
+        Args:
+            paths: The paths to the input files
+            clazz: The target class type to parse the files into
+            workers: The number of worker processes, defaults to the
+                number of processors, if one parse in the current process
+            chunksize: The number of files sent to a worker per task
+
+        Yields:
+            The parse results, in the same order as the input paths.
+        """
+        yield from parse_many(self, paths, clazz, workers, chunksize)
+
     def parse(self, source: Any, clazz: type[T] | None = None) -> T:
         """Parse the input stream into the target class type.
 
@@ -85,12 +121,20 @@ class JsonParser(DictDecoder):
     def load_json(self, source: Any) -> dict | list:
         """Load the given json source filename or stream.
 
+        The json loaders need the whole document, the memoryview
+        and mmap sources are read once into a bytes object, which
+        is the only copy of the source.
+
         Args:
-            source: A file name or file stream
+            source: A file name, file stream, memoryview or mmap
 
         Returns:
             The loaded dictionary or list of dictionaries.
         """
+        if isinstance(source, BUFFER_TYPES):
+            with memoryview(source) as view:
+                return self.load_factory(io.BytesIO(view))
+
         if not hasattr(source, "read"):
             with open(source, "rb") as fp:
                 return self.load_factory(fp)
@@ -2,15 +2,21 @@ from __future__ import annotations
 
 import abc
 import io
+import mmap
 import pathlib
+from collections.abc import Iterable, Iterator
 from dataclasses import dataclass, field
-from typing import Any
+from typing import Any, ClassVar
 
 from xsdata.exceptions import XmlHandlerError
+from xsdata.formats.dataclass.parsers.batch import ParseResult, parse_many
 from xsdata.formats.dataclass.parsers.config import ParserConfig
 from xsdata.formats.types import T
 from xsdata.models.enums import EventType
 
+# The in-memory sources the handlers read in chunks without a copy
+BUFFER_TYPES = (memoryview, mmap.mmap)
+
 
 @dataclass
 class PushParser:
@@ -21,8 +27,12 @@ class PushParser:
 
     Attributes:
         ns_map: The parsed namespace prefix-URI map
+        skip_subtrees: Whether the handlers consume the subtrees
+            of the skipped elements without pushing their events
     """
 
+    skip_subtrees: ClassVar[bool] = True
+
     config: ParserConfig = field(default_factory=ParserConfig)
     ns_map: dict[str | None, str] = field(init=False, default_factory=dict)
 
@@ -70,7 +80,7 @@ class PushParser:
 
     def from_bytes(
         self,
-        source: bytes,
+        source: bytes | memoryview | mmap.mmap,
         clazz: type[T] | None = None,
         ns_map: dict[str | None, str] | None = None,
     ) -> T:
@@ -79,16 +89,49 @@ class PushParser:
         If no clazz is provided, the binding context will try
         to locate it from imported dataclasses.
 
+        The memoryview and mmap sources are fed to the
+        underlying xml parser in chunks, without copying
+        the whole document in memory.
+
         Args:
-            source: The source bytes object to parse
+            source: The source bytes object, memoryview or mmap to parse
             clazz: The target class type to parse the source bytes object
             ns_map: A namespace prefix-URI map to record prefixes during parsing
 
         Returns:
             An instance of the specified class representing the parsed content.
         """
+        if isinstance(source, BUFFER_TYPES):
+            return self.parse(source, clazz, ns_map)
+
         return self.parse(io.BytesIO(source), clazz, ns_map)
 
+    def parse_many(
+        self,
+        paths: Iterable[str | pathlib.Path],
+        clazz: type[T] | None = None,
+        workers: int | None = None,
+        chunksize: int = 1,
+    ) -> Iterator[ParseResult]:
+        """Parse the input files in parallel with a process pool.
+
+        Every worker process receives a copy of the parser with
+        an empty context, which is warmed once and reused for all
+        the files of the worker. The errors are reported per file
+        and don't abort the batch.
+
+        Args:
+            paths: The paths to the input files
+            clazz: The target class type to parse the files into
+            workers: The number of worker processes, defaults to the
+                number of processors, if one parse in the current process
+            chunksize: The number of files sent to a worker per task
+
+        Yields:
+            The parse results, in the same order as the input paths.
+        """
+        yield from parse_many(self, paths, clazz, workers, chunksize)
+
     @abc.abstractmethod
     def parse(
         self,
@@ -231,9 +274,19 @@ class XmlHandler:
     Attributes:
         queue: The XmlNode queue list
         objects: The list of intermediate parsed objects
+        skip_depth: The open elements of the skipped subtree,
+            between the event contexts of an incremental parser
+        ns_cache: The merged namespace prefix-URI maps by their
+            parent map and the element declarations
     """
 
-    __slots__ = ("clazz", "objects", "parser", "queue")
+    __slots__ = ("clazz", "ns_cache", "objects", "parser", "queue", "skip_depth")
+
+    # The number of bytes fed to the xml parser at once for in-memory sources
+    chunk_size = 64 * 1024
+
+    # The max number of merged namespace prefix-URI maps to keep
+    ns_cache_size = 256
 
     def __init__(self, parser: PushParser, clazz: type | None):
         """Initialize the handler."""
@@ -241,6 +294,8 @@ class XmlHandler:
         self.clazz = clazz
         self.queue: list = []
         self.objects: list = []
+        self.skip_depth = 0
+        self.ns_cache: dict[tuple, tuple[dict, dict]] = {}
 
     def parse(self, source: Any, ns_map: dict[str | None, str]) -> Any:
         """Parse the source XML document.
@@ -254,6 +309,101 @@ class XmlHandler:
         """
         raise NotImplementedError("This method must be implemented!")
 
+    def merge_parent_namespaces(self, ns_map: dict[str | None, str]) -> dict:
+        """Merge the given prefix-URI map with the parent node map.
+
+        The namespace maps are shared between the nodes and never
+        modified after they are merged. The elements without new
+        declarations, or with redeclarations of the parent prefixes,
+        reuse the parent map. The siblings with the same declarations
+        reuse the same merged map.
+
+        Args:
+            ns_map: The current element namespace prefix-URI map
+
+        Returns:
+            The merged namespace prefix-URI map.
+        """
+        if not self.queue:
+            return dict(ns_map)
+
+        parent_ns_map = self.queue[-1].ns_map
+        if not ns_map:
+            return parent_ns_map
+
+        items = tuple(ns_map.items())
+        if all(parent_ns_map.get(prefix) == uri for prefix, uri in items):
+            return parent_ns_map
+
+        key = (id(parent_ns_map), items)
+        cached = self.ns_cache.get(key)
+        if cached is not None and cached[0] is parent_ns_map:
+            return cached[1]
+
+        if len(self.ns_cache) >= self.ns_cache_size:
+            self.ns_cache.clear()
+
+        result = {**parent_ns_map, **ns_map}
+        self.ns_cache[key] = (parent_ns_map, result)
+        return result
+
+    def iterparse(self, source: Any) -> Iterator[tuple]:
+        """Parse the source XML document and yield the raw events.
+
+        The events are yielded in the same format the
+        events handler consumes, the caller is responsible
+        to push them to the main parser.
+
+        Args:
+            source: The xml source, can be a file resource or an input stream.
+
+        Yields:
+            The start, end and start-ns event tuples.
+        """
+        raise NotImplementedError("This method must be implemented!")
+
+    def create_feed(self) -> Any:
+        """Create the pull parser to feed the XML document in chunks.
+
+        Returns:
+            The pull parser instance.
+        """
+        raise NotImplementedError("This method must be implemented!")
+
+    def iterfeed(self, feed: Any) -> Iterator[tuple | None]:
+        """Yield the raw events of the pull parser as the chunks are fed.
+
+        The generator never ends, it yields None every time the
+        events read so far are exhausted and resumes with the
+        events of the next chunks.
+
+        Args:
+            feed: The pull parser instance
+
+        Yields:
+            The start, end and start-ns event tuples, or None.
+        """
+        raise NotImplementedError("This method must be implemented!")
+
+    def read_chunks(self, source: memoryview | mmap.mmap) -> Iterator[memoryview]:
+        """Yield the source bytes in chunks without copying them.
+
+        Every chunk is a view on the source buffer that is
+        released as soon as the consumer resumes, so the
+        source mmap can be closed after parsing.
+
+        Args:
+            source: The in-memory source buffer
+
+        Yields:
+            The memoryview chunks of the source.
+        """
+        with memoryview(source) as view, view.cast("B") as data:
+            size = self.chunk_size
+            for start in range(0, len(data), size):
+                with data[start : start + size] as chunk:
+                    yield chunk
+
 
 class EventsHandler(XmlHandler):
     """Sax content handler for pre-recorded events."""
@@ -289,3 +439,14 @@ class EventsHandler(XmlHandler):
                 raise XmlHandlerError(f"Unhandled event: `{event}`.")
 
         return self.objects[-1][1] if self.objects else None
+
+    def iterparse(self, source: list[tuple]) -> Iterator[tuple]:
+        """Yield the pre-recorded events.
+
+        Args:
+            source: A list of event data
+
+        Yields:
+            The start, end and start-ns event tuples.
+        """
+        yield from source
@@ -1,4 +1,5 @@
 from xsdata.formats.dataclass.parsers.nodes.element import ElementNode
+from xsdata.formats.dataclass.parsers.nodes.lazy import LazyNode
 from xsdata.formats.dataclass.parsers.nodes.primitive import PrimitiveNode
 from xsdata.formats.dataclass.parsers.nodes.skip import SkipNode
 from xsdata.formats.dataclass.parsers.nodes.standard import StandardNode
@@ -8,6 +9,7 @@ from xsdata.formats.dataclass.parsers.nodes.wrapper import WrapperNode
 
 __all__ = [
     "ElementNode",
+    "LazyNode",
     "PrimitiveNode",
     "SkipNode",
     "StandardNode",
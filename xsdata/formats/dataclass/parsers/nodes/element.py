@@ -10,7 +10,13 @@ from xsdata.formats.dataclass.models.elements import XmlMeta, XmlVar
 from xsdata.formats.dataclass.parsers import nodes
 from xsdata.formats.dataclass.parsers.config import ParserConfig
 from xsdata.formats.dataclass.parsers.mixins import XmlNode
-from xsdata.formats.dataclass.parsers.utils import ParserUtils, PendingCollection
+from xsdata.formats.dataclass.parsers.nodes.lazy import LazyValue, lazy_class
+from xsdata.formats.dataclass.parsers.nodes.skip import SKIP_NODE
+from xsdata.formats.dataclass.parsers.utils import (
+    ParserUtils,
+    PendingCollection,
+    Projection,
+)
 from xsdata.logger import logger
 from xsdata.models.enums import DataType, Namespace
 from xsdata.utils.namespaces import target_uri
@@ -31,12 +37,18 @@ class ElementNode(XmlNode):
         derived_factory: Derived element factory
         xsi_type: The xml type substitution
         xsi_nil: Specifies whether element has the xsi:nil attribute
+        projection: The projection of the class fields to bind,
+            None binds all the fields
+        lazy: The class fields to bind on demand, None binds
+            all the fields right away
 
     Attributes:
-        assigned: A set to store the processed sub-nodes
+        assigned: A set to store the processed sub-nodes, created
+            with the first unique sub-node
         tail_processed: Whether the tail process is consumed
         wrappers: A mapping of child item qname to the queue of wrapper
-            qnames the items were parsed under, in document order
+            qnames the items were parsed under, in document order,
+            created with the first wrapped child
     """
 
     __slots__ = (
@@ -45,10 +57,12 @@ class ElementNode(XmlNode):
         "config",
         "context",
         "derived_factory",
+        "lazy",
         "meta",
         "mixed",
         "ns_map",
         "position",
+        "projection",
         "tail_processed",
         "wrappers",
         "xsi_nil",
@@ -67,6 +81,8 @@ class ElementNode(XmlNode):
         derived_factory: type | None = None,
         xsi_type: str | None = None,
         xsi_nil: bool | None = None,
+        projection: Projection | None = None,
+        lazy: Projection | None = None,
     ):
         """Initialize the xml node."""
         self.meta = meta
@@ -79,13 +95,15 @@ class ElementNode(XmlNode):
         self.derived_factory = derived_factory
         self.xsi_type = xsi_type
         self.xsi_nil = xsi_nil
-        self.assigned: set[int] = set()
+        self.projection = projection
+        self.lazy = lazy
+        self.assigned: set[int] | None = None
         self.tail_processed: bool = False
         # Queue of wrapper qnames per child item qname, recorded in document
         # order as children are built. It lets binding disambiguate sibling
         # wrappers that reuse the same item element name (e.g. two wrappers
         # whose items are both named ``Property``).
-        self.wrappers: dict[str, list[str]] = {}
+        self.wrappers: dict[str, list[str]] | None = None
 
     def bind(
         self,
@@ -114,7 +132,12 @@ class ElementNode(XmlNode):
             params: dict = {}
             self.bind_attrs(params)
             self.bind_content(params, text, tail, objects)
-            obj = self.config.class_factory(self.meta.clazz, params)
+            if self.projection is not None:
+                for name in self.projection.find_missing(self.meta):
+                    params[name] = None
+
+            clazz = self.meta.clazz if self.lazy is None else self.lazy_class(params)
+            obj = self.config.class_factory(clazz, params)
 
         if self.derived_factory:
             obj = self.derived_factory(qname=qname, value=obj, type=self.xsi_type)
@@ -128,6 +151,37 @@ class ElementNode(XmlNode):
 
         return True
 
+    def lazy_class(self, params: dict) -> type:
+        """Return the proxy class of the lazy fields, if any were parsed.
+
+        The lists of lazy values are kept in pending
+        collections, until the field is accessed.
+
+        Args:
+            params: The class parameters
+
+        Returns:
+            The proxy class type, or the original class type.
+        """
+        names = []
+        for name, fields in self.lazy.fields.items():  # type: ignore
+            value = params.get(name)
+            if fields is not None or value is None:
+                continue
+
+            if isinstance(value, LazyValue):
+                names.append(name)
+            elif type(value) in (list, tuple) and any(
+                isinstance(item, LazyValue) for item in value
+            ):
+                params[name] = PendingCollection(value, type(value))
+                names.append(name)
+
+        if not names:
+            return self.meta.clazz
+
+        return lazy_class(self.meta.clazz, tuple(names))
+
     def bind_content(
         self,
         params: dict,
@@ -144,6 +198,9 @@ class ElementNode(XmlNode):
             objects: The list of intermediate parsed objects
         """
         wild_var = self.meta.find_any_wildcard()
+        if wild_var and not self.is_projected(wild_var):
+            wild_var = None
+
         if wild_var and wild_var.mixed:
             self.bind_mixed_objects(params, wild_var, objects)
             bind_text = False
@@ -175,22 +232,31 @@ class ElementNode(XmlNode):
         if not self.attrs:
             return
 
+        plan = self.context.compile(self.meta)
         for qname, value in self.attrs.items():
-            var = self.meta.find_attribute(qname)
+            var, any_var = plan.find_attribute(qname)
             if var and var.name not in params:
-                self.bind_attr(params, var, value)
-            else:
-                var = self.meta.find_any_attributes(qname)
-                if var:
-                    self.bind_any_attr(params, var, qname, value)
-                else:
-                    if (
-                        self.config.fail_on_unknown_attributes
-                        and target_uri(qname) != Namespace.XSI.uri
-                    ):
-                        raise ParserError(
-                            f"Unknown attribute {self.meta.qname}:{qname}"
-                        )
+                if self.is_projected(var):
+                    self.bind_attr(params, var, value)
+            elif any_var:
+                if self.is_projected(any_var):
+                    self.bind_any_attr(params, any_var, qname, value)
+            elif (
+                self.config.fail_on_unknown_attributes
+                and target_uri(qname) != Namespace.XSI.uri
+            ):
+                raise ParserError(f"Unknown attribute {self.meta.qname}:{qname}")
+
+    def is_projected(self, var: XmlVar) -> bool:
+        """Return whether the var is included in the node projection.
+
+        Args:
+            var: The xml var instance
+
+        Returns:
+            The bool result.
+        """
+        return self.projection is None or var.name in self.projection.fields
 
     def bind_attr(self, params: dict, var: XmlVar, value: Any) -> None:
         """Parse an element attribute.
@@ -285,7 +351,7 @@ class ElementNode(XmlNode):
         Returns:
             The wrapper qualified name or None if the child isn't wrapped.
         """
-        wrappers = self.wrappers.get(qname)
+        wrappers = self.wrappers.get(qname) if self.wrappers else None
         if wrappers:
             return wrappers.pop(0)
 
@@ -400,6 +466,9 @@ class ElementNode(XmlNode):
         if not var or (text is None and not self.xsi_nil):
             return False
 
+        if not self.is_projected(var):
+            return True
+
         if self.xsi_nil and not text:
             value = None
         else:
@@ -495,27 +564,49 @@ class ElementNode(XmlNode):
         Raises:
             ParserError: If the child element is unknown
         """
-        for var in self.meta.find_children(qname):
+        plan = self.context.compile(self.meta)
+        projection = self.projection
+        for var, unique, factory in plan.find_children(qname):
             if wrapper and var.wrapper_qname != wrapper:
                 continue
 
-            unique = 0 if not var.is_element or var.list_element else var.index
-            if not unique or unique not in self.assigned:
-                node = self.build_node(qname, var, attrs, ns_map, position)
+            if not unique or not self.assigned or unique not in self.assigned:
+                if projection is not None and var.name not in projection.fields:
+                    if unique:
+                        if self.assigned is None:
+                            self.assigned = set()
+                        self.assigned.add(unique)
+
+                    return SKIP_NODE
+
+                node = self.build_node(qname, var, attrs, ns_map, position, factory)
 
                 if node:
                     if unique:
+                        if self.assigned is None:
+                            self.assigned = set()
                         self.assigned.add(unique)
 
                     if wrapper:
+                        if self.wrappers is None:
+                            self.wrappers = {}
                         self.wrappers.setdefault(qname, []).append(wrapper)
 
+                    if isinstance(node, ElementNode):
+                        if projection is not None:
+                            node.projection = projection.fields[var.name]
+
+                        if self.lazy is not None and var.name in self.lazy.fields:
+                            node.lazy = self.lazy.fields[var.name]
+                            if node.lazy is None:
+                                return nodes.LazyNode(node)
+
                     return node
 
         if self.config.fail_on_unknown_properties:
             raise ParserError(f"Unknown property {self.meta.qname}:{qname}")
 
-        return nodes.SkipNode()
+        return SKIP_NODE
 
     def build_node(
         self,
@@ -524,6 +615,7 @@ class ElementNode(XmlNode):
         attrs: dict,
         ns_map: dict,
         position: int,
+        factory: str | None = None,
     ) -> XmlNode | None:
         """Build the next child node based on the xml var instance.
 
@@ -533,42 +625,128 @@ class ElementNode(XmlNode):
             attrs: The element attributes
             ns_map: The element namespace prefix-URI map
             position: The current length of the intermediate objects
+            factory: The builder method name from the binding plan,
+                resolved from the var if omitted
 
         Returns:
             The next child node instance, or None if nothing matched
             the starting element.
         """
-        if var.is_clazz_union:
-            return nodes.UnionNode(
-                meta=self.meta,
-                var=var,
-                attrs=attrs,
-                ns_map=ns_map,
-                config=self.config,
-                context=self.context,
-                position=position,
-            )
+        if factory is None:
+            factory = BindingPlan.node_factory(var)
+
+        return getattr(self, factory)(qname, var, attrs, ns_map, position)
+
+    def build_union_node(
+        self,
+        qname: str,
+        var: XmlVar,
+        attrs: dict,
+        ns_map: dict,
+        position: int,
+    ) -> XmlNode | None:
+        """Build the next child node for a union of data classes var.
 
+        Args:
+            qname: The element qualified name
+            var: The xml var instance
+            attrs: The element attributes
+            ns_map: The element namespace prefix-URI map
+            position: The current length of the intermediate objects
+
+        Returns:
+            The next union node instance.
+        """
+        return nodes.UnionNode(
+            meta=self.meta,
+            var=var,
+            attrs=attrs,
+            ns_map=ns_map,
+            config=self.config,
+            context=self.context,
+            position=position,
+        )
+
+    def build_clazz_node(
+        self,
+        qname: str,
+        var: XmlVar,
+        attrs: dict,
+        ns_map: dict,
+        position: int,
+    ) -> XmlNode | None:
+        """Build the next child node for a data class var.
+
+        Args:
+            qname: The element qualified name
+            var: The xml var instance
+            attrs: The element attributes
+            ns_map: The element namespace prefix-URI map
+            position: The current length of the intermediate objects
+
+        Returns:
+            The next element node instance, or None if the var
+            class doesn't match the starting element.
+        """
+        return self.build_element_node(
+            var.clazz,  # type: ignore
+            False,
+            var.nillable,
+            attrs,
+            ns_map,
+            position,
+            self.context.class_type.derived_element,
+            ParserUtils.xsi_type(attrs, ns_map),
+            ParserUtils.xsi_nil(attrs),
+        )
+
+    def build_primitive_node(
+        self,
+        qname: str,
+        var: XmlVar,
+        attrs: dict,
+        ns_map: dict,
+        position: int,
+    ) -> XmlNode | None:
+        """Build the next child node for a simple type var.
+
+        Args:
+            qname: The element qualified name
+            var: The xml var instance
+            attrs: The element attributes
+            ns_map: The element namespace prefix-URI map
+            position: The current length of the intermediate objects
+
+        Returns:
+            The next primitive node instance.
+        """
+        return nodes.PrimitiveNode(self.meta, var, ns_map, self.config)
+
+    def build_any_node(
+        self,
+        qname: str,
+        var: XmlVar,
+        attrs: dict,
+        ns_map: dict,
+        position: int,
+    ) -> XmlNode | None:
+        """Build the next child node for an any type or wildcard var.
+
+        Args:
+            qname: The element qualified name
+            var: The xml var instance
+            attrs: The element attributes
+            ns_map: The element namespace prefix-URI map
+            position: The current length of the intermediate objects
+
+        Returns:
+            The next child node instance, based on the element
+            xsi:type and qualified name.
+        """
         xsi_type = ParserUtils.xsi_type(attrs, ns_map)
         xsi_nil = ParserUtils.xsi_nil(attrs)
         derived_factory = self.context.class_type.derived_element
 
-        if var.clazz:
-            return self.build_element_node(
-                var.clazz,
-                False,
-                var.nillable,
-                attrs,
-                ns_map,
-                position,
-                derived_factory,
-                xsi_type,
-                xsi_nil,
-            )
-
-        if not var.any_type and not var.is_wildcard:
-            return nodes.PrimitiveNode(self.meta, var, ns_map, self.config)
-
         datatype = DataType.from_qname(xsi_type) if xsi_type else None
         derived = var.is_wildcard
         if datatype:
@@ -680,3 +858,103 @@ class ElementNode(XmlNode):
             xsi_nil=xsi_nil,
             mixed=self.meta.mixed_content,
         )
+
+
+class BindingPlan:
+    """The compiled binding instructions of a class.
+
+    The plan resolves once per qualified name the matching
+    class vars and how to build their child nodes, and the
+    attribute vars, so that element nodes don't have to
+    re-evaluate the class metadata for every element.
+
+    The lookup tables are filled lazily with values that
+    are always the same for a key, the plan can be shared
+    between threads without locking.
+
+    Args:
+        meta: The class binding metadata instance
+
+    Attributes:
+        children: A mapping of qualified names to the matching
+            vars with their unique index and builder method name
+        attributes: A mapping of qualified names to the matching
+            attribute and wildcard attribute vars
+        unions: A mapping of union element signatures to the
+            resolved candidate types
+    """
+
+    __slots__ = ("attributes", "children", "meta", "unions")
+
+    def __init__(self, meta: XmlMeta):
+        """Initialize the binding plan."""
+        self.meta = meta
+        self.children: dict[str, tuple[tuple[XmlVar, int, str], ...]] = {}
+        self.attributes: dict[str, tuple[XmlVar | None, XmlVar | None]] = {}
+        self.unions: dict[tuple, type] = {}
+
+    def find_children(self, qname: str) -> tuple[tuple[XmlVar, int, str], ...]:
+        """Return the vars, unique index and builder name for the child qname.
+
+        The unique index is zero for the vars that can be
+        assigned more than once.
+
+        Args:
+            qname: The namespace qualified name
+
+        Returns:
+            A tuple of all the class vars that match the given qname.
+        """
+        children = self.children.get(qname)
+        if children is None:
+            children = tuple(
+                (
+                    var,
+                    0 if not var.is_element or var.list_element else var.index,
+                    self.node_factory(var),
+                )
+                for var in self.meta.find_children(qname)
+            )
+            self.children[qname] = children
+
+        return children
+
+    def find_attribute(self, qname: str) -> tuple[XmlVar | None, XmlVar | None]:
+        """Return the attribute and wildcard attribute vars for the qname.
+
+        Args:
+            qname: The namespace qualified name
+
+        Returns:
+            A tuple of the attribute var and the wildcard attribute var.
+        """
+        attribute = self.attributes.get(qname)
+        if attribute is None:
+            attribute = (
+                self.meta.find_attribute(qname),
+                self.meta.find_any_attributes(qname),
+            )
+            self.attributes[qname] = attribute
+
+        return attribute
+
+    @classmethod
+    def node_factory(cls, var: XmlVar) -> str:
+        """Return the element node method name that builds the var child node.
+
+        Args:
+            var: The xml var instance
+
+        Returns:
+            The element node method name.
+        """
+        if var.is_clazz_union:
+            return "build_union_node"
+
+        if var.clazz:
+            return "build_clazz_node"
+
+        if not var.any_type and not var.is_wildcard:
+            return "build_primitive_node"
+
+        return "build_any_node"
@@ -0,0 +1,204 @@
+import functools
+from typing import Any
+
+from xsdata.formats.dataclass.parsers.bases import NodeParser
+from xsdata.formats.dataclass.parsers.mixins import EventsHandler, XmlNode
+from xsdata.formats.dataclass.parsers.utils import PendingCollection
+from xsdata.models.enums import EventType
+
+
+class LazyNode(XmlNode):
+    """XmlNode for the deferred child elements.
+
+    The node records the events of the element subtree, without
+    building any child nodes or objects, and binds a lazy value
+    that replays them the first time the field is accessed.
+
+    Args:
+        node: The child node that would bind the element
+
+    Attributes:
+        events: The recorded child events
+        ns_maps: The namespace prefix-URI maps of the open elements
+    """
+
+    __slots__ = ("events", "node", "ns_maps")
+
+    def __init__(self, node: Any):
+        """Initialize the xml node."""
+        self.node = node
+        self.events: list[tuple] = []
+        self.ns_maps: list[dict] = [node.ns_map]
+
+    @property
+    def ns_map(self) -> dict:
+        """The namespace prefix-URI map of the last open element."""
+        return self.ns_maps[-1]
+
+    def child(self, qname: str, attrs: dict, ns_map: dict, position: int) -> XmlNode:
+        """Record the start event of the child element.
+
+        The attributes are copied, the handlers might
+        reuse or clear them after the element ends.
+
+        Args:
+            qname: The element qualified name
+            attrs: The element attributes
+            ns_map: The element namespace prefix-URI map
+            position: The current length of the intermediate objects
+
+        Returns:
+            The same lazy node instance.
+        """
+        self.ns_maps.append(ns_map)
+        self.events.append((EventType.START, qname, dict(attrs), ns_map))
+        return self
+
+    def bind(
+        self,
+        qname: str,
+        text: str | None,
+        tail: str | None,
+        objects: list[Any],
+    ) -> bool:
+        """Record the end event and bind the lazy value.
+
+        Args:
+            qname: The element qualified name
+            text: The element text content
+            tail: The element tail content
+            objects: The list of intermediate parsed objects
+
+        Returns:
+            Whether the lazy value was bound, False for the child elements.
+        """
+        if len(self.ns_maps) > 1:
+            self.ns_maps.pop()
+            self.events.append((EventType.END, qname, text, tail))
+            return False
+
+        self.events.append((EventType.END, qname, text, None))
+        objects.append((qname, LazyValue(self.node, self.events)))
+        return True
+
+
+class LazyValue:
+    """A deferred child element, bound on demand.
+
+    Args:
+        node: The child node that binds the element
+        events: The recorded child events
+
+    Attributes:
+        obj: The bound object, once the events are replayed
+    """
+
+    __slots__ = ("events", "node", "obj")
+
+    def __init__(self, node: Any, events: list[tuple]):
+        """Initialize the lazy value."""
+        node.position = 0
+        node.attrs = dict(node.attrs)
+        self.node: Any = node
+        self.events: list[tuple] | None = events
+        self.obj: Any = None
+
+    def bind(self) -> Any:
+        """Replay the recorded events to the child node.
+
+        The events and the child node are released
+        after the first call.
+
+        Returns:
+            The bound object.
+        """
+        if self.events is not None:
+            parser = NodeParser(config=self.node.config, context=self.node.context)
+            handler = EventsHandler(parser=parser, clazz=None)
+            handler.queue.append(self.node)
+            self.obj = handler.parse(self.events, parser.ns_map)
+            self.events = self.node = None
+
+        return self.obj
+
+    @classmethod
+    def evaluate(cls, value: Any) -> Any:
+        """Bind the lazy value, other values are returned as they are.
+
+        Args:
+            value: A lazy value or an already bound value
+
+        Returns:
+            The bound object.
+        """
+        return value.bind() if isinstance(value, LazyValue) else value
+
+
+class LazyField:
+    """The descriptor of a lazy field of a proxy class.
+
+    The field value is bound and replaced the first time
+    it's accessed, the lazy values of list fields are kept
+    in a pending collection until then.
+
+    Args:
+        name: The field name
+    """
+
+    __slots__ = ("name",)
+
+    def __init__(self, name: str):
+        """Initialize the descriptor."""
+        self.name = name
+
+    def __get__(self, instance: Any, owner: type) -> Any:
+        """Bind the field value on the first access."""
+        if instance is None:
+            return self
+
+        values = instance.__dict__
+        value = values[self.name]
+        if isinstance(value, LazyValue):
+            value = values[self.name] = value.bind()
+        elif isinstance(value, PendingCollection):
+            value = values[self.name] = value.factory(map(LazyValue.evaluate, value))
+
+        return value
+
+    def __set__(self, instance: Any, value: Any) -> None:
+        """Set the field value."""
+        instance.__dict__[self.name] = value
+
+
+@functools.lru_cache(maxsize=50)
+def lazy_class(clazz: type, names: tuple[str, ...]) -> type:
+    """Create the proxy class for the given lazy field names.
+
+    The proxy class extends the original class and
+    reports it as its `__class__`, the instances are
+    compared, copied and serialized like the original
+    class instances.
+
+    Args:
+        clazz: The original class type
+        names: The lazy field names
+
+    Returns:
+        The proxy class type.
+    """
+
+    def reduce(self: Any, protocol: Any) -> Any:
+        for name in names:
+            getattr(self, name)
+
+        func, args, *rest = clazz.__reduce_ex__(self, protocol)
+        return (func, (clazz, *args[1:]), *rest)
+
+    namespace: dict[str, Any] = {name: LazyField(name) for name in names}
+    namespace.update(
+        __class__=property(lambda self: clazz),
+        __module__=clazz.__module__,
+        __qualname__=clazz.__qualname__,
+        __reduce_ex__=reduce,
+    )
+    return type(clazz.__name__, (clazz,), namespace)
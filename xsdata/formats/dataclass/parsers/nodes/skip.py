@@ -2,7 +2,11 @@ from xsdata.formats.dataclass.parsers.mixins import XmlNode
 
 
 class SkipNode(XmlNode):
-    """Utility node to skip parsing unknown properties."""
+    """Utility node to skip parsing unknown properties.
+
+    The node is stateless, the parsers queue the
+    shared instance for every skipped element.
+    """
 
     __slots__ = "ns_map"
 
@@ -19,3 +23,7 @@ class SkipNode(XmlNode):
     ) -> bool:
         """Skip nodes are not building any objects."""
         return False
+
+
+# The shared skip node instance
+SKIP_NODE = SkipNode()
@@ -1,27 +1,35 @@
-import copy
 import functools
 from contextlib import suppress
 from dataclasses import replace
 from typing import Any
 
-from xsdata.exceptions import ParserError
+from xsdata.exceptions import ConverterError, ParserError
 from xsdata.formats.dataclass.context import XmlContext
 from xsdata.formats.dataclass.models.elements import XmlMeta, XmlVar
 from xsdata.formats.dataclass.parsers.bases import NodeParser
 from xsdata.formats.dataclass.parsers.config import ParserConfig
-from xsdata.formats.dataclass.parsers.mixins import EventsHandler, XmlNode
+from xsdata.formats.dataclass.parsers.mixins import XmlNode
 from xsdata.formats.dataclass.parsers.utils import ParserUtils
+from xsdata.models.enums import EventType
 from xsdata.utils.namespaces import target_uri
 
 
 class UnionNode(XmlNode):
     """XmlNode for union fields with at least one data class.
 
-    The node will record all child events and in the end will replay
-    them and try to build all possible objects and sort them by score
-    before deciding the winner.
+    The node starts a parser for every candidate type and feeds
+    them all the child events as they arrive. Candidates that fail
+    to handle an event are dropped, and in the end the node sorts
+    the remaining objects by score before deciding the winner.
+
+    If the union cache is enabled, the winner type is cached per
+    var, first child qualified name, xsi:type and attributes, and
+    later elements with the same signature are fed first only to
+    that type. The events of these elements are recorded, if the
+    cached type fails they are fed to all the candidate types.
 
     Args:
+        meta: The parent xml meta instance
         var: The xml var instance
         attrs: The element attributes
         ns_map: The element namespace prefix-URI map
@@ -29,8 +37,20 @@ class UnionNode(XmlNode):
             this position are considered children of this node.
         config: The parser config instance
         context: The xml context instance
+
+    Attributes:
+        level: The current depth of the child elements
+        candidates: The candidate types, filtered by fixed attributes
+        parsers: The candidate types with their parser, queue and
+            objects list, the parser is None for primitive types
+        signature: The cache key of the element
+        events: The recorded child events, if the element
+            is fed only to the cached type
+        cache_size: The max number of cached signatures per class
     """
 
+    cache_size = 1024
+
     __slots__ = (
         "attrs",
         "candidates",
@@ -40,7 +60,9 @@ class UnionNode(XmlNode):
         "level",
         "meta",
         "ns_map",
+        "parsers",
         "position",
+        "signature",
         "var",
     )
 
@@ -64,7 +86,9 @@ class UnionNode(XmlNode):
         self.context = context
         self.level = 0
         self.candidates = self.filter_candidates()
-        self.events: list[tuple[str, str, Any, Any]] = []
+        self.parsers: list[tuple[type, NodeParser | None, list, list]] | None = None
+        self.signature: tuple | None = None
+        self.events: list[tuple] | None = None
 
     def filter_candidates(self) -> list[type]:
         """Filter union candidates by fixed attributes."""
@@ -98,13 +122,107 @@ class UnionNode(XmlNode):
 
         return True
 
+    def start_parsers(self, qname: str | None) -> None:
+        """Start a parser for every candidate type.
+
+        If the union cache is enabled and the element signature
+        has already been resolved, start only the cached type
+        and record the child events.
+
+        Args:
+            qname: The first child element qualified name, if any
+        """
+        candidates = self.candidates
+        if self.config.cache_unions and qname:
+            plan = self.context.compile(self.meta)
+            self.signature = self.build_signature(qname)
+            cached = plan.unions.get(self.signature)
+            if cached:
+                candidates = [cached]
+                self.events = []
+
+        self.build_parsers(candidates)
+
+    def build_signature(self, qname: str) -> tuple:
+        """Return the union cache key of the element.
+
+        Args:
+            qname: The first child element qualified name
+
+        Returns:
+            The var index, child qname, xsi:type and attributes tuple.
+        """
+        xsi_type = None
+        with suppress(ConverterError):
+            xsi_type = ParserUtils.xsi_type(self.attrs, self.ns_map)
+
+        return self.var.index, qname, xsi_type, frozenset(self.attrs.items())
+
+    def build_parsers(self, candidates: list[type]) -> None:
+        """Start a parser for each of the given candidate types.
+
+        Args:
+            candidates: The candidate types
+        """
+        config = replace(
+            self.config,
+            fail_on_converter_warnings=True,
+            projection=None,
+            lazy_fields=None,
+        )
+        parent_namespace = target_uri(self.var.qname)
+        self.parsers = []
+        for candidate in candidates:
+            if not self.context.class_type.is_model(candidate):
+                self.parsers.append((candidate, None, [], []))
+                continue
+
+            with suppress(Exception):
+                self.context.build(candidate, parent_ns=parent_namespace)
+                parser = NodeParser(config=config, context=self.context)
+                queue: list = []
+                objects: list = []
+                parser.start(
+                    candidate,
+                    queue,
+                    objects,
+                    self.var.qname,
+                    self.attrs,
+                    self.ns_map,
+                )
+                self.parsers.append((candidate, parser, queue, objects))
+
+    def feed(self, event: str, *args: Any) -> None:
+        """Push the event to the candidate parsers.
+
+        The candidates that fail to handle the event are dropped.
+
+        Args:
+            event: The event type start|end
+            *args: The parser start or end method arguments
+        """
+        parsers = []
+        for candidate, parser, queue, objects in self.parsers or ():
+            if parser:
+                try:
+                    if event == EventType.START:
+                        parser.start(candidate, queue, objects, *args)
+                    else:
+                        parser.end(queue, objects, *args)
+                except Exception:
+                    continue
+
+            parsers.append((candidate, parser, queue, objects))
+
+        self.parsers = parsers
+
     def child(self, qname: str, attrs: dict, ns_map: dict, position: int) -> XmlNode:
-        """Record the event for the child element.
+        """Feed the start event of the child element to the candidates.
 
-        This entry point records all events, as it's not possible
+        This entry point forwards all events, as it's not possible
         to detect the target parsed object type just yet. When
-        this node ends, it will replay all events and attempt
-        to find the best matching type for the parsed object.
+        this node ends, it will find the best matching type for
+        the parsed object.
 
         Args:
             qname: The element qualified name
@@ -112,8 +230,14 @@ class UnionNode(XmlNode):
             ns_map: The element namespace prefix-URI map
             position: The current length of the intermediate objects
         """
+        if self.parsers is None:
+            self.start_parsers(qname)
+
+        if self.events is not None:
+            self.events.append((EventType.START, qname, dict(attrs), ns_map))
+
         self.level += 1
-        self.events.append(("start", qname, copy.deepcopy(attrs), ns_map))
+        self.feed(EventType.START, qname, attrs, ns_map)
         return self
 
     def bind(
@@ -126,8 +250,8 @@ class UnionNode(XmlNode):
         """Bind the parsed data into an object for the ending element.
 
         This entry point is called when a xml element ends and is
-        responsible to replay all xml events and parse/bind all
-        the children objects.
+        responsible to end all candidate parsers and pick the best
+        parsed object.
 
         Args:
             qname: The element qualified name
@@ -141,32 +265,66 @@ class UnionNode(XmlNode):
 
         Raises:
             ParserError: If none of the candidate types matched
-                the replayed events.
+                the element events.
         """
-        self.events.append(("end", qname, text, tail))
-
         if self.level > 0:
+            if self.events is not None:
+                self.events.append((EventType.END, qname, text, tail))
+
+            self.feed(EventType.END, qname, text, tail)
             self.level -= 1
             return False
 
-        self.events.insert(0, ("start", qname, copy.deepcopy(self.attrs), self.ns_map))
+        if self.parsers is None:
+            self.start_parsers(None)
+
+        obj, winner = self.resolve(qname, text, tail)
+        if not obj and self.events is not None:
+            # The cached type failed, replay the events to all candidates
+            events, self.events = self.events, None
+            self.build_parsers(self.candidates)
+            for event, *args in events:
+                self.feed(event, *args)
+
+            obj, winner = self.resolve(qname, text, tail)
+
+        if obj:
+            if self.signature:
+                unions = self.context.compile(self.meta).unions
+                if self.signature in unions or len(unions) < self.cache_size:
+                    unions[self.signature] = winner
+
+            objects.append((self.var.qname, obj))
+
+            return True
+
+        raise ParserError(f"Failed to parse union node: {self.var.qname}")
+
+    def resolve(
+        self, qname: str, text: str | None, tail: str | None
+    ) -> tuple[Any, type | None]:
+        """End the candidate parsers and pick the best parsed object.
 
+        Args:
+            qname: The element qualified name
+            text: The element text content
+            tail: The element tail content
+
+        Returns:
+            The best parsed object and its candidate type, or
+            None, None if none of the candidates matched.
+        """
         obj = None
+        winner = None
         max_score = -1.0
-        parent_namespace = target_uri(qname)
         config = replace(self.config, fail_on_converter_warnings=True)
 
-        for candidate in self.candidates:
+        for candidate, parser, queue, parsed in self.parsers or ():
             result: Any = None
             with suppress(Exception):
-                if self.context.class_type.is_model(candidate):
-                    self.context.build(candidate, parent_ns=parent_namespace)
-                    parser = NodeParser(
-                        config=config,
-                        context=self.context,
-                        handler=EventsHandler,
-                    )
-                    result = parser.parse(self.events, candidate)
+                if parser:
+                    parser.end(queue, parsed, qname, text, tail)
+                    result = parsed[0][1]
                 else:
                     result = ParserUtils.parse_var(
                         meta=self.meta,
@@ -181,10 +339,6 @@ class UnionNode(XmlNode):
             if score > max_score:
                 max_score = score
                 obj = result
+                winner = candidate
 
-        if obj:
-            objects.append((self.var.qname, obj))
-
-            return True
-
-        raise ParserError(f"Failed to parse union node: {self.var.qname}")
+        return obj, winner
@@ -1,11 +1,17 @@
+from __future__ import annotations
+
+import functools
 import math
 import warnings
 from collections import UserList
 from collections.abc import Callable, Iterable, Sequence
+from contextlib import suppress
 from typing import Any
 
 from xsdata.exceptions import ConverterError, ConverterWarning, ParserError
 from xsdata.formats.converter import QNameConverter, converter
+from xsdata.formats.dataclass.arrays import ArrayFactory
+from xsdata.formats.dataclass.context import XmlContext
 from xsdata.formats.dataclass.models.elements import XmlMeta, XmlVar
 from xsdata.formats.dataclass.parsers.config import ParserConfig
 from xsdata.models.enums import QNames
@@ -47,6 +53,129 @@ class PendingCollection(UserList):
         return self.factory(self.data)
 
 
+class Projection:
+    """The compiled dotted field paths of a parser projection.
+
+    Args:
+        fields: A mapping of the projected field names to the
+            projection of their own fields, None binds the whole field
+
+    Attributes:
+        missing: The names of the fields outside the projection
+            without a default value, per class type
+        checked: The class types the field names are validated against
+    """
+
+    __slots__ = ("checked", "fields", "missing")
+
+    def __init__(self, fields: dict[str, Projection | None]):
+        """Initialize the projection."""
+        self.fields = fields
+        self.missing: dict[type, tuple[str, ...]] = {}
+        self.checked: set[type] = set()
+
+    @classmethod
+    @functools.lru_cache(maxsize=50)
+    def compile(cls, paths: frozenset[str]) -> Projection:
+        """Group the dotted field paths by their first field name.
+
+        A field path without any nested names binds the whole
+        field, even if other paths project its own fields.
+
+        Args:
+            paths: The dotted field paths, e.g. `book.title`
+
+        Returns:
+            The projection instance.
+        """
+        groups: dict[str, set[str] | None] = {}
+        for path in paths:
+            name, _, rest = path.partition(".")
+            if not rest:
+                groups[name] = None
+            elif groups.get(name, ()) is not None:
+                groups.setdefault(name, set()).add(rest)  # type: ignore
+
+        return cls(
+            {
+                name: None if rest is None else cls.compile(frozenset(rest))
+                for name, rest in groups.items()
+            }
+        )
+
+    def validate(self, meta: XmlMeta, context: XmlContext, path: str = "") -> None:
+        """Validate the projected field names against the class metadata.
+
+        The nested field names have to match at least one of
+        the model types of their parent field.
+
+        Args:
+            meta: The class binding metadata instance
+            context: The models context instance
+            path: The dotted path of the parent field, if any
+
+        Raises:
+            ParserError: If a field path doesn't match the class fields.
+        """
+        if meta.clazz in self.checked:
+            return
+
+        variables = {var.name: var for var in meta.get_all_vars()}
+        for name, nested in self.fields.items():
+            var = variables.get(name)
+            if var is None:
+                raise ParserError(f"Unknown projection field {path}{name}")
+
+            if nested is not None:
+                nested.validate_types(var, context, f"{path}{name}.")
+
+        self.checked.add(meta.clazz)
+
+    def validate_types(self, var: XmlVar, context: XmlContext, path: str) -> None:
+        """Validate the projected field names against the var model types.
+
+        Args:
+            var: The parent xml var instance
+            context: The models context instance
+            path: The dotted path of the parent field
+
+        Raises:
+            ParserError: If a field path doesn't match any model type.
+        """
+        error = ParserError(f"Unknown projection field {path}{next(iter(self.fields))}")
+        for tp in var.types:
+            if context.class_type.is_model(tp):
+                try:
+                    return self.validate(context.build(tp), context, path)
+                except ParserError as e:
+                    error = e
+
+        raise error
+
+    def find_missing(self, meta: XmlMeta) -> tuple[str, ...]:
+        """Return the init fields outside the projection without a default value.
+
+        These fields are set to None, so that the class can be
+        initialized without their elements.
+
+        Args:
+            meta: The class binding metadata instance
+
+        Returns:
+            A tuple of field names.
+        """
+        missing = self.missing.get(meta.clazz)
+        if missing is None:
+            missing = tuple(
+                var.name
+                for var in meta.get_all_vars()
+                if var.init and var.default is None and var.name not in self.fields
+            )
+            self.missing[meta.clazz] = missing
+
+        return missing
+
+
 class ParserUtils:
     """Random parser util functions."""
 
@@ -111,14 +240,17 @@ class ParserUtils:
             The converted value or values.
         """
         try:
-            value = cls.parse_value(
-                value=value,
-                types=types or var.types,
-                default=default or var.default,
-                ns_map=ns_map,
-                tokens_factory=tokens_factory or var.tokens_factory,
-                format=format or var.format,
-            )
+            if types or tokens_factory or format:
+                value = cls.parse_value(
+                    value=value,
+                    types=types or var.types,
+                    default=default or var.default,
+                    ns_map=ns_map,
+                    tokens_factory=tokens_factory or var.tokens_factory,
+                    format=format or var.format,
+                )
+            else:
+                value = cls.decode_value(var, value, default or var.default, ns_map)
         except ConverterError as ex:
             message = (
                 "Failed to convert value for "
@@ -163,6 +295,10 @@ class ParserUtils:
 
         if tokens_factory:
             value = value if collections.is_array(value) else value.split()
+            if isinstance(tokens_factory, ArrayFactory):
+                with suppress(ValueError, TypeError, OverflowError):
+                    return tokens_factory.decode(value)
+
             return tokens_factory(
                 converter.deserialize(val, types, ns_map=ns_map, format=format)
                 for val in value
@@ -170,6 +306,77 @@ class ParserUtils:
 
         return converter.deserialize(value, types, ns_map=ns_map, format=format)
 
+    @classmethod
+    def decode_value(
+        cls,
+        var: XmlVar,
+        value: Any,
+        default: Any | None = None,
+        ns_map: dict | None = None,
+    ) -> Any:
+        """Convert a value to a python primitive type with the var decoder.
+
+        The decoder is compiled once per var, from its types,
+        format and tokens factory, and again only if the
+        converters registry changes.
+
+        Args:
+            var: The xml var instance
+            value: A primitive value or a list of primitive values
+            default: The default value/factory if the given is None
+            ns_map: The element namespace prefix-URI map
+
+        Returns:
+            The converted value or values.
+        """
+        if value is None:
+            if callable(default):
+                return default() if var.tokens_factory else None
+
+            return default
+
+        if var.decoder_generation != converter.generation:
+            cls.compile_decoder(var)
+
+        return var.decoder(value, ns_map)  # type: ignore
+
+    @classmethod
+    def compile_decoder(cls, var: XmlVar):
+        """Compile and store the value decoder of the given var.
+
+        NumPy array fields are decoded in bulk by the array factory,
+        the tokens are converted one by one only to report failures.
+
+        Args:
+            var: The xml var instance
+        """
+        generation = converter.generation
+        tokens_factory = var.tokens_factory
+
+        if isinstance(tokens_factory, ArrayFactory):
+            decode_tokens = converter.tokens_decoder(var.types, var.format)
+            decode_array = tokens_factory.decode
+
+            def decoder(value: Any, ns_map: dict | None) -> Any:
+                value = value if collections.is_array(value) else value.split()
+                try:
+                    return decode_array(value)
+                except (ValueError, TypeError, OverflowError):
+                    return tokens_factory(decode_tokens(value, ns_map))
+
+        elif tokens_factory:
+            decode_tokens = converter.tokens_decoder(var.types, var.format)
+
+            def decoder(value: Any, ns_map: dict | None) -> Any:
+                value = value if collections.is_array(value) else value.split()
+                return tokens_factory(decode_tokens(value, ns_map))
+
+        else:
+            decoder = converter.decoder(var.types, var.format)
+
+        var.decoder = decoder
+        var.decoder_generation = generation
+
     @classmethod
     def normalize_content(cls, value: str | None) -> str | None:
         """Normalize element text or tail content.
@@ -1,5 +1,5 @@
 from dataclasses import dataclass, field
-from typing import Any
+from typing import Any, ClassVar
 
 from xsdata.formats.dataclass.parsers.bases import NodeParser, Parsed
 from xsdata.formats.dataclass.parsers.handlers import default_handler
@@ -42,8 +42,12 @@ class UserXmlParser(NodeParser):
         hooks_cache: The hooks cache is used to avoid
             inspecting the class for custom methods
             on duplicate events.
+        skip_subtrees: Disabled, the hooks are triggered for
+            the unknown elements and their children as well
     """
 
+    skip_subtrees: ClassVar[bool] = False
+
     handler: type[XmlHandler] = field(default=default_handler())
     hooks_cache: dict = field(init=False, default_factory=dict)
 
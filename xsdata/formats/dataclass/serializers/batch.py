@@ -0,0 +1,207 @@
+from collections import deque
+from collections.abc import Iterable, Iterator
+from concurrent.futures import Future, ProcessPoolExecutor
+from io import StringIO, TextIOBase
+from itertools import islice
+from os import cpu_count
+from typing import Any
+
+from xsdata.formats.dataclass.serializers.mixins import EventIterator, XmlWriterEvent
+from xsdata.formats.dataclass.serializers.writers.string import XmlStringWriter
+from xsdata.models.enums import Namespace
+from xsdata.utils import namespaces
+
+# The serializer instance of the current worker process
+worker_serializer: Any = None
+
+
+def write_many(
+    serializer: Any,
+    out: TextIOBase,
+    records: Iterable[Any],
+    qname: str,
+    ns_map: dict | None = None,
+    record_qname: str | None = None,
+    workers: int | None = None,
+    chunksize: int = 1000,
+) -> None:
+    """Serialize the records under a root element in a process pool.
+
+    The records are split in chunks, every chunk is rendered to a
+    string fragment by a worker process and the fragments are written
+    in order under the root element. The namespace prefixes are
+    resolved up front and declared once on the root element, the
+    fragments never redeclare them.
+
+    The serializer is sent once to every worker process, along with
+    its context settings, but not the context caches. The number of
+    pending chunks is bounded to twice the number of workers.
+
+    Args:
+        serializer: The serializer instance
+        out: The output text stream
+        records: An iterable of model instances or derived elements
+        qname: The root element qualified name
+        ns_map: A user defined namespace prefix-URI map
+        record_qname: Override the records qualified name
+        workers: The number of worker processes, defaults to the
+            number of processors, if one serialize in the current process
+        chunksize: The number of records sent to a worker per task
+    """
+    ns_map = root_ns_map(serializer.config, qname, ns_map)
+    chunks = iter_chunks(records, chunksize)
+    if workers == 1:
+        fragments: Iterator[str] = (
+            serialize_chunk(serializer, chunk, ns_map, record_qname) for chunk in chunks
+        )
+        write_fragments(serializer, out, fragments, qname, ns_map)
+        return
+
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        initializer=init_worker,
+        initargs=(serializer,),
+    ) as executor:
+        fragments = map_chunks(
+            executor,
+            chunks,
+            ns_map,
+            record_qname,
+            (workers or cpu_count() or 1) * 2,
+        )
+        write_fragments(serializer, out, fragments, qname, ns_map)
+
+
+def root_ns_map(config: Any, qname: str, ns_map: dict | None) -> dict:
+    """Build the namespace prefix-URI map of the root element.
+
+    The map includes the prefixes the writer would add for the root
+    element and its schema location attributes, in the same order.
+
+    Args:
+        config: The serializer config instance
+        qname: The root element qualified name
+        ns_map: A user defined namespace prefix-URI map
+
+    Returns:
+        The root element namespace prefix-URI map.
+    """
+    result = namespaces.clean_prefixes(ns_map) if ns_map else {}
+    uri = namespaces.split_qname(qname)[0]
+    if not uri:
+        if result.get(None):
+            result[None] = ""
+    elif not namespaces.prefix_exists(uri, result):
+        namespaces.generate_prefix(uri, result)
+
+    if config.schema_location or config.no_namespace_schema_location:
+        if not namespaces.prefix_exists(Namespace.XSI.uri, result):
+            namespaces.generate_prefix(Namespace.XSI.uri, result)
+
+    return result
+
+
+def iter_chunks(records: Iterable[Any], size: int) -> Iterator[list[Any]]:
+    """Split the records in lists of the given size."""
+    records = iter(records)
+    while chunk := list(islice(records, size)):
+        yield chunk
+
+
+def map_chunks(
+    executor: ProcessPoolExecutor,
+    chunks: Iterator[list[Any]],
+    ns_map: dict,
+    record_qname: str | None,
+    limit: int,
+) -> Iterator[str]:
+    """Submit the chunks to the executor and yield the fragments in order.
+
+    Args:
+        executor: The process pool executor
+        chunks: An iterator of record lists
+        ns_map: The root element namespace prefix-URI map
+        record_qname: Override the records qualified name
+        limit: The max number of pending chunks
+
+    Yields:
+        The rendered fragments in the same order as the chunks.
+    """
+    pending: deque[Future] = deque()
+    for chunk in chunks:
+        pending.append(
+            executor.submit(serialize_worker_chunk, chunk, ns_map, record_qname)
+        )
+        if len(pending) >= limit:
+            yield pending.popleft().result()
+
+    while pending:
+        yield pending.popleft().result()
+
+
+def write_fragments(
+    serializer: Any,
+    out: TextIOBase,
+    fragments: Iterator[str],
+    qname: str,
+    ns_map: dict,
+) -> None:
+    """Write the rendered fragments under the root element.
+
+    Args:
+        serializer: The serializer instance
+        out: The output text stream
+        fragments: An iterator of rendered fragments
+        qname: The root element qualified name
+        ns_map: The root element namespace prefix-URI map
+    """
+    writer = XmlStringWriter(config=serializer.config, output=out, ns_map=ns_map)
+    writer.write(generate_fragments(fragments, qname))
+
+
+def generate_fragments(fragments: Iterable[str], qname: str) -> EventIterator:
+    """Convert the rendered fragments under a root element to sax events."""
+    yield XmlWriterEvent.START, qname
+
+    for fragment in fragments:
+        yield XmlWriterEvent.FRAGMENT, fragment
+
+    yield XmlWriterEvent.END, qname
+
+
+def init_worker(serializer: Any) -> None:
+    """Store the serializer instance of the new worker process."""
+    global worker_serializer
+    worker_serializer = serializer
+
+
+def serialize_worker_chunk(
+    records: list[Any],
+    ns_map: dict,
+    record_qname: str | None,
+) -> str:
+    """Render the chunk with the serializer of the current worker process."""
+    return serialize_chunk(worker_serializer, records, ns_map, record_qname)
+
+
+def serialize_chunk(
+    serializer: Any,
+    records: list[Any],
+    ns_map: dict,
+    record_qname: str | None,
+) -> str:
+    """Render the records to a fragment of the root element content.
+
+    Args:
+        serializer: The serializer instance
+        records: The list of model instances or derived elements
+        ns_map: The root element namespace prefix-URI map
+        record_qname: Override the records qualified name
+
+    Returns:
+        The rendered fragment string.
+    """
+    output = StringIO()
+    writer = XmlStringWriter(config=serializer.config, output=output, ns_map=ns_map)
+    writer.write_fragment(serializer.generate_fragment(records, record_qname))
+    return output.getvalue()
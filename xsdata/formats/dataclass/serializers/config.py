@@ -18,6 +18,8 @@ class SerializerConfig:
         ignore_default_attributes: Ignore optional attributes with default values
         schema_location: xsi:schemaLocation attribute value
         no_namespace_schema_location: xsi:noNamespaceSchemaLocation attribute value
+        declare_namespaces: Collect and declare all the namespace prefixes
+            on the root element
         globalns: Dictionary containing global variables to extend or
             overwrite for typing
     """
@@ -29,6 +31,7 @@ class SerializerConfig:
     ignore_default_attributes: bool = False
     schema_location: str | None = None
     no_namespace_schema_location: str | None = None
+    declare_namespaces: bool = False
     globalns: dict[str, Callable] | None = None
 
     # Deprecated
@@ -4,6 +4,7 @@ from enum import Enum
 from typing import Any
 
 from xsdata.formats.converter import converter
+from xsdata.formats.dataclass.arrays import ArrayFactory
 from xsdata.formats.dataclass.context import XmlContext
 from xsdata.formats.dataclass.models.elements import XmlVar
 from xsdata.formats.dataclass.serializers.config import SerializerConfig
@@ -82,6 +83,9 @@ class DictEncoder:
         if isinstance(value, Enum):
             return self.encode(value.value, var, wrapped)
 
+        if isinstance(var.tokens_factory, ArrayFactory):
+            return ArrayFactory.tolist(value)
+
         return converter.serialize(value, format=var.format)
 
     def next_value(self, obj: Any) -> Iterator[tuple[str, Any]]:
@@ -1,6 +1,6 @@
 import abc
 from abc import ABC
-from collections.abc import Iterable, Iterator
+from collections.abc import Callable, Iterable, Iterator
 from dataclasses import dataclass, field
 from enum import Enum
 from io import TextIOBase
@@ -15,6 +15,8 @@ from xml.sax.handler import ContentHandler
 
 from xsdata.exceptions import SerializerError, XmlWriterError
 from xsdata.formats.converter import converter
+from xsdata.formats.dataclass.arrays import ArrayFactory
+from xsdata.formats.dataclass.compat import ClassType
 from xsdata.formats.dataclass.context import XmlContext
 from xsdata.formats.dataclass.models.elements import XmlMeta, XmlVar
 from xsdata.formats.dataclass.serializers.config import SerializerConfig
@@ -26,6 +28,15 @@ from xsdata.utils.namespaces import generate_prefix, prefix_exists, split_qname
 XSI_NIL = (Namespace.XSI.uri, "nil")
 
 
+class ElementKind:
+    """The element var kinds of the compiled serializers."""
+
+    TEXT: Final = "text"
+    PRIMITIVE: Final = "primitive"
+    MODEL: Final = "model"
+    GENERIC: Final = "generic"
+
+
 class XmlWriterEvent:
     """Event names."""
 
@@ -33,14 +44,16 @@ class XmlWriterEvent:
     ATTR: Final = "attr"
     DATA: Final = "data"
     END: Final = "end"
+    FRAGMENT: Final = "fragment"
 
 
 StartEvent: TypeAlias = tuple[Literal["start"], str]
 AttrEvent: TypeAlias = tuple[Literal["attr"], str, Any]
 DataEvent: TypeAlias = tuple[Literal["data"], str]
 EndEvent: TypeAlias = tuple[Literal["end"], str]
+FragmentEvent: TypeAlias = tuple[Literal["fragment"], str]
 
-EventIterator = Iterator[StartEvent | AttrEvent | DataEvent | EndEvent]
+EventIterator = Iterator[StartEvent | AttrEvent | DataEvent | EndEvent | FragmentEvent]
 
 
 class EventHandler(abc.ABC):
@@ -111,6 +124,18 @@ class EventHandler(abc.ABC):
                 root=True,
             )
 
+        self.write_events(events)
+        self.end_document()
+
+    def write_events(self, events: EventIterator) -> None:
+        """Dispatch the sax events to their notification receivers.
+
+        Args:
+            events: An iterator of sax events
+
+        Raises:
+            XmlWriterError: On unknown events.
+        """
         for name, *args in events:
             if name == XmlWriterEvent.START:
                 self.start_tag(*args)
@@ -123,8 +148,6 @@ class EventHandler(abc.ABC):
             else:
                 raise XmlWriterError(f"Unhandled event: `{name}`")
 
-        self.end_document()
-
     def start_tag(self, qname: str) -> None:
         """Start tag notification receiver.
 
@@ -534,7 +557,7 @@ class EventGenerator:
             nillable: Specifies whether the field is nillable
             xsi_type: Override the field xsi type
 
-        Yields:
+        Returns:
             An iterator of sax events.
         """
         meta = self.context.build(
@@ -542,27 +565,204 @@ class EventGenerator:
             namespace,
             globalns=self.config.globalns,
         )
-        qname = qname or meta.qname
-        nillable = nillable or meta.nillable
-        namespace, _tag = namespaces.split_qname(qname)
+        serializer = self.context.compile_serializer(meta)
+        return serializer(
+            self, obj, qname or meta.qname, nillable or meta.nillable, xsi_type
+        )
 
-        yield XmlWriterEvent.START, qname
+    @classmethod
+    def compile_dataclass(cls, meta: XmlMeta, class_type: ClassType) -> Callable:
+        """Compile the serializer function of a model class.
 
-        for key, value in self.next_attribute(
-            obj, meta, nillable, xsi_type, self.config.ignore_default_attributes
-        ):
-            yield XmlWriterEvent.ATTR, key, value
+        The function walks the attribute and element vars in their
+        fixed order, with the field values encoders bound per var.
+        The simple and model element values, that match exactly
+        the var types, are converted inline, the rest of the values
+        like wildcards, compound fields, mixed content, tokens or
+        derived types go through the generic converters.
 
-        for var, value in self.next_value(obj, meta):
-            if var.wrapper_qname:
-                yield XmlWriterEvent.START, var.wrapper_qname
+        The classes with sequential fields are rendered in
+        parallel order by the generic next value generator.
 
-            yield from self.convert_value(value, var, namespace)
+        Args:
+            meta: The model metadata instance
+            class_type: The models class type
+
+        Returns:
+            A generator function with the generator, model instance,
+            qualified name, nillable and xsi type arguments, that
+            yields the sax events of the model instance.
+        """
+        start = XmlWriterEvent.START
+        attr = XmlWriterEvent.ATTR
+        data = XmlWriterEvent.DATA
+        end = XmlWriterEvent.END
+        is_array = collections.is_array
+
+        attributes = tuple(
+            (var, var.name, var.qname, var.is_attribute, cls.primitive_encoder(var))
+            for var in meta.get_attribute_vars()
+        )
+        element_vars = meta.get_element_vars()
+        sequential = any(var.sequence is not None for var in element_vars)
+        elements = tuple(
+            (
+                var,
+                var.name,
+                var.qname,
+                var.wrapper_qname,
+                cls.element_kind(var, class_type),
+                cls.primitive_encoder(var),
+            )
+            for var in element_vars
+        )
+
+        def serialize(
+            generator: EventGenerator,
+            obj: Any,
+            qname: str,
+            nillable: bool,
+            xsi_type: str | None,
+        ) -> EventIterator:
+            namespace = namespaces.split_qname(qname)[0]
+            ignore_optionals = generator.config.ignore_default_attributes
+
+            yield start, qname
+
+            for var, name, key, is_attribute, encode in attributes:
+                if is_attribute:
+                    value = getattr(obj, name)
+                    if (
+                        value is None
+                        or (is_array(value) and not value)
+                        or (ignore_optionals and var.is_optional(value))
+                    ):
+                        continue
+
+                    yield attr, key, encode(value)
+                else:
+                    for any_key, any_value in getattr(obj, name, EMPTY_MAP).items():
+                        yield attr, any_key, any_value
+
+            if xsi_type:
+                yield attr, QNames.XSI_TYPE, QName(xsi_type)
+
+            if nillable:
+                yield attr, QNames.XSI_NIL, "true"
+
+            if sequential:
+                for var, value in generator.next_value(obj, meta):
+                    if var.wrapper_qname:
+                        yield start, var.wrapper_qname
+
+                    yield from generator.convert_value(value, var, namespace)
+
+                    if var.wrapper_qname:
+                        yield end, var.wrapper_qname
+
+                yield end, qname
+                return
+
+            for var, name, key, wrapper_qname, kind, encode in elements:
+                value = getattr(obj, name)
+                if value is None and not var.nillable:
+                    continue
+
+                if wrapper_qname:
+                    yield start, wrapper_qname
+
+                if kind is ElementKind.TEXT:
+                    yield data, encode(value)
+                elif kind is ElementKind.GENERIC:
+                    yield from generator.convert_value(value, var, namespace)
+                else:
+                    values = value if var.list_element and is_array(value) else (value,)
+                    for val in values:
+                        if val.__class__ not in var.types:
+                            yield from generator.convert_value(val, var, namespace)
+                        elif kind is ElementKind.PRIMITIVE:
+                            yield start, key
+                            if var.nillable and not val:
+                                yield attr, QNames.XSI_NIL, "true"
+
+                            yield data, encode(val)
+                            yield end, key
+                        else:
+                            yield from generator.convert_dataclass(
+                                val, namespace, key, var.nillable
+                            )
+
+                if wrapper_qname:
+                    yield end, wrapper_qname
+
+            yield end, qname
+
+        return serialize
+
+    @classmethod
+    def element_kind(cls, var: XmlVar, class_type: ClassType) -> str:
+        """Return how the compiled serializers convert the var values.
+
+        Args:
+            var: The field metadata instance
+            class_type: The models class type
+
+        Returns:
+            One of the element kind values.
+        """
+        if var.mixed:
+            return ElementKind.GENERIC
+
+        if var.is_text:
+            return ElementKind.TEXT
+
+        if not var.is_element or var.tokens or var.any_type:
+            return ElementKind.GENERIC
+
+        generics = (class_type.any_element, class_type.derived_element)
+        if any(issubclass(tp, generics) for tp in var.types):
+            return ElementKind.GENERIC
+
+        models = [class_type.is_model(tp) for tp in var.types]
+        if all(models):
+            return ElementKind.MODEL
+
+        if not any(models):
+            return ElementKind.PRIMITIVE
+
+        return ElementKind.GENERIC
+
+    @classmethod
+    def primitive_encoder(cls, var: XmlVar) -> Callable[[Any], Any]:
+        """Return the encoder of the simple values of the var.
+
+        The values that match exactly one of the var simple types
+        are serialized directly by their converter, everything
+        else goes through the generic primitive encoder.
 
-            if var.wrapper_qname:
-                yield XmlWriterEvent.END, var.wrapper_qname
+        Args:
+            var: The field metadata instance
+
+        Returns:
+            A callable that encodes the values of the var.
+        """
+        format = var.format
+        simple_types = frozenset(
+            tp
+            for tp in var.types
+            if not issubclass(tp, (Enum, QName)) and not var.tokens
+        )
+
+        def encode(value: Any) -> Any:
+            if value.__class__ is str:
+                return value
+
+            if value.__class__ in simple_types:
+                return converter.value_converter(value).serialize(value, format=format)
 
-        yield XmlWriterEvent.END, qname
+            return cls.encode_primitive(value, var)
+
+        return encode
 
     def convert_xsi_type(
         self,
@@ -663,6 +863,9 @@ class EventGenerator:
         Yields:
             An iterator of sax events.
         """
+        if isinstance(var.tokens_factory, ArrayFactory):
+            value = ArrayFactory.tolist(value)
+
         if value or var.nillable:
             if value and collections.is_array(value[0]):
                 for val in value:
@@ -714,21 +917,22 @@ class EventGenerator:
             yield from self.convert_data(value, var)
 
     def convert_derived_element(
-        self, value: Any, namespace: str | None
+        self, value: Any, namespace: str | None, qname: str | None = None
     ) -> EventIterator:
         """Convert a derived element instance to sax events.
 
         Args:
             value: A list instance of mixed type values
             namespace: The class namespace
+            qname: Override the element qualified name
 
         Yields:
             An iterator of sax events.
         """
+        qname = qname or value.qname
         if self.context.class_type.is_model(value.value):
             meta = self.context.fetch(value.value.__class__)
-            qname = value.qname
-            xsi_type = self.real_xsi_type(qname, meta.target_qname)
+            xsi_type = self.real_xsi_type(value.qname, meta.target_qname)
 
             yield from self.convert_dataclass(
                 value.value, namespace, qname=qname, xsi_type=xsi_type
@@ -736,10 +940,10 @@ class EventGenerator:
         else:
             datatype = DataType.from_value(value.value)
 
-            yield XmlWriterEvent.START, value.qname
+            yield XmlWriterEvent.START, qname
             yield XmlWriterEvent.ATTR, QNames.XSI_TYPE, QName(str(datatype))
             yield XmlWriterEvent.DATA, value.value
-            yield XmlWriterEvent.END, value.qname
+            yield XmlWriterEvent.END, qname
 
     def convert_any_element(
         self, value: Any, var: XmlVar, namespace: str | None
@@ -1009,7 +1213,8 @@ class EventGenerator:
         Converts values to strings. QName instances is an exception,
         those values need to wait until the XmlWriter assigns prefixes
         to namespaces per element node. Enums and Tokens may contain
-        QName(s) so they also get a special treatment.
+        QName(s) so they also get a special treatment, the rest of the
+        homogeneous tokens are converted in bulk by their converter.
 
         We can't do all the conversions in the writer because we would
         need to carry the xml vars inside the writer. Instead of that we
@@ -1027,11 +1232,18 @@ class EventGenerator:
             return value
 
         if collections.is_array(value):
+            instance = converter.tokens_converter(value)
+            if instance and not isinstance(value[0], (QName, Enum)):
+                return instance.serialize_tokens(value, format=var.format)
+
             return [cls.encode_primitive(v, var) for v in value]
 
         if isinstance(value, Enum):
             return cls.encode_primitive(value.value, var)
 
+        if isinstance(var.tokens_factory, ArrayFactory):
+            return cls.encode_primitive(ArrayFactory.tolist(value), var)
+
         return converter.serialize(value, format=var.format)
 
     @classmethod
@@ -1047,3 +1259,265 @@ class EventGenerator:
             return the target qname.
         """
         return target_qname if target_qname != qname else None
+
+    def collect_namespaces(self, obj: Any) -> list[str]:
+        """Collect the namespaces of the elements and attributes of an object.
+
+        Args:
+            obj: A user model, or derived element instance
+
+        Returns:
+            The namespace URIs in document order.
+        """
+        return NamespaceCollector(self.context, self.config).collect(obj)
+
+
+class NamespaceCollector:
+    """Collect the namespaces of an object graph, ahead of serialization.
+
+    The pre-pass follows the field metadata, the simple fields are
+    grouped by namespace and checked only for their presence, until
+    their namespace is collected. The model, wildcard and qualified
+    name values are scanned recursively. The namespaces that are only
+    known by the writer are still declared where they are used.
+
+    Args:
+        context: The models context instance
+        config: The serializer config instance
+
+    Attributes:
+        uris: The collected namespace URIs
+        plans: The collection plan per model class
+    """
+
+    __slots__ = ("config", "context", "plans", "uris")
+
+    def __init__(self, context: XmlContext, config: SerializerConfig):
+        """Initialize the collector."""
+        self.context = context
+        self.config = config
+        self.uris: dict[str | None, None] = {}
+        self.plans: dict[type, tuple] = {}
+
+    def collect(self, obj: Any) -> list[str]:
+        """Collect the namespaces of a model, or derived element instance.
+
+        Args:
+            obj: A user model, or derived element instance
+
+        Returns:
+            The namespace URIs in document order.
+        """
+        if isinstance(obj, self.context.class_type.derived_element):
+            self.collect_derived_element(obj)
+        else:
+            meta = self.build(obj)
+            self.add(meta.qname)
+            self.collect_dataclass(obj)
+
+        return [uri for uri in self.uris if uri]
+
+    def add(self, qname: str) -> None:
+        """Add the namespace of the qualified name."""
+        self.uris[namespaces.target_uri(qname)] = None
+
+    def build(self, obj: Any) -> XmlMeta:
+        """Build the metadata of the model instance class."""
+        return self.context.build(obj.__class__, globalns=self.config.globalns)
+
+    def plan(self, obj: Any) -> tuple:
+        """Return the collection plan of the model instance class.
+
+        The plan includes the simple field names grouped by namespace,
+        the fields without a namespace are skipped, and the fields
+        that need to be scanned, with their namespace.
+
+        Args:
+            obj: A model instance
+
+        Returns:
+            A tuple of the simple field groups and the scanned fields.
+        """
+        clazz = obj.__class__
+        plan = self.plans.get(clazz)
+        if plan is None:
+            meta = self.build(obj)
+            groups: dict[str, list[str]] = {}
+            scanned = []
+            for var in meta.get_all_vars():
+                uri = namespaces.target_uri(var.qname)
+                if self.is_simple(var):
+                    if uri:
+                        groups.setdefault(uri, []).append(var.name)
+                elif not var.is_text or not self.is_simple_type(var):
+                    scanned.append((var, uri))
+
+            plan = self.plans[clazz] = (list(groups.items()), scanned)
+
+        return plan
+
+    @classmethod
+    def is_simple(cls, var: XmlVar) -> bool:
+        """Return whether the field namespace depends only on its presence."""
+        if var.is_attribute:
+            return cls.is_simple_type(var)
+
+        return (
+            var.is_element
+            and not var.clazz
+            and not var.any_type
+            and not var.nillable
+            and not var.mixed
+            and cls.is_simple_type(var)
+        )
+
+    @classmethod
+    def is_simple_type(cls, var: XmlVar) -> bool:
+        """Return whether the field values can't contain qualified names."""
+        return not any(issubclass(tp, (QName, Enum)) for tp in var.types)
+
+    def collect_dataclass(self, obj: Any) -> None:
+        """Collect the namespaces of a model instance fields.
+
+        Args:
+            obj: A model instance
+        """
+        uris = self.uris
+        groups, scanned = self.plan(obj)
+        for uri, names in groups:
+            if uri not in uris:
+                for name in names:
+                    value = getattr(obj, name)
+                    if value is not None and not (
+                        isinstance(value, list) and not value
+                    ):
+                        uris[uri] = None
+                        break
+
+        for var, uri in scanned:
+            value = getattr(obj, var.name)
+            if var.is_attribute:
+                if value is not None:
+                    uris[uri] = None
+                    self.collect_data(value)
+            elif var.is_attributes:
+                for key, val in value.items():
+                    self.add(key)
+                    self.collect_data(val)
+            elif var.tokens or not collections.is_array(value):
+                self.collect_value(value, var, uri)
+            else:
+                for val in value:
+                    self.collect_value(val, var, uri)
+
+    def collect_value(self, value: Any, var: XmlVar, uri: str | None) -> None:
+        """Collect the namespaces of an element field value.
+
+        Args:
+            value: The field value
+            var: The field metadata instance
+            uri: The field namespace URI
+        """
+        class_type = self.context.class_type
+        if isinstance(var.tokens_factory, ArrayFactory):
+            value = ArrayFactory.tolist(value)
+
+        if value is None or (var.tokens and not value):
+            if var.nillable:
+                self.uris[uri] = None
+                self.add(QNames.XSI_NIL)
+        elif var.is_text:
+            self.collect_data(value)
+        elif var.is_element and value.__class__ in var.types and var.clazz:
+            self.uris[uri] = None
+            self.collect_dataclass(value)
+        elif isinstance(value, class_type.any_element):
+            self.collect_any_element(value, var)
+        elif isinstance(value, class_type.derived_element):
+            self.collect_derived_element(value)
+        elif class_type.is_model(value):
+            self.collect_model(value, var)
+        else:
+            if var.is_elements:
+                var = var.find_value_choice(value, False) or var
+
+            if var.is_element:
+                self.add(var.qname)
+                if var.any_type and not isinstance(value, str):
+                    self.add(QNames.XSI_TYPE)
+                    self.add(str(DataType.from_value(value)))
+
+            self.collect_data(value)
+
+    def collect_model(self, value: Any, var: XmlVar) -> None:
+        """Collect the namespaces of a model value.
+
+        Args:
+            value: A model instance
+            var: The field metadata instance
+        """
+        meta = self.build(value)
+        choice = var if var.is_element else var.find_value_choice(value, True)
+        if choice:
+            self.add(choice.qname)
+            if value.__class__ not in choice.types and (
+                choice.qname != meta.target_qname
+            ):
+                self.add(QNames.XSI_TYPE)
+                self.add(meta.target_qname)
+        elif var.is_elements:
+            self.add(meta.target_qname)
+        else:
+            self.add(meta.qname)
+
+        self.collect_dataclass(value)
+
+    def collect_derived_element(self, value: Any) -> None:
+        """Collect the namespaces of a derived element.
+
+        Args:
+            value: A derived element instance
+        """
+        self.add(value.qname)
+        if self.context.class_type.is_model(value.value):
+            meta = self.build(value.value)
+            if meta.target_qname != value.qname:
+                self.add(QNames.XSI_TYPE)
+                self.add(meta.target_qname)
+
+            self.collect_dataclass(value.value)
+        else:
+            self.add(QNames.XSI_TYPE)
+            self.add(str(DataType.from_value(value.value)))
+
+    def collect_any_element(self, value: Any, var: XmlVar) -> None:
+        """Collect the namespaces of a generic any element.
+
+        Args:
+            value: A generic any element instance
+            var: The field metadata instance
+        """
+        if value.qname:
+            self.add(value.qname)
+
+        for key, val in value.attributes.items():
+            self.add(key)
+            self.collect_data(val)
+
+        self.collect_data(value.text)
+        for child in value.children:
+            self.collect_value(child, var, None)
+
+    def collect_data(self, value: Any) -> None:
+        """Collect the namespaces of text and token values.
+
+        Args:
+            value: A simple type value
+        """
+        if isinstance(value, QName):
+            self.add(value.text)
+        elif isinstance(value, Enum):
+            self.collect_data(value.value)
+        elif isinstance(value, (list, tuple)):
+            for val in value:
+                self.collect_data(val)
@@ -2,6 +2,7 @@ from xsdata.formats.dataclass.serializers.mixins import XmlWriter
 from xsdata.formats.dataclass.serializers.writers.native import (
     XmlEventWriter,
 )
+from xsdata.formats.dataclass.serializers.writers.string import XmlStringWriter
 
 try:
     from xsdata.formats.dataclass.serializers.writers.lxml import LxmlEventWriter
@@ -15,4 +16,5 @@ __all__ = [
     "DEFAULT_XML_WRITER",
     "LxmlEventWriter",
     "XmlEventWriter",
+    "XmlStringWriter",
 ]
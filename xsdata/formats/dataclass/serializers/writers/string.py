@@ -0,0 +1,460 @@
+from io import TextIOBase
+from typing import Any
+from xml.sax.handler import ContentHandler
+from xml.sax.saxutils import quoteattr
+
+from xsdata.exceptions import XmlWriterError
+from xsdata.formats.converter import converter
+from xsdata.formats.dataclass.serializers.config import SerializerConfig
+from xsdata.formats.dataclass.serializers.mixins import (
+    XSI_NIL,
+    EventIterator,
+    XmlWriter,
+    XmlWriterEvent,
+)
+from xsdata.models.enums import Namespace
+from xsdata.utils.constants import EMPTY_MAP
+from xsdata.utils.namespaces import generate_prefix, prefix_exists, split_qname
+
+
+class XmlStringWriter(XmlWriter):
+    """Xml event writer that renders the output directly to strings.
+
+    The writer skips the sax content handler layer, the elements are
+    appended to a list of string chunks, that is written to the output
+    stream when it exceeds the flush size and at the end of the document.
+    The rendered tag and attribute names are cached per namespace context
+    and the namespace prefix-URI maps are only copied when an element
+    declares new prefixes.
+
+    The output is identical to the `XmlEventWriter` output.
+
+    Args:
+        config: The serializer config instance
+        output: The output stream to write the result
+        ns_map: A user defined namespace prefix-URI map
+
+    Attributes:
+        flush_size: The number of chunks that triggers a write
+        chunks: The rendered output chunks
+        contexts: The URI-prefix maps and the rendered names per element
+        declared: The namespace prefix-URI pairs of the pending element
+        pending_start: Specifies whether the last start tag is still open
+        current_level: The current element depth, for pretty printing
+        pending_end_element: Specifies whether an element just ended
+        in_tail: Specifies whether the text content has been written
+        tail: The current element tail content
+        attrs: The current element attributes
+        ns_context: The namespace context queue
+        pending_tag: The pending element namespace, name tuple
+    """
+
+    flush_size = 1024
+
+    __slots__ = (
+        "chunks",
+        "contexts",
+        "current_level",
+        "declared",
+        "pending_end_element",
+        "pending_start",
+    )
+
+    def __init__(self, config: SerializerConfig, output: TextIOBase, ns_map: dict):
+        """Initialize the writer."""
+        super().__init__(config, output, dict(ns_map))
+
+        self.chunks: list[str] = []
+        self.contexts: list[tuple[dict, dict, dict]] = [({}, {}, {})]
+        self.declared: list[tuple] = []
+        self.pending_start = False
+        self.current_level = 0
+        self.pending_end_element = False
+
+    def build_handler(self) -> ContentHandler:
+        """Build the content handler instance.
+
+        The writer renders the events itself, the
+        content handler is never called.
+
+        Returns:
+            An empty content handler instance.
+        """
+        return ContentHandler()
+
+    def write_events(self, events: EventIterator) -> None:
+        """Dispatch the sax events to their notification receivers.
+
+        The events are unpacked by their known size, the
+        receivers are bound once for the whole document.
+
+        Args:
+            events: An iterator of sax events
+
+        Raises:
+            XmlWriterError: On unknown events.
+        """
+        start_tag = self.start_tag
+        end_tag = self.end_tag
+        add_attribute = self.add_attribute
+        set_data = self.set_data
+
+        for event in events:
+            name = event[0]
+            if name == XmlWriterEvent.START:
+                start_tag(event[1])
+            elif name == XmlWriterEvent.END:
+                end_tag(event[1])
+            elif name == XmlWriterEvent.ATTR:
+                add_attribute(event[1], event[2])
+            elif name == XmlWriterEvent.DATA:
+                set_data(event[1])
+            elif name == XmlWriterEvent.FRAGMENT:
+                self.add_fragment(event[1])
+            else:
+                raise XmlWriterError(f"Unhandled event: `{name}`")
+
+    def write_fragment(self, events: EventIterator) -> None:
+        """Write the events of a root element content fragment.
+
+        The fragment has no xml declaration and the elements
+        don't redeclare the namespace prefixes of the ns_map,
+        the root element of the final document declares them.
+
+        Args:
+            events: An iterator of sax events
+
+        Raises:
+            XmlWriterError: On unknown events.
+        """
+        self.ns_context.append(self.ns_map)
+        self.contexts.append(
+            ({uri: prefix for prefix, uri in self.ns_map.items()}, {}, {})
+        )
+        if self.config.indent:
+            self.current_level = 1
+
+        self.write_events(events)
+        self.flush_chunks()
+        self.contexts.pop()
+        self.ns_context.pop()
+
+    def add_fragment(self, fragment: str) -> None:
+        """Fragment notification receiver.
+
+        Write the rendered content fragment of the current element,
+        the fragment elements are flushed to the output stream.
+
+        Args:
+            fragment: The rendered content fragment
+        """
+        self.flush_start(False)
+        self.write_whitespace(fragment)
+        self.flush_chunks()
+
+        if self.config.indent:
+            self.pending_end_element = True
+
+    def end_document(self) -> None:
+        """End document notification receiver.
+
+        Write the remaining chunks to the output stream.
+        """
+        self.flush_chunks()
+
+    def flush_chunks(self) -> None:
+        """Write the rendered chunks to the output stream."""
+        self.output.write("".join(self.chunks))
+        self.chunks.clear()
+
+    def start_tag(self, qname: str) -> None:
+        """Start tag notification receiver.
+
+        The receiver will flush the start of any pending element and
+        queue the current tag for generation. The element shares the
+        parent namespace prefix-URI map, until it needs to add a prefix.
+
+        The receiver will also write the necessary whitespace if
+        pretty print is enabled.
+
+        Args:
+            qname: The qualified name of the starting element
+        """
+        self.flush_start(False)
+
+        self.ns_context.append(self.ns_map)
+        self.pending_tag = split_qname(qname)
+        self.add_namespace(self.pending_tag[0])
+
+        if self.config.indent:
+            if self.current_level:
+                self.write_whitespace(f"\n{self.config.indent * self.current_level}")
+
+            self.current_level += 1
+            self.pending_end_element = False
+
+    def end_tag(self, qname: str) -> None:
+        """End tag notification receiver.
+
+        The receiver will flush if pending the start of the element,
+        end the element, its tail content and its namespace context.
+
+        The receiver will also write the necessary whitespace if
+        pretty print is enabled.
+
+        Args:
+            qname: The qualified name of the element
+        """
+        indent = self.config.indent
+        if indent:
+            self.current_level -= 1
+            if self.pending_end_element:
+                self.write_whitespace(f"\n{indent * self.current_level}")
+
+        self.flush_start(True)
+        self.end_element(split_qname(qname), qname)
+
+        if self.tail:
+            self.set_characters(self.tail)
+
+        self.tail = None
+        self.in_tail = False
+        self.contexts.pop()
+        self.ns_context.pop()
+        if self.ns_context:
+            self.ns_map = self.ns_context[-1]
+
+        if indent:
+            self.pending_end_element = True
+            if not self.current_level:
+                self.write_whitespace("\n")
+
+        if len(self.chunks) > self.flush_size:
+            self.flush_chunks()
+
+    def flush_start(self, is_nil: bool = True) -> None:
+        """Flush start notification receiver.
+
+        The receiver will pop the xsi:nil attribute if the element is
+        not empty, prepare the namespace prefixes and render the element
+        with its attributes.
+
+        Args:
+            is_nil: Specify if the element requires `xsi:nil="true"`
+                when content is empty
+        """
+        pending_tag = self.pending_tag
+        if not pending_tag:
+            return
+
+        attrs = self.attrs
+        if attrs:
+            if not is_nil:
+                attrs.pop(XSI_NIL, None)
+
+            for name in attrs:
+                self.add_namespace(name[0])
+
+            self.attrs = {}
+
+        self.reset_default_namespace()
+        self.start_namespaces()
+        self.start_element(pending_tag, "", attrs)
+        self.in_tail = False
+        self.pending_tag = None
+
+    def add_namespace(self, uri: str | None) -> None:
+        """Add the given uri to the current namespace context.
+
+         If the uri empty or a prefix already exists, skip silently.
+
+        Args:
+            uri: The namespace URI
+        """
+        if uri and not prefix_exists(uri, self.ns_map):
+            generate_prefix(uri, self.own_ns_map())
+
+    def own_ns_map(self) -> dict:
+        """Copy the shared namespace prefix-URI map of the current element.
+
+        Returns:
+            The namespace prefix-URI map the current element can modify.
+        """
+        ns_context = self.ns_context
+        if len(ns_context) > 1 and ns_context[-1] is ns_context[-2]:
+            self.ns_map = ns_context[-1] = dict(self.ns_map)
+
+        return self.ns_map
+
+    def reset_default_namespace(self) -> None:
+        """Reset the default namespace if the pending element is not qualified."""
+        if self.pending_tag and not self.pending_tag[0] and self.ns_map.get(None):
+            self.own_ns_map()[None] = ""
+
+    def encode_data(self, data: Any) -> str | None:
+        """Encode data for xml rendering.
+
+        The qualified name converters might add prefixes
+        to the namespace prefix-URI map.
+
+        Args:
+            data: The content to encode/serialize
+
+        Returns:
+            The xml encoded data
+        """
+        if data is None or isinstance(data, str):
+            return data
+
+        if isinstance(data, list) and not data:
+            return None
+
+        return converter.serialize(data, ns_map=self.own_ns_map())
+
+    def start_namespaces(self) -> None:
+        """Collect the new namespace prefixes of the pending element.
+
+        The elements that don't declare any prefixes share the
+        parent URI-prefix map and the rendered names.
+        """
+        ns_context = self.ns_context
+        parent_ns_map = ns_context[-2] if len(ns_context) > 1 else EMPTY_MAP
+        context = self.contexts[-1]
+
+        if self.ns_map is not parent_ns_map:
+            self.declared = [
+                (prefix, uri)
+                for prefix, uri in self.ns_map.items()
+                if parent_ns_map.get(prefix) != uri
+            ]
+            if self.declared:
+                prefixes = context[0].copy()
+                for prefix, uri in self.declared:
+                    prefixes[uri] = prefix
+
+                context = (prefixes, {}, {})
+
+        self.contexts.append(context)
+
+    def start_element(self, name: tuple[str, str], qname: str, attrs: dict) -> None:
+        """Start element notification receiver.
+
+        Render the element start tag without the closing bracket,
+        which is only known when the element content starts.
+
+        Args:
+            name: The qname as tuple
+            qname: The qualified name
+            attrs: The attributes mapping
+        """
+        chunks = self.chunks
+        if self.pending_start:
+            chunks.append(">")
+
+        _, tags, attributes = self.contexts[-1]
+        try:
+            tag = tags[name]
+        except KeyError:
+            tag = tags[name] = self.render_name(name)
+
+        chunks.append(f"<{tag}")
+
+        if self.declared:
+            for prefix, uri in self.declared:
+                if prefix:
+                    chunks.append(f' xmlns:{prefix}="{uri}"')
+                else:
+                    chunks.append(f' xmlns="{uri}"')
+
+            self.declared = []
+
+        for key, value in attrs.items():
+            try:
+                chunks.append(attributes[key])
+            except KeyError:
+                attributes[key] = f" {self.render_name(key)}="
+                chunks.append(attributes[key])
+
+            chunks.append(quoteattr(value))
+
+        self.pending_start = True
+
+    def end_element(self, name: tuple[str, str], qname: str) -> None:
+        """End element notification receiver.
+
+        Args:
+            name: The qname as tuple
+            qname: The qualified name
+        """
+        if self.pending_start:
+            self.chunks.append("/>")
+            self.pending_start = False
+        else:
+            tags = self.contexts[-1][1]
+            try:
+                tag = tags[name]
+            except KeyError:
+                tag = tags[name] = self.render_name(name)
+
+            self.chunks.append(f"</{tag}>")
+
+    def set_characters(self, data: str) -> None:
+        """Characters notification receiver.
+
+        Args:
+            data: The characters data to write
+        """
+        self.write_whitespace(
+            data.replace("&", "&amp;").replace("<", "&lt;").replace(">", "&gt;")
+        )
+
+    def write_whitespace(self, data: str) -> None:
+        """Close the pending start tag and write the given data.
+
+        Args:
+            data: The already escaped data to write
+        """
+        if self.pending_start:
+            self.chunks.append(">")
+            self.pending_start = False
+
+        self.chunks.append(data)
+
+    def render_name(self, name: tuple[str, str]) -> str:
+        """Return the prefixed name in the current namespace context.
+
+        Args:
+            name: The qname as tuple
+
+        Returns:
+            The prefixed or the local name.
+        """
+        uri, local_name = name
+        if uri:
+            if uri == Namespace.XML.uri:
+                return f"xml:{local_name}"
+
+            prefix = self.contexts[-1][0][uri]
+            if prefix:
+                return f"{prefix}:{local_name}"
+
+        return local_name
+
+    def start_prefix_mapping(self, prefix: str | None, uri: str) -> None:
+        """Start namespace prefix notification receiver.
+
+        The prefixes are collected by the start namespaces receiver.
+
+        Args:
+            prefix: The namespace prefix
+            uri: The namespace URI
+        """
+
+    def end_prefix_mapping(self, prefix: str) -> None:
+        """End namespace prefix notification receiver.
+
+        The prefixes are released with the element context.
+
+        Args:
+            prefix: The namespace prefix
+        """
@@ -1,10 +1,14 @@
+from collections.abc import Iterable
 from dataclasses import dataclass, field
 from io import StringIO, TextIOBase
 from typing import Any
 
+from xsdata.formats.dataclass.serializers.batch import write_many
 from xsdata.formats.dataclass.serializers.mixins import (
     EventGenerator,
+    EventIterator,
     XmlWriter,
+    XmlWriterEvent,
 )
 from xsdata.formats.dataclass.serializers.writers import DEFAULT_XML_WRITER
 from xsdata.utils import namespaces
@@ -39,15 +43,131 @@ class XmlSerializer(EventGenerator):
     def write(self, out: TextIOBase, obj: Any, ns_map: dict | None = None) -> None:
         """Serialize the given object to the output text stream.
 
+        If the `declare_namespaces` option is enabled, the namespaces
+        of the object are collected in a pre-pass and their prefixes
+        are declared on the root element.
+
         Args:
             out: The output text stream
             obj: The input model instance to serialize
             ns_map: A user defined namespace prefix-URI map
         """
+        ns_map = namespaces.clean_prefixes(ns_map) if ns_map else {}
+        if self.config.declare_namespaces:
+            for uri in self.collect_namespaces(obj):
+                if not namespaces.prefix_exists(uri, ns_map):
+                    namespaces.generate_prefix(uri, ns_map)
+
         events = self.generate(obj)
+        handler = self.writer(config=self.config, output=out, ns_map=ns_map)
+        handler.write(events)
+
+    def write_records(
+        self,
+        out: TextIOBase,
+        records: Iterable[Any],
+        qname: str,
+        ns_map: dict | None = None,
+        record_qname: str | None = None,
+    ) -> None:
+        """Serialize the records under a root element to the output text stream.
+
+        The records are consumed and serialized one at a time,
+        with a streaming writer the memory usage is bounded by
+        the size of a single record. The `LxmlEventWriter` builds
+        the whole document tree before writing it.
+
+        The namespace prefixes of the ns_map are declared
+        up front on the root element.
+
+        Args:
+            out: The output text stream
+            records: An iterable of model instances or derived elements
+            qname: The root element qualified name
+            ns_map: A user defined namespace prefix-URI map
+            record_qname: Override the records qualified name
+        """
+        events = self.generate_records(records, qname, record_qname)
         handler = self.writer(
             config=self.config,
             output=out,
             ns_map=namespaces.clean_prefixes(ns_map) if ns_map else {},
         )
         handler.write(events)
+
+    def write_many(
+        self,
+        out: TextIOBase,
+        records: Iterable[Any],
+        qname: str,
+        ns_map: dict | None = None,
+        record_qname: str | None = None,
+        workers: int | None = None,
+        chunksize: int = 1000,
+    ) -> None:
+        """Serialize the records under a root element in parallel with a process pool.
+
+        The records are split in chunks, every worker process renders
+        its chunks to string fragments, which are written in order under
+        the root element. The namespace prefixes are declared once on the
+        root element and the fragments never redeclare them.
+
+        The parallel output is rendered by the `XmlStringWriter`, the
+        configured writer class is ignored, the result is identical
+        to the `write_records` result of the default writer.
+
+        Args:
+            out: The output text stream
+            records: An iterable of model instances or derived elements
+            qname: The root element qualified name
+            ns_map: A user defined namespace prefix-URI map
+            record_qname: Override the records qualified name
+            workers: The number of worker processes, defaults to the
+                number of processors, if one serialize in the current process
+            chunksize: The number of records sent to a worker per task
+        """
+        write_many(self, out, records, qname, ns_map, record_qname, workers, chunksize)
+
+    def generate_records(
+        self,
+        records: Iterable[Any],
+        qname: str,
+        record_qname: str | None = None,
+    ) -> EventIterator:
+        """Convert the records under a root element to sax events.
+
+        Args:
+            records: An iterable of model instances or derived elements
+            qname: The root element qualified name
+            record_qname: Override the records qualified name
+
+        Yields:
+            An iterator of sax events.
+        """
+        yield XmlWriterEvent.START, qname
+        yield from self.generate_fragment(records, record_qname)
+        yield XmlWriterEvent.END, qname
+
+    def generate_fragment(
+        self,
+        records: Iterable[Any],
+        record_qname: str | None = None,
+    ) -> EventIterator:
+        """Convert the records to sax events, without a root element.
+
+        Args:
+            records: An iterable of model instances or derived elements
+            record_qname: Override the records qualified name, the
+                derived elements keep their xsi:type
+
+        Yields:
+            An iterator of sax events.
+        """
+        derived_element = self.context.class_type.derived_element
+        for obj in records:
+            if not record_qname:
+                yield from self.generate(obj)
+            elif isinstance(obj, derived_element):
+                yield from self.convert_derived_element(obj, None, record_qname)
+            else:
+                yield from self.convert_dataclass(obj, qname=record_qname)
@@ -3,6 +3,8 @@ from collections.abc import Callable, Iterable, Mapping, Sequence
 from types import UnionType
 from typing import Any, NamedTuple, TypeVar, Union, get_args, get_origin
 
+from xsdata.formats.dataclass.arrays import ArrayFactory, is_ndarray
+
 if (3, 9) <= sys.version_info[:2] <= (3, 10):
     # Backport this fix for python 3.9 and 3.10
     # https://github.com/python/cpython/pull/30900
@@ -85,6 +87,28 @@ def analyze_token_args(origin: Any, args: tuple[Any, ...]) -> tuple[Any]:
     raise TypeError
 
 
+def analyze_array_args(args: tuple[Any, ...]) -> ArrayFactory:
+    """Analyze numpy array arguments.
+
+    The last argument is the dtype annotation of the array items,
+    e.g. NDArray[numpy.float64].
+
+    Args:
+        args: The annotation arguments
+
+    Returns:
+        The array tokens factory instance.
+
+    Raises:
+        TypeError: If the dtype is missing or not supported.
+    """
+    dtype_args = get_args(args[-1]) if args else ()
+    if len(dtype_args) != 1:
+        raise TypeError
+
+    return ArrayFactory(dtype_args[0])
+
+
 def analyze_optional_origin(
     origin: Any, args: tuple[Any, ...], types: tuple[Any, ...]
 ) -> tuple[Any, ...]:
@@ -138,6 +162,11 @@ def evaluate_attribute(annotation: Any, tokens: bool = False) -> Result:
     if tokens:
         origin, args, types = analyze_optional_origin(origin, args, types)
 
+        if is_ndarray(origin):
+            tokens_factory = analyze_array_args(args)
+            types = (tokens_factory.type,)
+            return Result(types=types, tokens_factory=tokens_factory, optional=optional)
+
         args = analyze_token_args(origin, args)
         tokens_factory = origin
         if tokens_factory in LIST_CONTAINERS:
@@ -200,7 +229,7 @@ def evaluate_element(annotation: Any, tokens: bool = False) -> Result:
 
     origin, args, types = analyze_optional_origin(origin, args, types)
 
-    if tokens:
+    if tokens and not is_ndarray(origin):
         args = analyze_token_args(origin, args)
 
         tokens_factory = origin
@@ -208,6 +237,12 @@ def evaluate_element(annotation: Any, tokens: bool = False) -> Result:
         types = args
         args = get_args(args[0])
 
+    if tokens and is_ndarray(origin):
+        factory = tokens_factory
+        tokens_factory = analyze_array_args(args)
+        types = (tokens_factory.type,)
+        origin = None
+
     if origin in ITERABLE_TYPES:
         args = tuple(arg for arg in args if arg is not Ellipsis)
         if len(args) != 1:
@@ -221,6 +221,9 @@ class GeneratorOutput:
         unnest_classes: Move inner classes to upper level
         ignore_patterns: Ignore pattern restrictions
         include_header: Include a header with codegen information in the output
+        registry: Generate a type registry module for each package
+        numpy_arrays: Use numpy arrays for numeric xs:list fields
+        constructors: Generate the constructors of the fast class factory
     """
 
     package: str = field(default="generated", metadata={"type": "Element"})
@@ -244,6 +247,9 @@ class GeneratorOutput:
     unnest_classes: bool = field(default=False, metadata={"type": "Element"})
     ignore_patterns: bool = field(default=False, metadata={"type": "Element"})
     include_header: bool = field(default=False, metadata={"type": "Element"})
+    registry: bool = field(default=False, metadata={"type": "Element"})
+    numpy_arrays: bool = field(default=False, metadata={"type": "Element"})
+    constructors: bool = field(default=False, metadata={"type": "Element"})
 
     def __post_init__(self):
         """Post initialization method."""